@@ -1,20 +1,21 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from firebase_admin import auth
-import app.core.firebase
+from app.core.firebase import firebase_auth
+from app.core.logger import get_logger
+
+log = get_logger("auth")
 
 security = HTTPBearer()
 
 
 def verify_token(auth_credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = auth_credentials.credentials
-    print(f"[AUTH] Verifying token: {token[:10]}...")
     try:
-        decoded_token = auth.verify_id_token(token, clock_skew_seconds=10)
-        print(f"[AUTH SUCCESS] Token verified → UID={decoded_token.get('uid')}")
+        decoded_token = firebase_auth.verify_id_token(token, clock_skew_seconds=10)
+        log.debug("token verified", extra={"uid": decoded_token.get("uid")})
         return decoded_token
     except Exception as e:
-        print(f"[AUTH ERROR] Token verification failed: {str(e)}")
+        log.info("token verification failed", extra={"error": str(e)})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid or expired token: {str(e)}",
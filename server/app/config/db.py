@@ -1,28 +1,393 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.sql import functions
+from sqlalchemy.sql.expression import SelectBase
 from dotenv import load_dotenv
+import asyncio
+import contextlib
+import contextvars
+import itertools
 import os
+import threading
+import time
+from http.cookies import CookieError, SimpleCookie
+from typing import Optional
+
+from app.core.instrumentation import (
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+    track_pools,
+)
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# sync driver -> async driver used by the async engine below
+_ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def _to_async_url(url: str) -> str:
+    """Derive an async-driver URL from a sync DATABASE_URL (e.g. psycopg2 -> asyncpg)."""
+    scheme, sep, rest = url.partition("://")
+    return _ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+# override when the async URL can't be derived (e.g. different query params)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _to_async_url(DATABASE_URL)
+
+
+def _url_list(value):
+    return [u.strip() for u in (value or "").split(",") if u.strip()]
+
+
+# Read replicas (comma-separated). Empty -> everything goes to the primary.
+DATABASE_REPLICA_URLS = _url_list(os.getenv("DATABASE_REPLICA_URLS"))
+ASYNC_DATABASE_REPLICA_URLS = _url_list(os.getenv("ASYNC_DATABASE_REPLICA_URLS")) or [
+    _to_async_url(u) for u in DATABASE_REPLICA_URLS
+]
+# primary pool, per engine; admission control (app/core/admission.py) is sized to it
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+REPLICA_POOL_SIZE = int(os.getenv("REPLICA_POOL_SIZE", "5"))
+REPLICA_MAX_OVERFLOW = int(os.getenv("REPLICA_MAX_OVERFLOW", "10"))
+# every replica is probed (one connect) this often, in the background
+REPLICA_HEALTH_CHECK_SECONDS = float(os.getenv("REPLICA_HEALTH_CHECK_SECONDS", "10"))
+# a replica that failed is skipped (reads go to the primary) for this long
+REPLICA_RETRY_SECONDS = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+# after a write, that client's GETs read from the primary for this long (> replica lag)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
 engine = create_engine(
     DATABASE_URL,
+    poolclass=TimedQueuePool,  # records checkout wait (see /metrics)
     pool_pre_ping=True,  # checks if connection is alive before using it
     pool_recycle=300,  # refresh connections every 5 min
-    pool_size=5,  # number of connections in pool (tune as per load)
-    max_overflow=10,  # extra connections allowed in burst traffic
+    pool_size=DB_POOL_SIZE,  # number of connections in pool (tune as per load)
+    max_overflow=DB_MAX_OVERFLOW,  # extra connections allowed in burst traffic
+)
+
+
+# Async engine for `async def` routes: queries await I/O instead of blocking the event loop.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncQueuePool,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
 )
 
+replica_engines = [
+    create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        pool_size=REPLICA_POOL_SIZE,
+        max_overflow=REPLICA_MAX_OVERFLOW,
+    )
+    for url in DATABASE_REPLICA_URLS
+]
+async_replica_engines = [
+    create_async_engine(
+        url,
+        poolclass=TimedAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        pool_size=REPLICA_POOL_SIZE,
+        max_overflow=REPLICA_MAX_OVERFLOW,
+    )
+    for url in ASYNC_DATABASE_REPLICA_URLS
+]
+
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+for _i, _replica in enumerate(replica_engines):
+    instrument_engine(_replica, f"sync_replica{_i}")
+for _i, _replica in enumerate(async_replica_engines):
+    instrument_engine(_replica.sync_engine, f"async_replica{_i}")
+track_pools(
+    sync=engine.pool,
+    async_=async_engine.pool,
+    **{f"sync_replica{i}": e.pool for i, e in enumerate(replica_engines)},
+    **{f"async_replica{i}": e.pool for i, e in enumerate(async_replica_engines)},
+)
+
+
+# --- read/write routing ---------------------------------------------------------
+#
+# Only requests whose HTTP method is read-only (GET/HEAD/OPTIONS, see
+# ReadReplicaMiddleware) may read from a replica. Everything else (writes,
+# CLI scripts, startup) uses the primary. Within a session, the first write
+# (flush, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, raw SQL) pins the session
+# to the primary, so a request always reads its own writes. Across requests, a
+# write answers with a short-lived `last_write` cookie, and GETs carrying it read
+# from the primary for READ_YOUR_WRITES_SECONDS, so a client sees its own writes
+# despite replica lag. A session reads from one replica (picked on its first
+# read), so its reads are mutually consistent.
+# Replica health is probed by a background task (start_replica_checks), never
+# while routing a statement.
+
+_read_only_request = contextvars.ContextVar("read_only_request", default=False)
+
+
+class ReadReplicaMiddleware:
+    """
+    Mark GET/HEAD/OPTIONS requests as eligible for replica reads, unless the
+    client wrote within the last `read_your_writes_seconds` (last_write cookie).
+    """
+
+    READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+    LAST_WRITE_COOKIE = "last_write"
+
+    def __init__(self, app, read_your_writes_seconds: Optional[float] = None):
+        self.app = app
+        if read_your_writes_seconds is None:
+            # without replicas every read is on the primary already
+            configured = replica_engines or async_replica_engines
+            read_your_writes_seconds = READ_YOUR_WRITES_SECONDS if configured else 0.0
+        self.read_your_writes_seconds = read_your_writes_seconds
+
+    def _wrote_recently(self, scope) -> bool:
+        if self.read_your_writes_seconds <= 0:
+            return False
+        for name, value in scope.get("headers", ()):
+            if name != b"cookie":
+                continue
+            cookies = SimpleCookie()
+            try:
+                cookies.load(value.decode("latin-1"))
+                wrote_at = float(cookies[self.LAST_WRITE_COOKIE].value)
+            except (KeyError, ValueError, CookieError):
+                continue
+            return time.time() - wrote_at < self.read_your_writes_seconds
+        return False
+
+    def _mark_write(self, send):
+        seconds = self.read_your_writes_seconds
+        cookie = (
+            f"{self.LAST_WRITE_COOKIE}={time.time():.3f}; Max-Age={int(seconds) + 1}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        ).encode("latin-1")
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", ()), (b"set-cookie", cookie)],
+                }
+            await send(message)
+
+        return send_with_cookie
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] not in self.READ_ONLY_METHODS:
+            if self.read_your_writes_seconds > 0:
+                send = self._mark_write(send)
+            await self.app(scope, receive, send)
+            return
+        if self._wrote_recently(scope):
+            await self.app(scope, receive, send)
+            return
+        token = _read_only_request.set(True)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _read_only_request.reset(token)
+
+
+@contextlib.contextmanager
+def primary_reads():
+    """Send this context's reads to the primary, even in a read-only request."""
+    token = _read_only_request.set(False)
+    try:
+        yield
+    finally:
+        _read_only_request.reset(token)
+
+
+class ReplicaSet:
+    """Round-robin over healthy replicas; unhealthy ones are skipped for a while."""
+
+    def __init__(self, engines):
+        # as configured (sync or async), for the health probes
+        self.configured = list(engines)
+        # sync engines: what sessions bind to and what health is tracked by
+        self.engines = [getattr(e, "sync_engine", e) for e in self.configured]
+        self._rr = itertools.count()
+        self._down_until = {id(e): 0.0 for e in self.engines}
+        self._lock = threading.Lock()
+        for e in self.engines:
+            event.listen(e, "handle_error", self._on_error(e))
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    def _on_error(self, engine_):
+        def handler(ctx):
+            if ctx.is_disconnect or ctx.connection is None:
+                self.mark_down(engine_)
+
+        return handler
+
+    def mark_down(self, engine_) -> None:
+        with self._lock:
+            self._down_until[id(engine_)] = time.monotonic() + REPLICA_RETRY_SECONDS
+
+    def is_up(self, engine_) -> bool:
+        return time.monotonic() >= self._down_until.get(id(engine_), 0.0)
+
+    def check(self) -> None:
+        """Probe every sync replica with one pooled connect (blocking)."""
+        for configured, engine_ in zip(self.configured, self.engines):
+            if configured is not engine_:
+                continue  # async: see check_async
+            try:
+                engine_.connect().close()
+            except Exception:
+                self.mark_down(engine_)
+
+    async def check_async(self) -> None:
+        """Probe every async replica with one pooled connect."""
+        for configured, engine_ in zip(self.configured, self.engines):
+            if configured is engine_:
+                continue
+            try:
+                async with configured.connect():
+                    pass
+            except Exception:
+                self.mark_down(engine_)
+
+    def pick(self):
+        """A healthy replica's (sync) engine, or None to use the primary. No I/O."""
+        n = len(self.engines)
+        if not n:
+            return None
+        start = next(self._rr)
+        for i in range(n):
+            candidate = self.engines[(start + i) % n]
+            if self.is_up(candidate):
+                return candidate
+        return None
+
+    def status(self):
+        now = time.monotonic()
+        return [
+            {"replica": i, "up": now >= self._down_until[id(e)]}
+            for i, e in enumerate(self.engines)
+        ]
+
+
+replicas = ReplicaSet(replica_engines)
+async_replicas = ReplicaSet(async_replica_engines)
+
+_replica_checks = None
+
+
+async def _check_replicas_forever() -> None:
+    while True:
+        await asyncio.to_thread(replicas.check)
+        await async_replicas.check_async()
+        await asyncio.sleep(REPLICA_HEALTH_CHECK_SECONDS)
+
+
+def start_replica_checks() -> None:
+    """Start the background replica probes on the running event loop (app startup)."""
+    global _replica_checks
+    if (replica_engines or async_replica_engines) and _replica_checks is None:
+        _replica_checks = asyncio.get_running_loop().create_task(_check_replicas_forever())
+
+
+async def stop_replica_checks() -> None:
+    global _replica_checks
+    if _replica_checks is not None:
+        _replica_checks.cancel()
+        try:
+            await _replica_checks
+        except asyncio.CancelledError:
+            pass
+        _replica_checks = None
+
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    if isinstance(clause, SelectBase):
+        return getattr(clause, "_for_update_arg", None) is not None
+    # INSERT/UPDATE/DELETE, raw SQL, DDL: assume it writes
+    return True
+
+
+class RoutingSession(Session):
+    """Session that sends eligible reads to a replica and pins to the primary after a write."""
+
+    primary = engine
+    replica_set = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("pinned_to_primary"):
+            return self.primary
+        if self._flushing or _is_write(clause):
+            self.info["pinned_to_primary"] = True
+            return self.primary
+        if clause is None or not _read_only_request.get():
+            return self.primary
+        bind = self.info.get("read_bind")
+        if bind is None:
+            bind = self.info["read_bind"] = self.replica_set.pick() or self.primary
+        elif bind is not self.primary and not self.replica_set.is_up(bind):
+            # its replica went down: the primary is never behind it, so reads stay consistent
+            bind = self.info["read_bind"] = self.primary
+        return bind
+
+
+class AsyncRoutingSession(RoutingSession):
+    """sync_session_class for AsyncSession: same routing over the async engines."""
+
+    primary = async_engine.sync_engine
+    replica_set = async_replicas
+
+
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, class_=RoutingSession
+)
+# expire_on_commit=False: attributes stay readable after commit without an implicit (sync) refresh
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=AsyncRoutingSession,
+)
 Base = declarative_base()
 
 
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    # SQLite keeps DateTime as text; CURRENT_TIMESTAMP would write "...:SS" while
+    # values bound from Python are "...:SS.ffffff". One shape everywhere keeps text
+    # order equal to time order, so created_at columns compare raw (and indexed).
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
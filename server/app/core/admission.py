@@ -0,0 +1,322 @@
+# app/core/admission.py
+"""
+Admission control: bounded concurrency in front of the DB pool, plus token
+buckets for per-user / per-IP rate limits.
+
+`AdmissionMiddleware` (pure ASGI) makes every request take a slot from the
+global limiter, sized to the primary pool (DB_POOL_SIZE + DB_MAX_OVERFLOW), and
+from its route's limiter, if ADMISSION_ROUTE_LIMITS gives it one (heavy routes
+get a share of the pool, so they can't starve the rest). When all slots are
+taken the request waits in a bounded FIFO queue. If the queue is full, or no
+slot frees up within ADMISSION_QUEUE_TIMEOUT_SECONDS, it is answered right away
+with 503 and Retry-After, well before it would time out on pool checkout.
+
+`TokenBuckets` are used by the rate-limit dependencies in
+app/utils/rate_limit.py (429 + Retry-After).
+
+State is exported on /metrics: admission_in_flight / admission_queued /
+admission_limit, admission_rejected_total, admission_wait_seconds,
+rate_limited_total, rate_limit_keys.
+"""
+import asyncio
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.config.db import DB_MAX_OVERFLOW, DB_POOL_SIZE
+from app.core.metrics import Counter, Gauge, Histogram
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() in ("1", "true", "yes")
+DB_POOL_CAPACITY = DB_POOL_SIZE + DB_MAX_OVERFLOW
+ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", str(DB_POOL_CAPACITY)))
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", str(2 * DB_POOL_CAPACITY)))
+ADMISSION_QUEUE_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "2"))
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+# never queued or limited: paths or templates ("/hr/resumes/{resume_id}/file"). Live
+# update streams and file downloads stay open long and hold no DB connection meanwhile.
+ADMISSION_EXEMPT_PATHS = tuple(
+    p.strip()
+    for p in os.getenv(
+        "ADMISSION_EXEMPT_PATHS",
+        "/metrics,/recruiter/events,/hr/events,"
+        "/recruiter/resumes/{resume_id}/file,/hr/resumes/{resume_id}/file",
+    ).split(",")
+    if p.strip()
+)
+
+# "METHOD /path/template" -> concurrent requests; override with
+# ADMISSION_ROUTE_LIMITS="POST /recruiter/jobs/import=2,GET /recruiter/jobs/{job_id}/matches=4"
+DEFAULT_ROUTE_LIMITS = {
+    "POST /check-user": max(1, DB_POOL_CAPACITY // 2),
+    "POST /recruiter/jobs/{job_id}/resumes/bulk": max(1, DB_POOL_CAPACITY // 5),
+    "POST /recruiter/jobs/import": max(1, DB_POOL_CAPACITY // 5),
+    "GET /recruiter/jobs/{job_id}/matches": max(1, DB_POOL_CAPACITY // 3),
+}
+
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds",
+    "Time requests spent queued for an admission slot.",
+    ["limiter"],
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total",
+    "Requests answered 503 by admission control.",
+    ["limiter", "reason"],
+)
+RATE_LIMITED = Counter(
+    "rate_limited_total",
+    "Requests answered 429 by a token-bucket rate limit.",
+    ["bucket", "key"],
+)
+
+
+def _parse_route_limits(raw: Optional[str]) -> Dict[str, int]:
+    limits = dict(DEFAULT_ROUTE_LIMITS)
+    for item in (raw or "").split(","):
+        if "=" not in item:
+            continue
+        route, limit = item.rsplit("=", 1)
+        limits[" ".join(route.split())] = int(limit)
+    return {route: limit for route, limit in limits.items() if limit > 0}
+
+
+def _template_regex(template: str) -> re.Pattern:
+    parts = re.split(r"(\{[^}]+\})", template)
+    return re.compile(
+        "^" + "".join("[^/]+" if p.startswith("{") else re.escape(p) for p in parts) + "$"
+    )
+
+
+class ConcurrencyLimiter:
+    """
+    At most `limit` holders; up to `max_queue` more wait (FIFO) for at most
+    `timeout` seconds. A released slot is handed straight to the oldest waiter.
+    Used from the event loop only.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> Optional[str]:
+        """None once a slot is held, else why not ("queue_full" / "timeout")."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return None
+        if len(self._waiters) >= self.max_queue:
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.timeout)
+            return None
+        except asyncio.TimeoutError:
+            self._give_back(waiter)
+            return "timeout"
+        except asyncio.CancelledError:
+            self._give_back(waiter)
+            raise
+        finally:
+            ADMISSION_WAIT_SECONDS.observe(time.perf_counter() - start, limiter=self.name)
+
+    def _give_back(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        if waiter.done() and not waiter.cancelled():
+            self.release()  # the slot was handed over just as we gave up
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+class AdmissionController:
+    def __init__(self):
+        self.global_limiter = ConcurrencyLimiter(
+            "global",
+            ADMISSION_MAX_CONCURRENCY,
+            ADMISSION_QUEUE_SIZE,
+            ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        )
+        self.exempt = [_template_regex(path) for path in ADMISSION_EXEMPT_PATHS]
+        self.route_limiters: List[Tuple[str, re.Pattern, ConcurrencyLimiter]] = []
+        for route, limit in _parse_route_limits(os.getenv("ADMISSION_ROUTE_LIMITS")).items():
+            method, template = route.split(" ", 1)
+            self.route_limiters.append(
+                (
+                    method.upper(),
+                    _template_regex(template),
+                    ConcurrencyLimiter(
+                        route, limit, ADMISSION_QUEUE_SIZE, ADMISSION_QUEUE_TIMEOUT_SECONDS
+                    ),
+                )
+            )
+
+    def is_exempt(self, path: str) -> bool:
+        return any(pattern.match(path) for pattern in self.exempt)
+
+    def limiters_for(self, method: str, path: str) -> List[ConcurrencyLimiter]:
+        # the route's own limiter first: waiting for it doesn't hold a global slot
+        limiters = [
+            limiter
+            for route_method, pattern, limiter in self.route_limiters
+            if route_method == method and pattern.match(path)
+        ]
+        limiters.append(self.global_limiter)
+        return limiters
+
+    def all_limiters(self) -> List[ConcurrencyLimiter]:
+        return [self.global_limiter] + [limiter for _, _, limiter in self.route_limiters]
+
+
+admission = AdmissionController()
+
+
+async def _reject(send, reason: str) -> None:
+    body = json.dumps(
+        {"detail": "Server is busy, please retry shortly.", "reason": reason}
+    ).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(ADMISSION_RETRY_AFTER_SECONDS).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    def __init__(self, app, controller: AdmissionController = admission):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not ADMISSION_ENABLED
+            or self.controller.is_exempt(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        held: List[ConcurrencyLimiter] = []
+        try:
+            for limiter in self.controller.limiters_for(scope["method"], scope["path"]):
+                reason = await limiter.acquire()
+                if reason is not None:
+                    ADMISSION_REJECTED.inc(limiter=limiter.name, reason=reason)
+                    await _reject(send, reason)
+                    return
+                held.append(limiter)
+            await self.app(scope, receive, send)
+        finally:
+            for limiter in reversed(held):
+                limiter.release()
+
+
+def _limiter_state(attribute: str):
+    def callback():
+        return {(l.name,): getattr(l, attribute) for l in admission.all_limiters()}
+
+    return callback
+
+
+Gauge(
+    "admission_in_flight",
+    "Requests holding an admission slot.",
+    ["limiter"],
+    callback=_limiter_state("in_flight"),
+)
+Gauge(
+    "admission_queued",
+    "Requests waiting for an admission slot.",
+    ["limiter"],
+    callback=_limiter_state("queued"),
+)
+Gauge(
+    "admission_limit",
+    "Concurrent requests allowed per limiter.",
+    ["limiter"],
+    callback=_limiter_state("limit"),
+)
+
+
+# --- rate limits --------------------------------------------------------------------
+
+
+class TokenBuckets:
+    """
+    One token bucket per key: up to `burst` requests at once, refilled at
+    `rate` per second. Keys are kept LRU, at most `max_keys` (an evicted key
+    starts again with a full bucket). Thread-safe.
+    """
+
+    def __init__(self, name: str, rate: float, burst: float, max_keys: int = 100_000):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, cost: float = 1.0) -> float:
+        """Spend `cost` tokens: 0.0 if allowed, else seconds until it would be."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._buckets.get(key)
+            if state is None:
+                tokens = self.burst
+            else:
+                tokens = min(self.burst, state[0] + (now - state[1]) * self.rate)
+            if tokens >= cost:
+                tokens -= cost
+                wait = 0.0
+            else:
+                wait = (cost - tokens) / self.rate
+            self._buckets[key] = [tokens, now]
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def parse_rate(spec: str) -> Optional[Tuple[float, float]]:
+    """"10/60" -> 10 requests per 60 s: (rate per second, burst). None = unlimited."""
+    if not spec or spec.strip() in ("0", "off", "none"):
+        return None
+    count, _, seconds = spec.partition("/")
+    count, seconds = float(count), float(seconds or 1)
+    return count / seconds, count
+
+
+def retry_after(wait: float) -> str:
+    return str(max(1, math.ceil(wait)))
@@ -0,0 +1,46 @@
+# app/core/compression.py
+"""
+Application-level compression for large text blobs (resume bodies).
+
+zstd is used when the optional `zstandard` package is installed, zlib
+otherwise. The codec name is stored next to every blob, so rows written with
+either codec stay readable after the default changes.
+"""
+import os
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+ZLIB_LEVEL = int(os.getenv("ZLIB_LEVEL", "6"))
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+DEFAULT_CODEC = os.getenv("TEXT_CODEC") or ("zstd" if zstandard else "zlib")
+
+
+def compress_text(text: str, codec: str = DEFAULT_CODEC) -> bytes:
+    raw = text.encode("utf-8")
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requires the 'zstandard' package.")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    if codec == "zlib":
+        return zlib.compress(raw, ZLIB_LEVEL)
+    if codec == "none":
+        return raw
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def decompress_text(data: bytes, codec: str) -> str:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requires the 'zstandard' package.")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "zlib":
+        raw = zlib.decompress(data)
+    elif codec == "none":
+        raw = data
+    else:
+        raise ValueError(f"Unknown codec: {codec}")
+    return raw.decode("utf-8")
@@ -0,0 +1,83 @@
+# app/core/dedup.py
+"""
+Near-duplicate detection for resume text: MinHash signatures + LSH banding.
+
+A signature is NUM_PERM minimum hash values over the document's word
+shingles; the fraction of equal positions between two signatures estimates
+their Jaccard similarity. The signature is split into LSH_BANDS bands of
+LSH_ROWS rows; documents sharing any band bucket are candidates, so lookups
+touch a handful of index entries instead of every resume.
+With 16 bands x 8 rows the candidate threshold is ~0.7 Jaccard.
+"""
+import os
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.matching import tokenize
+
+NUM_PERM = 128
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+SHINGLE_SIZE = 3
+DUPLICATE_THRESHOLD = float(os.getenv("DUPLICATE_THRESHOLD", "0.8"))
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(20240601)  # fixed: signatures must be stable across processes
+_PERM_A = _rng.randint(1, (1 << 31) - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, (1 << 31) - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+
+
+def shingles(text: str) -> np.ndarray:
+    """Unique 31-bit hashes of the document's word SHINGLE_SIZE-grams."""
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_SIZE:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [
+            " ".join(tokens[i : i + SHINGLE_SIZE])
+            for i in range(len(tokens) - SHINGLE_SIZE + 1)
+        ]
+    hashes = np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) & 0x7FFFFFFF for g in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+    return np.unique(hashes)
+
+
+def minhash(text: str) -> Optional[np.ndarray]:
+    """
+    MinHash signature (NUM_PERM uint32), or None for text without words (e.g. an
+    image-only PDF): such documents say nothing about each other's similarity.
+    """
+    x = shingles(text)
+    if x.size == 0:
+        return None
+    # (a * x + b) mod p for every permutation/shingle pair; a, x < 2^31 so no overflow
+    hashed = (_PERM_A[:, None] * x[None, :] + _PERM_B[:, None]) % _MERSENNE_PRIME
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def pack_signature(signature: np.ndarray) -> bytes:
+    return signature.astype("<u4").tobytes()
+
+
+def unpack_signature(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<u4")
+
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """One signed 64-bit bucket key per band (band number is mixed into the key)."""
+    keys = []
+    for band in range(LSH_BANDS):
+        chunk = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS].astype("<u4").tobytes()
+        key = (band << 32) | zlib.crc32(chunk)
+        keys.append(key - (1 << 63) if key >= (1 << 63) else key)
+    return keys
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
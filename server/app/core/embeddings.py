@@ -0,0 +1,59 @@
+# app/core/embeddings.py
+"""
+Dense document embeddings with the hashing trick, computed on CPU.
+
+A document becomes one EMBEDDING_DIM float32 vector: every token and every
+adjacent-token bigram (tokenized like app/core/matching.py) is hashed to a
+dimension and a sign, weighted by sublinear tf (1 + log tf), and the sum is
+L2-normalized, so the dot product of two embeddings is their cosine similarity.
+There is no model, vocabulary or training step: the same text gives the same
+vector in every process, cheaply enough to compute on the write path.
+
+Changing EMBEDDING_DIM invalidates stored vectors
+(`python -m app.utils.vectors backfill --recompute`).
+"""
+import os
+import zlib
+from typing import List
+
+import numpy as np
+
+from app.core.matching import tokenize
+
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "256"))
+
+_SIGN_BIT = np.uint32(1 << 31)
+
+
+def _features(text: str) -> List[str]:
+    tokens = tokenize(text)
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def embed(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """Unit-length float32 embedding of `text` (all zeros for empty text)."""
+    vector = np.zeros(dim, dtype=np.float32)
+    features = _features(text)
+    if not features:
+        return vector
+    hashes = np.fromiter(
+        (zlib.crc32(f.encode("utf-8")) for f in features),
+        dtype=np.uint32,
+        count=len(features),
+    )
+    uniq, counts = np.unique(hashes, return_counts=True)
+    weights = (1.0 + np.log(counts)).astype(np.float32)
+    signs = np.where(uniq & _SIGN_BIT, -1.0, 1.0).astype(np.float32)
+    np.add.at(vector, (uniq & ~_SIGN_BIT) % dim, signs * weights)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def pack_embedding(vector: np.ndarray) -> bytes:
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def unpack_embedding(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<f4")
@@ -0,0 +1,102 @@
+# app/core/extraction.py
+"""
+Text extraction from uploaded resumes (PDF, DOCX, TXT).
+
+`extract_text` is CPU-bound and runs in a process pool (`get_extraction_pool`)
+so parsing a batch of CVs uses every core and never blocks the event loop.
+PDF support needs the optional `pypdf` package; DOCX is parsed with the stdlib.
+"""
+import multiprocessing
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from xml.etree import ElementTree
+
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(os.cpu_count() or 2)))
+
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_WHITESPACE_RE = re.compile(r"[ \t\r\f\v]+")
+
+
+class ExtractionError(Exception):
+    pass
+
+
+def _normalize(text: str) -> str:
+    lines = (_WHITESPACE_RE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _extract_pdf(path: str) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ExtractionError("PDF support requires the 'pypdf' package.")
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(path: str) -> str:
+    with zipfile.ZipFile(path) as zf:
+        root = ElementTree.fromstring(zf.read("word/document.xml"))
+    paragraphs = []
+    for para in root.iter(f"{_W_NS}p"):
+        paragraphs.append("".join(node.text or "" for node in para.iter(f"{_W_NS}t")))
+    return "\n".join(paragraphs)
+
+
+def _extract_txt(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+_EXTRACTORS = {".pdf": _extract_pdf, ".docx": _extract_docx, ".txt": _extract_txt}
+
+
+def extract_text(path: str, extension: str) -> str:
+    """Extract normalized plain text. Raises ExtractionError for unreadable files."""
+    extractor = _EXTRACTORS.get(extension.lower())
+    if extractor is None:
+        raise ExtractionError(f"Unsupported file type: {extension}")
+    try:
+        return _normalize(extractor(path))
+    except ExtractionError:
+        raise
+    except Exception as e:
+        raise ExtractionError(f"Could not read {extension} file: {e}")
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: never fork a process that holds DB connections / event loop threads
+        _pool = ProcessPoolExecutor(
+            max_workers=EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def reset_extraction_pool(broken: ProcessPoolExecutor) -> None:
+    """
+    Drop a pool whose worker died (BrokenProcessPool: every later submit would
+    fail too); the next get_extraction_pool() starts a fresh one.
+    """
+    global _pool
+    if _pool is broken:
+        _pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_extraction_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
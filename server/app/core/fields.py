@@ -0,0 +1,323 @@
+# app/core/fields.py
+"""
+Structured fields parsed from resume text: skills, years of experience,
+location and highest education level.
+
+Everything is dictionary/regex based and deterministic, cheap enough to run
+on the write path (app/utils/resume_fields.py stores the result):
+
+  - skills: token n-grams (tokenized like app/core/matching.py, so c++, c#,
+    node.js survive) looked up in SKILLS, a canonical slug per skill with
+    its aliases
+  - experience: the largest "N years ... experience" claim; failing that, the
+    union of "2016 - 2020" / "2019 - present" date ranges
+  - location: a "Location:"/"Address:"/"Based in" line, else the resume header,
+    matched against a city/country gazetteer
+  - education: highest degree mentioned, as a level (EDUCATION_LEVELS)
+"""
+import re
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.matching import tokenize
+
+# slug -> (display name, aliases); aliases are matched as whole token sequences
+SKILLS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "python": ("Python", ("python",)),
+    "java": ("Java", ("java",)),
+    "javascript": ("JavaScript", ("javascript", "js", "ecmascript")),
+    "typescript": ("TypeScript", ("typescript",)),
+    "c": ("C", ("ansi c",)),
+    "cpp": ("C++", ("c++", "cpp")),
+    "csharp": ("C#", ("c#", "csharp")),
+    "go": ("Go", ("golang",)),
+    "rust": ("Rust", ("rust",)),
+    "ruby": ("Ruby", ("ruby",)),
+    "php": ("PHP", ("php",)),
+    "kotlin": ("Kotlin", ("kotlin",)),
+    "swift": ("Swift", ("swift",)),
+    "scala": ("Scala", ("scala",)),
+    "r": ("R", ("rstudio", "r programming")),
+    "sql": ("SQL", ("sql", "t-sql", "pl/sql", "plsql")),
+    "postgresql": ("PostgreSQL", ("postgresql", "postgres")),
+    "mysql": ("MySQL", ("mysql",)),
+    "mongodb": ("MongoDB", ("mongodb", "mongo")),
+    "redis": ("Redis", ("redis",)),
+    "elasticsearch": ("Elasticsearch", ("elasticsearch", "elastic search")),
+    "kafka": ("Kafka", ("kafka",)),
+    "spark": ("Spark", ("spark", "pyspark")),
+    "hadoop": ("Hadoop", ("hadoop",)),
+    "airflow": ("Airflow", ("airflow",)),
+    "django": ("Django", ("django",)),
+    "flask": ("Flask", ("flask",)),
+    "fastapi": ("FastAPI", ("fastapi",)),
+    "spring": ("Spring", ("spring boot", "springboot", "spring framework")),
+    "rails": ("Ruby on Rails", ("rails", "ruby on rails")),
+    "dotnet": (".NET", ("dotnet", "asp.net", "net core")),
+    "nodejs": ("Node.js", ("node.js", "nodejs")),
+    "react": ("React", ("react", "react.js", "reactjs")),
+    "angular": ("Angular", ("angular", "angularjs")),
+    "vue": ("Vue", ("vue", "vue.js", "vuejs")),
+    "html": ("HTML", ("html", "html5")),
+    "css": ("CSS", ("css", "css3", "sass", "scss")),
+    "graphql": ("GraphQL", ("graphql",)),
+    "rest": ("REST APIs", ("rest api", "rest apis", "restful")),
+    "aws": ("AWS", ("aws", "amazon web services")),
+    "gcp": ("Google Cloud", ("gcp", "google cloud")),
+    "azure": ("Azure", ("azure",)),
+    "docker": ("Docker", ("docker",)),
+    "kubernetes": ("Kubernetes", ("kubernetes", "k8s")),
+    "terraform": ("Terraform", ("terraform",)),
+    "ansible": ("Ansible", ("ansible",)),
+    "linux": ("Linux", ("linux", "unix")),
+    "git": ("Git", ("git", "github", "gitlab")),
+    "ci_cd": ("CI/CD", ("ci/cd", "ci cd", "jenkins", "github actions", "continuous integration")),
+    "machine_learning": ("Machine Learning", ("machine learning", "ml")),
+    "deep_learning": ("Deep Learning", ("deep learning",)),
+    "nlp": ("NLP", ("nlp", "natural language processing")),
+    "computer_vision": ("Computer Vision", ("computer vision",)),
+    "tensorflow": ("TensorFlow", ("tensorflow",)),
+    "pytorch": ("PyTorch", ("pytorch",)),
+    "scikit_learn": ("scikit-learn", ("scikit-learn", "sklearn", "scikit learn")),
+    "pandas": ("pandas", ("pandas",)),
+    "numpy": ("NumPy", ("numpy",)),
+    "data_analysis": ("Data Analysis", ("data analysis", "data analytics")),
+    "excel": ("Excel", ("excel",)),
+    "tableau": ("Tableau", ("tableau",)),
+    "power_bi": ("Power BI", ("power bi", "powerbi")),
+    "figma": ("Figma", ("figma",)),
+    "android": ("Android", ("android",)),
+    "ios": ("iOS", ("ios",)),
+    "agile": ("Agile", ("agile", "scrum", "kanban")),
+    "project_management": ("Project Management", ("project management", "pmp")),
+    "salesforce": ("Salesforce", ("salesforce",)),
+    "sap": ("SAP", ("sap",)),
+    "accounting": ("Accounting", ("accounting", "bookkeeping")),
+    "recruiting": ("Recruiting", ("recruiting", "recruitment", "talent acquisition")),
+    "sales": ("Sales", ("sales",)),
+    "marketing": ("Marketing", ("marketing", "seo", "digital marketing")),
+    "communication": ("Communication", ("communication skills", "public speaking")),
+}
+
+# ordered: a higher level implies the lower ones (filters use >=)
+EDUCATION_LEVELS = ("high_school", "associate", "bachelor", "master", "doctorate")
+
+# city -> country; countries below also match on their own
+_CITIES = {
+    "new york": "United States", "san francisco": "United States",
+    "los angeles": "United States", "seattle": "United States",
+    "chicago": "United States", "boston": "United States",
+    "austin": "United States", "denver": "United States",
+    "atlanta": "United States", "washington": "United States",
+    "toronto": "Canada", "vancouver": "Canada", "montreal": "Canada",
+    "london": "United Kingdom", "manchester": "United Kingdom",
+    "edinburgh": "United Kingdom", "dublin": "Ireland",
+    "berlin": "Germany", "munich": "Germany", "hamburg": "Germany",
+    "paris": "France", "amsterdam": "Netherlands", "madrid": "Spain",
+    "barcelona": "Spain", "lisbon": "Portugal", "milan": "Italy",
+    "rome": "Italy", "zurich": "Switzerland", "stockholm": "Sweden",
+    "copenhagen": "Denmark", "oslo": "Norway", "helsinki": "Finland",
+    "warsaw": "Poland", "krakow": "Poland", "prague": "Czechia",
+    "vienna": "Austria", "tel aviv": "Israel", "dubai": "United Arab Emirates",
+    "bangalore": "India", "bengaluru": "India", "mumbai": "India",
+    "new delhi": "India", "delhi": "India", "hyderabad": "India",
+    "pune": "India", "chennai": "India", "kolkata": "India",
+    "singapore": "Singapore", "hong kong": "Hong Kong", "tokyo": "Japan",
+    "seoul": "South Korea", "beijing": "China", "shanghai": "China",
+    "shenzhen": "China", "sydney": "Australia", "melbourne": "Australia",
+    "auckland": "New Zealand", "sao paulo": "Brazil", "mexico city": "Mexico",
+    "buenos aires": "Argentina", "lagos": "Nigeria", "nairobi": "Kenya",
+    "cairo": "Egypt", "cape town": "South Africa", "johannesburg": "South Africa",
+    "karachi": "Pakistan", "lahore": "Pakistan", "dhaka": "Bangladesh",
+    "manila": "Philippines", "jakarta": "Indonesia", "kuala lumpur": "Malaysia",
+}
+_COUNTRIES = {
+    "united states": "United States", "usa": "United States", "u.s.a": "United States",
+    "canada": "Canada", "united kingdom": "United Kingdom",
+    "uk": "United Kingdom", "england": "United Kingdom", "scotland": "United Kingdom",
+    "ireland": "Ireland", "germany": "Germany", "france": "France",
+    "netherlands": "Netherlands", "spain": "Spain", "portugal": "Portugal",
+    "italy": "Italy", "switzerland": "Switzerland", "sweden": "Sweden",
+    "denmark": "Denmark", "norway": "Norway", "finland": "Finland",
+    "poland": "Poland", "czechia": "Czechia", "czech republic": "Czechia",
+    "austria": "Austria", "israel": "Israel", "uae": "United Arab Emirates",
+    "united arab emirates": "United Arab Emirates", "india": "India",
+    "singapore": "Singapore", "japan": "Japan", "south korea": "South Korea",
+    "korea": "South Korea", "china": "China", "australia": "Australia",
+    "new zealand": "New Zealand", "brazil": "Brazil", "mexico": "Mexico",
+    "argentina": "Argentina", "nigeria": "Nigeria", "kenya": "Kenya",
+    "egypt": "Egypt", "south africa": "South Africa", "pakistan": "Pakistan",
+    "bangladesh": "Bangladesh", "philippines": "Philippines",
+    "indonesia": "Indonesia", "malaysia": "Malaysia",
+}
+
+MAX_EXPERIENCE_YEARS = 50
+# the resume header (name, contact, location) is in the first few lines
+_HEADER_LINES = 8
+
+
+class ResumeFields(NamedTuple):
+    skills: List[str]  # SKILLS slugs, sorted
+    experience_years: Optional[float]
+    city: Optional[str]
+    country: Optional[str]
+    education_level: Optional[int]  # index into EDUCATION_LEVELS
+
+
+# --- skills -----------------------------------------------------------------------
+
+_SKILL_ALIASES: Dict[Tuple[str, ...], str] = {}
+for _slug, (_, _aliases) in SKILLS.items():
+    for _alias in _aliases:
+        _SKILL_ALIASES[tuple(tokenize(_alias))] = _slug
+_MAX_ALIAS_TOKENS = max(len(key) for key in _SKILL_ALIASES)
+
+
+def skill_slug(name: str) -> Optional[str]:
+    """Canonical slug for a skill name, slug or alias ("Node.js" -> "nodejs")."""
+    name = name.strip().lower()
+    if name in SKILLS:
+        return name
+    return _SKILL_ALIASES.get(tuple(tokenize(name)))
+
+
+def extract_skills(text: str) -> List[str]:
+    tokens = tokenize(text)
+    found = set()
+    for size in range(1, _MAX_ALIAS_TOKENS + 1):
+        for start in range(len(tokens) - size + 1):
+            slug = _SKILL_ALIASES.get(tuple(tokens[start : start + size]))
+            if slug is not None:
+                found.add(slug)
+    return sorted(found)
+
+
+# --- experience -------------------------------------------------------------------
+
+_YEARS_RE = re.compile(r"\b(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years?|yrs?)\b", re.I)
+_EXPERIENCE_RE = re.compile(r"\bexperience|\bexp\b", re.I)
+_RANGE_RE = re.compile(
+    r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|today)\b",
+    re.I,
+)
+_SCHOOL_RE = re.compile(r"\b(?:university|college|school|institute)\b", re.I)
+
+
+def extract_experience(text: str, today: Optional[date] = None) -> Optional[float]:
+    """Years of experience; None if the text doesn't say."""
+    claimed = [
+        float(m.group(1))
+        for line in text.splitlines()
+        if _EXPERIENCE_RE.search(line)
+        for m in _YEARS_RE.finditer(line)
+    ]
+    claimed = [y for y in claimed if 0 < y <= MAX_EXPERIENCE_YEARS]
+    if claimed:
+        return max(claimed)
+
+    this_year = (today or date.today()).year
+    spans = []
+    for line in text.splitlines():
+        if _SCHOOL_RE.search(line) or extract_education(line) is not None:
+            continue  # study periods aren't work experience
+        for m in _RANGE_RE.finditer(line):
+            start = int(m.group(1))
+            end = int(m.group(2)) if m.group(2).isdigit() else this_year
+            if start <= end <= this_year:
+                spans.append((start, end))
+    if not spans:
+        return None
+
+    # union of the ranges, so overlapping jobs aren't counted twice
+    total, current_start, current_end = 0, None, None
+    for start, end in sorted(spans):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    total += current_end - current_start
+    return float(min(total, MAX_EXPERIENCE_YEARS))
+
+
+# --- location ---------------------------------------------------------------------
+
+
+def _alternation(names) -> re.Pattern:
+    escaped = sorted((re.escape(n) for n in names), key=len, reverse=True)
+    return re.compile(r"(?<![\w.])(" + "|".join(escaped) + r")(?![\w])")
+
+
+_CITY_RE = _alternation(_CITIES)
+_COUNTRY_RE = _alternation(_COUNTRIES)
+_COUNTRY_NAMES = {name.lower(): name for name in set(_COUNTRIES.values()) | set(_CITIES.values())}
+_LOCATION_LINE_RE = re.compile(r"^\s*(?:location|address|based in|city)\b", re.I)
+
+
+def _match_location(text: str) -> Tuple[Optional[str], Optional[str]]:
+    lowered = text.lower()
+    city = _CITY_RE.search(lowered)
+    if city:
+        return city.group(1).title(), _CITIES[city.group(1)]
+    country = _COUNTRY_RE.search(lowered)
+    if country:
+        return None, _COUNTRIES[country.group(1)]
+    return None, None
+
+
+def canonical_country(name: str) -> str:
+    """Stored spelling of a country name or alias ("uk" -> "United Kingdom")."""
+    key = name.strip().lower()
+    return _COUNTRIES.get(key) or _COUNTRY_NAMES.get(key) or name.strip()
+
+
+def canonical_city(name: str) -> str:
+    key = " ".join(name.lower().split())
+    return key.title() if key in _CITIES else name.strip()
+
+
+def extract_location(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """(city, country) in canonical spelling; either may be None."""
+    lines = text.splitlines()
+    for line in lines:
+        if _LOCATION_LINE_RE.match(line):
+            found = _match_location(line)
+            if found != (None, None):
+                return found
+    return _match_location("\n".join(lines[:_HEADER_LINES]))
+
+
+# --- education --------------------------------------------------------------------
+
+_EDUCATION_PATTERNS = [
+    (4, r"ph\.?\s?d|doctorate|doctor of"),
+    (3, r"master'?s? (?:degree|of|in)|masters|m\.?\s?sc|mba|m\.?\s?tech|m\.?\s?eng|m\.s\.|m\.a\."),
+    (2, r"bachelor'?s?|b\.?\s?sc|b\.?\s?tech|b\.?\s?eng|b\.s\.|b\.a\.|b\.e\."),
+    (1, r"associate'?s? degree|associate of|diploma"),
+    (0, r"high school|secondary school|ged"),
+]
+_EDUCATION_RES = [
+    (level, re.compile(r"(?<![\w.])(?:" + pattern + r")(?!\w)", re.I))
+    for level, pattern in _EDUCATION_PATTERNS
+]
+
+
+def extract_education(text: str) -> Optional[int]:
+    """Highest education level mentioned (index into EDUCATION_LEVELS)."""
+    for level, pattern in _EDUCATION_RES:
+        if pattern.search(text):
+            return level
+    return None
+
+
+def extract_fields(text: str, today: Optional[date] = None) -> ResumeFields:
+    text = text or ""
+    city, country = extract_location(text)
+    return ResumeFields(
+        skills=extract_skills(text),
+        experience_years=extract_experience(text, today),
+        city=city,
+        country=country,
+        education_level=extract_education(text),
+    )
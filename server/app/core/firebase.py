@@ -5,6 +5,11 @@ from pathlib import Path
 import firebase_admin
 from firebase_admin import credentials, auth as firebase_auth
 
+from app.core.instrumentation import InstrumentedAuth
+from app.core.logger import get_logger
+
+log = get_logger("firebase")
+
 
 def init_firebase():
     """
@@ -19,9 +24,10 @@ def init_firebase():
 
         cred = credentials.Certificate(str(cred_file))
         firebase_admin.initialize_app(cred)
-        print("[FIREBASE] Admin SDK initialized successfully.")
+        log.info("Admin SDK initialized")
     else:
-        print("[FIREBASE] Admin SDK already initialized.")
+        log.info("Admin SDK already initialized")
 
 
-firebase_auth = firebase_auth
+# every auth call is timed (firebase_call_duration_seconds on /metrics)
+firebase_auth = InstrumentedAuth(firebase_auth)
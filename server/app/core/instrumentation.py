@@ -0,0 +1,202 @@
+# app/core/instrumentation.py
+"""
+Request, DB and Firebase timing.
+
+- `MetricsMiddleware` (pure ASGI) times every request and labels it with the
+  matched route template (`/recruiter/jobs/{job_id}/matches`), never the raw path.
+- SQLAlchemy cursor hooks time each statement and add it to the current
+  request's totals (query count + DB time per request).
+- `TimedQueuePool` / `TimedAsyncQueuePool` record how long a checkout waited
+  for a free connection.
+- `InstrumentedAuth` wraps `firebase_admin.auth` and times every call.
+"""
+import contextvars
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.logger import get_logger
+from app.core.metrics import (
+    Gauge,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_QUERY_SECONDS,
+    FIREBASE_CALL_SECONDS,
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_SECONDS,
+)
+
+log = get_logger("http")
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# a mutable holder, so statements run in worker threads / greenlets that copied
+# the request context still add to the same totals
+_request_stats: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+# --- HTTP ---------------------------------------------------------------------
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.observe(
+                elapsed, method=method, route=route_label, status_code=status_code
+            )
+            HTTP_REQUEST_DB_QUERIES.observe(stats.queries, method=method, route=route_label)
+            HTTP_REQUEST_DB_SECONDS.observe(stats.db_seconds, method=method, route=route_label)
+            log.info(
+                "request",
+                extra={
+                    "method": method,
+                    "route": route_label,
+                    "status": status_code,
+                    "duration_ms": round(elapsed * 1000, 2),
+                    "db_queries": stats.queries,
+                    "db_ms": round(stats.db_seconds * 1000, 2),
+                },
+            )
+
+
+# --- DB -----------------------------------------------------------------------
+
+
+def instrument_engine(sync_engine, label: str) -> None:
+    """Attach cursor timing hooks to a (sync) Engine; for async pass `.sync_engine`."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        DB_QUERY_SECONDS.observe(elapsed, engine=label)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+class _TimedCheckout:
+    engine_label = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.observe(
+                time.perf_counter() - start, engine=self.engine_label
+            )
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    engine_label = "sync"
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    engine_label = "async"
+
+
+# --- Firebase -----------------------------------------------------------------
+
+
+class InstrumentedAuth:
+    """
+    Proxy for `firebase_admin.auth`: functions are timed, everything else
+    (exception classes, constants) passes through. Attributes are resolved on
+    `target` at call time, so patching the target module still takes effect.
+    """
+
+    def __init__(self, target):
+        self.target = target
+
+    def __getattr__(self, name):
+        attr = getattr(self.target, name)
+        if not callable(attr) or isinstance(attr, type):
+            return attr
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = attr(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                FIREBASE_CALL_SECONDS.observe(
+                    time.perf_counter() - start, method=name, outcome=outcome
+                )
+
+        timed.__name__ = name
+        return timed
+
+
+def track_pools(**pools) -> None:
+    """Expose checked-out / idle connection counts of the given pools as gauges."""
+    labels = {name: name.rstrip("_") for name in pools}
+
+    def _checked_out():
+        return {(labels[n],): p.checkedout() for n, p in pools.items()}
+
+    def _idle():
+        return {(labels[n],): p.checkedin() for n, p in pools.items()}
+
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out.",
+        ["engine"],
+        callback=_checked_out,
+    )
+    Gauge("db_pool_idle", "Idle connections in the pool.", ["engine"], callback=_idle)
@@ -0,0 +1,141 @@
+# app/core/matching.py
+"""
+Lexical resume <-> job matching (BM25) on NumPy sparse term vectors.
+
+Documents are turned into hashed term-count vectors once, at write time
+(app/utils/matching.py persists them). Ranking a job's resumes then stacks
+the stored vectors into one CSR matrix and scores every resume against the
+job's query terms in a single vectorized pass; there is no per-document
+Python loop.
+"""
+import re
+import zlib
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+# feature-hashing space: no vocabulary table, collisions are negligible at this size
+HASH_BITS = 20
+HASH_SPACE = 1 << HASH_BITS
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from has have in into is it its of on or
+    our that the their this to was we were will with you your they them i me my
+    he she his her us not no do does did can could should would may might
+    """.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; keeps tech tokens like c++, c#, node.js, 3.11."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def term_id(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) & (HASH_SPACE - 1)
+
+
+def term_vector(text: str) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Return (term_ids, counts, doc_length) for `text`.
+    term_ids are sorted/unique int32, counts are int32.
+    """
+    tokens = tokenize(text)
+    if not tokens:
+        return np.empty(0, np.int32), np.empty(0, np.int32), 0
+    ids = np.fromiter((term_id(t) for t in tokens), dtype=np.int32, count=len(tokens))
+    uniq, counts = np.unique(ids, return_counts=True)
+    return uniq.astype(np.int32), counts.astype(np.int32), len(tokens)
+
+
+def pack_vector(term_ids: np.ndarray, counts: np.ndarray) -> bytes:
+    """Serialize a term vector as [ids..., counts...] little-endian int32."""
+    return np.concatenate([term_ids, counts]).astype("<i4").tobytes()
+
+
+def unpack_vector(blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    arr = np.frombuffer(blob, dtype="<i4")
+    half = arr.size // 2
+    return arr[:half], arr[half:]
+
+
+def build_csr(
+    blobs: Sequence[bytes],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stack packed vectors into CSR arrays (indptr, indices, data)."""
+    parts = [unpack_vector(b) for b in blobs]
+    nnz = np.fromiter((p[0].size for p in parts), dtype=np.int64, count=len(parts))
+    indptr = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum(nnz, out=indptr[1:])
+    if not parts:
+        return indptr, np.empty(0, np.int32), np.empty(0, np.int32)
+    indices = np.concatenate([p[0] for p in parts])
+    data = np.concatenate([p[1] for p in parts])
+    return indptr, indices, data
+
+
+def bm25_scores(
+    query_terms: np.ndarray,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    doc_lengths: np.ndarray,
+    k1: float = BM25_K1,
+    b: float = BM25_B,
+) -> np.ndarray:
+    """
+    BM25 score of every document (CSR row) for the unique, sorted `query_terms`.
+    Term statistics (df, idf, avgdl) come from this document set, i.e. per job.
+    """
+    n_docs = indptr.size - 1
+    if n_docs == 0 or query_terms.size == 0 or indices.size == 0:
+        return np.zeros(n_docs, dtype=np.float64)
+
+    # map each stored (doc, term) entry onto a query-term slot, if any
+    slot = np.searchsorted(query_terms, indices)
+    slot_clipped = np.minimum(slot, query_terms.size - 1)
+    hit = query_terms[slot_clipped] == indices
+
+    rows = np.repeat(np.arange(n_docs), np.diff(indptr))[hit]
+    slots = slot_clipped[hit]
+    tf = data[hit].astype(np.float64)
+
+    # document frequency per query term (term ids are unique within a row)
+    df = np.bincount(slots, minlength=query_terms.size).astype(np.float64)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+    lengths = doc_lengths.astype(np.float64)
+    avgdl = lengths.mean() or 1.0
+    norm = k1 * (1.0 - b + b * lengths[rows] / avgdl)
+    contrib = idf[slots] * tf * (k1 + 1.0) / (tf + norm)
+
+    return np.bincount(rows, weights=contrib, minlength=n_docs)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (ties keep input order)."""
+    if scores.size == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64)
+    k = min(k, scores.size)
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.lexsort((part, -scores[part]))]
+
+
+def rank(
+    query_blob: bytes, doc_blobs: Sequence[bytes], doc_lengths: Iterable[int], k: int
+) -> List[Tuple[int, float]]:
+    """Rank packed documents against a packed query; returns [(row, score)]."""
+    query_terms, _ = unpack_vector(query_blob)
+    indptr, indices, data = build_csr(doc_blobs)
+    lengths = np.fromiter(doc_lengths, dtype=np.int64, count=len(doc_blobs))
+    scores = bm25_scores(np.sort(query_terms), indptr, indices, data, lengths)
+    return [(int(i), float(scores[i])) for i in top_k(scores, k) if scores[i] > 0]
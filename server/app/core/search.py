@@ -0,0 +1,176 @@
+# app/core/search.py
+"""
+Full-text resume search primitives.
+
+Query syntax (same as Postgres `websearch_to_tsquery`, which is used on Postgres):
+    python fastapi            both terms (AND is implicit)
+    "machine learning"        phrase
+    django OR flask           either side
+    -php                      exclude
+
+On Postgres the search runs against an indexed tsvector column (GIN). For SQLite
+and tests, `InvertedIndex` below is an in-process positional index with the
+same semantics, updated incrementally as resumes are written/deleted.
+"""
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.matching import BM25_B, BM25_K1, tokenize
+
+Phrase = Tuple[str, ...]
+
+_QUERY_RE = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+
+class ParsedQuery:
+    """AND of groups; each group is an OR of phrases. Plus excluded phrases."""
+
+    def __init__(self, groups: List[List[Phrase]], excluded: List[Phrase]):
+        self.groups = groups
+        self.excluded = excluded
+
+    @property
+    def terms(self) -> Set[str]:
+        return {t for group in self.groups for phrase in group for t in phrase}
+
+    def __bool__(self) -> bool:
+        return bool(self.groups)
+
+
+def parse_query(q: str) -> ParsedQuery:
+    groups: List[List[Phrase]] = []
+    excluded: List[Phrase] = []
+    pending_or = False
+
+    for match in _QUERY_RE.finditer(q or ""):
+        negated, quoted, bare = match.group(1), match.group(2), match.group(3)
+        if bare is not None:
+            if bare == "OR":
+                pending_or = bool(groups)
+                continue
+            negated = "-" if bare.startswith("-") else ""
+            text = bare.lstrip("-")
+        else:
+            text = quoted
+
+        phrase = tuple(tokenize(text))
+        if not phrase:
+            continue
+        if negated:
+            excluded.append(phrase)
+        elif pending_or:
+            groups[-1].append(phrase)
+        else:
+            groups.append([phrase])
+        pending_or = False
+
+    return ParsedQuery(groups, excluded)
+
+
+class InvertedIndex:
+    """
+    Positional inverted index for one tenant (company):
+        term -> {doc_id: [positions]}
+    Thread-safe; add/remove are incremental.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Set[str]] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        tokens = tokenize(text)
+        positions: Dict[str, List[int]] = defaultdict(list)
+        for pos, token in enumerate(tokens):
+            positions[token].append(pos)
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term, pos_list in positions.items():
+                self._postings[term][doc_id] = pos_list
+            self._doc_terms[doc_id] = set(positions)
+            self._doc_lengths[doc_id] = len(tokens)
+            self._total_length += len(tokens)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: int) -> None:
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_id, 0)
+
+    def _phrase_docs(self, phrase: Phrase) -> Set[int]:
+        first = self._postings.get(phrase[0])
+        if not first:
+            return set()
+        docs = set(first)
+        for term in phrase[1:]:
+            docs &= set(self._postings.get(term, ()))
+            if not docs:
+                return docs
+        if len(phrase) == 1:
+            return docs
+
+        matched = set()
+        for doc_id in docs:
+            starts = set(first[doc_id])
+            for offset, term in enumerate(phrase[1:], start=1):
+                starts &= {p - offset for p in self._postings[term][doc_id]}
+                if not starts:
+                    break
+            if starts:
+                matched.add(doc_id)
+        return matched
+
+    def search(
+        self, query: ParsedQuery, candidates: Optional[Iterable[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """Matching doc ids ranked by BM25 over the query's positive terms."""
+        if not query:
+            return []
+        with self._lock:
+            docs: Optional[Set[int]] = None
+            for group in query.groups:
+                group_docs: Set[int] = set()
+                for phrase in group:
+                    group_docs |= self._phrase_docs(phrase)
+                docs = group_docs if docs is None else docs & group_docs
+                if not docs:
+                    return []
+            for phrase in query.excluded:
+                docs -= self._phrase_docs(phrase)
+            if candidates is not None:
+                docs &= set(candidates)
+            if not docs:
+                return []
+
+            n_docs = len(self._doc_lengths)
+            avgdl = (self._total_length / n_docs) or 1.0
+            scores = dict.fromkeys(docs, 0.0)
+            for term in query.terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log1p((n_docs - df + 0.5) / (df + 0.5))
+                for doc_id in docs.intersection(postings):
+                    tf = len(postings[doc_id])
+                    dl = self._doc_lengths[doc_id]
+                    norm = BM25_K1 * (1.0 - BM25_B + BM25_B * dl / avgdl)
+                    scores[doc_id] += idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+
+        return sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
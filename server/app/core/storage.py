@@ -0,0 +1,238 @@
+# app/core/storage.py
+"""
+Pluggable storage for uploaded resume files.
+
+Backends store a file under a key and return a URL-ish locator that is saved
+in Resume.resume_url ("<scheme>://<key>"). Select with STORAGE_BACKEND:
+  - local (default): files under RESUME_STORAGE_DIR
+  - s3: an S3-compatible bucket (S3_BUCKET; S3_ENDPOINT_URL for MinIO & co.,
+    S3_REGION), needs the optional `boto3` package
+
+New uploads are content-addressed (`content_key`): identical files share one
+object, so a key is never overwritten with different bytes and objects are not
+deleted with a single resume; `python -m app.utils.resume_files gc` removes the
+ones no resume references any more.
+"""
+import mimetypes
+import os
+import shutil
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+RESUME_STORAGE_DIR = os.getenv("RESUME_STORAGE_DIR", "storage")
+S3_BUCKET = os.getenv("S3_BUCKET", "")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL") or None
+S3_REGION = os.getenv("S3_REGION") or None
+# lifetime of the pre-signed download URLs clients are redirected to
+S3_PRESIGN_SECONDS = int(os.getenv("S3_PRESIGN_SECONDS", "300"))
+# local backend behind nginx: answer downloads with X-Accel-Redirect to this
+# internal location (aliased to RESUME_STORAGE_DIR) and let nginx sendfile the bytes
+STORAGE_ACCEL_REDIRECT_PREFIX = os.getenv("STORAGE_ACCEL_REDIRECT_PREFIX", "")
+
+
+def content_key(digest: str, extension: str) -> str:
+    """Storage key of a file by its SHA-256 hex digest."""
+    return f"blobs/{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}"
+
+
+def content_type(key: str) -> str:
+    return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+
+class StorageBackend:
+    scheme = ""
+
+    def put_file(self, src_path: str, key: str) -> str:
+        """
+        Store the file at src_path under key (src may be consumed). Returns its
+        URL. If the key already exists the stored object is kept as is. Raises
+        OSError when the backend can't store it.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def iter_keys(self, prefix: str) -> Iterator[Tuple[str, float]]:
+        """(key, last-modified epoch seconds) of every object under prefix."""
+        raise NotImplementedError
+
+    def last_modified(self, key: str) -> Optional[float]:
+        """Last-modified epoch seconds of a key, None if it doesn't exist."""
+        raise NotImplementedError
+
+    def local_path(self, key: str) -> Optional[str]:
+        """Filesystem path of a stored key, if this backend keeps files locally."""
+        return None
+
+    def download_url(self, key: str, filename: str) -> Optional[str]:
+        """A URL the client can fetch the object from directly, if the backend has one."""
+        return None
+
+    def url_for(self, key: str) -> str:
+        return f"{self.scheme}://{key}"
+
+    def key_from_url(self, url: str) -> str:
+        prefix = f"{self.scheme}://"
+        if not url.startswith(prefix):
+            raise ValueError(f"Not a {self.scheme} URL: {url}")
+        return url[len(prefix) :]
+
+
+class LocalStorage(StorageBackend):
+    scheme = "local"
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root not in path.parents:
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def put_file(self, src_path: str, key: str) -> str:
+        dest = self._path(key)
+        if dest.exists():
+            os.unlink(src_path)
+            os.utime(dest)  # referenced again: restart its gc grace period
+            return self.url_for(key)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # same filesystem -> rename, no byte copy
+        shutil.move(src_path, dest)
+        return self.url_for(key)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def iter_keys(self, prefix: str) -> Iterator[Tuple[str, float]]:
+        base = self._path(prefix)
+        for dirpath, _, filenames in os.walk(base):
+            for name in filenames:
+                path = Path(dirpath) / name
+                try:
+                    mtime = path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                yield path.relative_to(self.root).as_posix(), mtime
+
+    def last_modified(self, key: str) -> Optional[float]:
+        try:
+            return self._path(key).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def local_path(self, key: str) -> Optional[str]:
+        return str(self._path(key))
+
+
+class S3Storage(StorageBackend):
+    """
+    S3-compatible bucket; URLs are "s3://<bucket>/<key>". Downloads are served
+    by redirecting to a pre-signed GET (S3 answers Range requests itself).
+    """
+
+    scheme = "s3"
+
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, region: Optional[str] = None):
+        try:
+            import boto3
+            from boto3.exceptions import Boto3Error
+            from botocore.exceptions import BotoCoreError, ClientError
+        except ImportError:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires the 'boto3' package.")
+        if not bucket:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires S3_BUCKET.")
+        self.client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region)
+        self.bucket = bucket
+        self._client_error = ClientError
+        self._errors = (Boto3Error, BotoCoreError, ClientError)
+
+    def last_modified(self, key: str) -> Optional[float]:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=key)
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return head["LastModified"].timestamp()
+
+    def put_file(self, src_path: str, key: str) -> str:
+        try:
+            if self.last_modified(key) is None:
+                # multipart from disk for large files; never read whole into memory
+                self.client.upload_file(
+                    src_path, self.bucket, key, ExtraArgs={"ContentType": content_type(key)}
+                )
+            else:
+                # referenced again: a server-side self-copy refreshes LastModified,
+                # restarting its gc grace period (no bytes go through the app)
+                self.client.copy_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    CopySource={"Bucket": self.bucket, "Key": key},
+                    MetadataDirective="REPLACE",
+                    ContentType=content_type(key),
+                )
+        except self._errors as e:
+            raise OSError(f"Could not store {key} in s3://{self.bucket}: {e}") from e
+        finally:
+            os.unlink(src_path)
+        return self.url_for(key)
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def iter_keys(self, prefix: str) -> Iterator[Tuple[str, float]]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", ()):
+                yield obj["Key"], obj["LastModified"].timestamp()
+
+    def download_url(self, key: str, filename: str) -> Optional[str]:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ResponseContentType": content_type(key),
+                "ResponseContentDisposition": f'inline; filename="{filename}"',
+            },
+            ExpiresIn=S3_PRESIGN_SECONDS,
+        )
+
+    def url_for(self, key: str) -> str:
+        return f"s3://{self.bucket}/{key}"
+
+    def key_from_url(self, url: str) -> str:
+        prefix = f"s3://{self.bucket}/"
+        if not url.startswith(prefix):
+            raise ValueError(f"Not an s3://{self.bucket} URL: {url}")
+        return url[len(prefix) :]
+
+
+_storage: Optional[StorageBackend] = None
+
+
+def get_storage() -> StorageBackend:
+    global _storage
+    if _storage is None:
+        if STORAGE_BACKEND == "local":
+            _storage = LocalStorage(RESUME_STORAGE_DIR)
+        elif STORAGE_BACKEND == "s3":
+            _storage = S3Storage(S3_BUCKET, S3_ENDPOINT_URL, S3_REGION)
+        else:
+            raise RuntimeError(f"Unknown STORAGE_BACKEND: {STORAGE_BACKEND}")
+    return _storage
+
+
+def staging_dir() -> str:
+    """Scratch directory for in-flight uploads (same filesystem as local storage)."""
+    path = Path(RESUME_STORAGE_DIR) / ".staging"
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
@@ -0,0 +1,307 @@
+# app/core/vector_index.py
+"""
+Approximate nearest-neighbour search over unit float32 vectors (inner product
+= cosine) with an inverted-file (IVF) index.
+
+Build: spherical k-means (on a sample) splits the vectors into ~sqrt(n)
+clusters, and the vectors are stored grouped by cluster, so every cluster is
+one contiguous slice of the array. Search scores the query against the
+centroids and scans only the IVF_NPROBE closest clusters: about
+nprobe / sqrt(n) of the data, i.e. a few thousand dot products at n = 10^6.
+
+Updates are incremental and never retrain: `add` puts the vector in a small
+in-memory delta (searched exhaustively) and tombstones any older copy, `remove`
+tombstones. `compact` folds the delta into the clusters using the existing
+centroids; `build` retrains from scratch.
+
+`save` writes the arrays as .npy files under a new generation directory and
+flips a CURRENT pointer; `load` memory-maps them read-only, so the vectors live
+in the OS page cache (shared by every worker process) instead of the heap.
+"""
+import os
+import shutil
+import threading
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", "16"))
+IVF_TRAIN_SAMPLE = int(os.getenv("IVF_TRAIN_SAMPLE", "50000"))
+IVF_KMEANS_ITERATIONS = int(os.getenv("IVF_KMEANS_ITERATIONS", "10"))
+# below this many vectors a single exhaustive list is faster than clustering
+IVF_MIN_CLUSTERED = 1024
+
+_ASSIGN_CHUNK = 8192
+_FILES = ("ids", "vectors", "centroids", "offsets")
+
+
+def _nlist_for(n: int) -> int:
+    if n < IVF_MIN_CLUSTERED:
+        return 1
+    return int(np.sqrt(n))
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def assign_clusters(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest centroid (max inner product) of every row, in bounded-memory chunks."""
+    out = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK):
+        block = np.asarray(vectors[start : start + _ASSIGN_CHUNK], dtype=np.float32)
+        out[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def train_centroids(
+    vectors: np.ndarray,
+    nlist: int,
+    iterations: int = IVF_KMEANS_ITERATIONS,
+    sample: int = IVF_TRAIN_SAMPLE,
+    seed: int = 0,
+) -> np.ndarray:
+    """Spherical k-means on (a sample of) `vectors`; returns unit centroids."""
+    rng = np.random.default_rng(seed)
+    n = len(vectors)
+    if n > sample:
+        data = np.asarray(vectors[np.sort(rng.choice(n, sample, replace=False))])
+    else:
+        data = np.asarray(vectors, dtype=np.float32)
+    nlist = min(nlist, len(data))
+    centroids = data[rng.choice(len(data), nlist, replace=False)].astype(np.float32)
+    for _ in range(iterations):
+        labels = assign_clusters(data, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, data)
+        filled = np.bincount(labels, minlength=nlist) > 0
+        # an empty cluster keeps its previous centroid
+        centroids[filled] = _normalize_rows(sums[filled])
+    return centroids
+
+
+def _top(ids: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    if scores.size <= k:
+        order = np.argsort(-scores, kind="stable")
+    else:
+        part = np.argpartition(-scores, k - 1)[:k]
+        order = part[np.argsort(-scores[part], kind="stable")]
+    return ids[order], scores[order]
+
+
+class IVFIndex:
+    """
+    IVF index of (id, unit float32 vector) pairs. Thread-safe; an id is stored
+    at most once (re-adding replaces it).
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        ids: Optional[np.ndarray] = None,
+        vectors: Optional[np.ndarray] = None,
+        centroids: Optional[np.ndarray] = None,
+        offsets: Optional[np.ndarray] = None,
+    ):
+        self.dim = dim
+        # base: rows grouped by cluster; cluster c is rows offsets[c]:offsets[c + 1]
+        self._ids = ids if ids is not None else np.empty(0, dtype=np.int64)
+        self._vectors = vectors if vectors is not None else np.empty((0, dim), np.float32)
+        self._centroids = centroids if centroids is not None else np.empty((0, dim), np.float32)
+        self._offsets = offsets if offsets is not None else np.zeros(1, dtype=np.int64)
+        # id -> base row via binary search (a dict of 10^6 ints would cost ~100 MB)
+        self._order = np.argsort(self._ids, kind="stable")
+        self._sorted_ids = np.asarray(self._ids[self._order])
+        self._deleted = np.zeros(len(self._ids), dtype=bool)
+        self._delta: Dict[int, np.ndarray] = {}
+        self._delta_matrix: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    # --- construction -----------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls, dim: int, ids: Iterable[int], vectors: np.ndarray, nlist: Optional[int] = None
+    ) -> "IVFIndex":
+        """Train centroids on `vectors` and build the clustered base."""
+        ids = np.asarray(list(ids) if not isinstance(ids, np.ndarray) else ids, dtype=np.int64)
+        if ids.size == 0:
+            return cls(dim)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), dim)
+        centroids = train_centroids(vectors, nlist or _nlist_for(len(ids)))
+        return cls._clustered(dim, ids, vectors, centroids)
+
+    @classmethod
+    def _clustered(cls, dim, ids, vectors, centroids) -> "IVFIndex":
+        labels = assign_clusters(vectors, centroids)
+        order = np.argsort(labels, kind="stable")
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=len(centroids)), out=offsets[1:])
+        return cls(dim, ids[order], np.ascontiguousarray(vectors[order]), centroids, offsets)
+
+    def compact(self) -> "IVFIndex":
+        """
+        New index with tombstones dropped and the delta clustered with the existing
+        centroids (retrained only once the index has outgrown them).
+        """
+        with self._lock:
+            live = ~self._deleted
+            ids = [np.asarray(self._ids[live])]
+            vectors = [np.asarray(self._vectors[live])]
+            if self._delta:
+                ids.append(np.fromiter(self._delta, dtype=np.int64, count=len(self._delta)))
+                vectors.append(np.stack(list(self._delta.values())))
+            centroids = self._centroids
+        all_ids = np.concatenate(ids)
+        all_vectors = np.concatenate(vectors).reshape(len(all_ids), self.dim)
+        if len(centroids) == 0 or _nlist_for(len(all_ids)) > 2 * len(centroids):
+            # grown well past what the centroids were trained for: retrain
+            return IVFIndex.build(self.dim, all_ids, all_vectors)
+        return IVFIndex._clustered(self.dim, all_ids, all_vectors, centroids)
+
+    # --- incremental updates ----------------------------------------------------------
+
+    def _base_row(self, id_: int) -> int:
+        pos = int(np.searchsorted(self._sorted_ids, id_))
+        if pos < len(self._sorted_ids) and self._sorted_ids[pos] == id_:
+            return int(self._order[pos])
+        return -1
+
+    def add(self, id_: int, vector: np.ndarray) -> None:
+        vector = np.asarray(vector, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            row = self._base_row(id_)
+            if row >= 0:
+                self._deleted[row] = True
+            self._delta[int(id_)] = vector
+            self._delta_matrix = None
+
+    def remove(self, id_: int) -> None:
+        with self._lock:
+            row = self._base_row(id_)
+            if row >= 0:
+                self._deleted[row] = True
+            if self._delta.pop(int(id_), None) is not None:
+                self._delta_matrix = None
+
+    def get(self, id_: int) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._delta.get(int(id_))
+            if vector is not None:
+                return vector
+            row = self._base_row(id_)
+            if row >= 0 and not self._deleted[row]:
+                return np.array(self._vectors[row])
+            return None
+
+    def __contains__(self, id_: int) -> bool:
+        with self._lock:
+            if int(id_) in self._delta:
+                return True
+            row = self._base_row(id_)
+            return row >= 0 and not self._deleted[row]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(len(self._ids) - self._deleted.sum()) + len(self._delta)
+
+    @property
+    def delta_size(self) -> int:
+        return len(self._delta)
+
+    @property
+    def base_size(self) -> int:
+        return len(self._ids)
+
+    # --- search -----------------------------------------------------------------------
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        nprobe: int = IVF_NPROBE,
+        exclude: Iterable[int] = (),
+    ) -> List[Tuple[int, float]]:
+        """Approximate top-k (id, score) by inner product, best first."""
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        exclude = {int(e) for e in exclude}
+        want = k + len(exclude)
+        found_ids: List[np.ndarray] = []
+        found_scores: List[np.ndarray] = []
+
+        with self._lock:
+            if len(self._ids):
+                if len(self._centroids) > nprobe:
+                    probe = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+                else:
+                    probe = range(len(self._centroids))
+                for c in probe:
+                    start, end = int(self._offsets[c]), int(self._offsets[c + 1])
+                    if start == end:
+                        continue
+                    # contiguous slice: a sequential read of the memory map
+                    scores = np.asarray(self._vectors[start:end]) @ query
+                    live = ~self._deleted[start:end]
+                    ids, scores = _top(np.asarray(self._ids[start:end])[live], scores[live], want)
+                    found_ids.append(ids)
+                    found_scores.append(scores)
+
+            if self._delta:
+                if self._delta_matrix is None:
+                    self._delta_matrix = (
+                        np.fromiter(self._delta, dtype=np.int64, count=len(self._delta)),
+                        np.stack(list(self._delta.values())),
+                    )
+                delta_ids, delta_vectors = self._delta_matrix
+                ids, scores = _top(delta_ids, delta_vectors @ query, want)
+                found_ids.append(ids)
+                found_scores.append(scores)
+
+        if not found_ids:
+            return []
+        ids, scores = _top(np.concatenate(found_ids), np.concatenate(found_scores), want)
+        return [
+            (int(i), float(s)) for i, s in zip(ids, scores) if int(i) not in exclude
+        ][:k]
+
+    # --- persistence ------------------------------------------------------------------
+
+    def save(self, directory: str) -> str:
+        """Write a compacted snapshot as a new generation; returns its path."""
+        index = self.compact() if (self._delta or self._deleted.any()) else self
+        os.makedirs(directory, exist_ok=True)
+        generation = uuid.uuid4().hex
+        path = os.path.join(directory, generation)
+        os.makedirs(path)
+        for name in _FILES:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(index, f"_{name}"))
+        pointer = os.path.join(directory, f"CURRENT.{generation}")
+        with open(pointer, "w") as f:
+            f.write(generation)
+        os.replace(pointer, os.path.join(directory, "CURRENT"))
+        # mapped files stay readable for processes still using an old generation
+        for entry in os.listdir(directory):
+            full = os.path.join(directory, entry)
+            if entry != generation and os.path.isdir(full):
+                shutil.rmtree(full, ignore_errors=True)
+        return path
+
+    @classmethod
+    def load(cls, directory: str, dim: int, mmap: bool = True) -> Optional["IVFIndex"]:
+        """Open the current snapshot (ids/vectors memory-mapped); None if absent or stale."""
+        try:
+            with open(os.path.join(directory, "CURRENT")) as f:
+                path = os.path.join(directory, f.read().strip())
+            mode = "r" if mmap else None
+            ids = np.load(os.path.join(path, "ids.npy"), mmap_mode=mode)
+            vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode=mode)
+            centroids = np.load(os.path.join(path, "centroids.npy"))
+            offsets = np.load(os.path.join(path, "offsets.npy"))
+        except (OSError, ValueError):
+            return None
+        if vectors.ndim != 2 or vectors.shape[1] != dim:
+            return None  # EMBEDDING_DIM changed since the snapshot was written
+        return cls(dim, ids, vectors, centroids, offsets)
@@ -1,15 +1,43 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config.db import Base, engine
+from app.core.logger import setup_logging, shutdown_logging
+
+setup_logging()
+
+from app.config.db import (
+    Base,
+    ReadReplicaMiddleware,
+    SessionLocal,
+    async_engine,
+    async_replica_engines,
+    engine,
+    start_replica_checks,
+    stop_replica_checks,
+)
 from app.models import *
-from app.routers import users
-from app.routers.recruiter import jobs
+from app.routers import metrics, users
+from app.routers.recruiter import jobs, matching, filters, resumes, shortlisted
+from app.routers.recruiter import events
+from app.routers.hr import candidates as hr_candidates
+from app.routers.hr import events as hr_events
+from app.routers.hr import jobs as hr_jobs
+from app.routers.hr import shortlisted as hr_shortlisted
+from app.core.extraction import shutdown_extraction_pool
+from app.core.admission import AdmissionMiddleware
+from app.core.instrumentation import MetricsMiddleware
+from app.utils.events import shutdown_events
+from app.utils.firebase_tasks import firebase_tasks
+from app.utils.resume_fields import seed_skills
 import app.core.firebase as firebase_core
 
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
 
+# innermost: requests wait for a slot (or get 503) before touching the DB pool;
+# inside CORS so rejections still carry CORS headers
+app.add_middleware(AdmissionMiddleware)
+
 origins = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
@@ -23,13 +51,51 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ReadReplicaMiddleware)
+# outermost: times the whole request, including CORS handling
+app.add_middleware(MetricsMiddleware)
 
 
 # Ensure firebase is initialized at startup (per-process)
 @app.on_event("startup")
 def startup_event():
     firebase_core.init_firebase()
+    # claims/revocation workers; also replays outbox rows left by a previous run
+    # (once their lease expires)
+    firebase_tasks.start()
+    # lookup rows the read paths expect (GETs never seed them)
+    with SessionLocal() as db:
+        seed_skills(db)
+        db.commit()
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    # replica health probes (no-op without DATABASE_REPLICA_URLS)
+    start_replica_checks()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stop_replica_checks()
+    await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+    shutdown_extraction_pool()
+    shutdown_events()
+    firebase_tasks.stop()
+    shutdown_logging()
 
 
+app.include_router(metrics.router)
 app.include_router(users.router)
 app.include_router(jobs.router)
+app.include_router(matching.router)
+app.include_router(filters.router)
+app.include_router(resumes.router)
+app.include_router(shortlisted.router)
+app.include_router(events.router)
+app.include_router(hr_jobs.router)
+app.include_router(hr_candidates.router)
+app.include_router(hr_shortlisted.router)
+app.include_router(hr_events.router)
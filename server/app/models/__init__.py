@@ -3,5 +3,33 @@ from app.models.company import Company
 from app.models.users import User
 from app.models.jobs import Job
 from app.models.resumes import Resume
+from app.models.resume_bodies import ResumeBody
+from app.models.resume_status import ResumeStatusEvent
+from app.models.counters import RecruiterCounters, JobCounters
+from app.models.term_vectors import JobTermVector, ResumeTermVector
+from app.models.dedup import ResumeSignature, ResumeLshBucket
+from app.models.firebase_tasks import FirebaseTask
+from app.models.embeddings import JobEmbedding, ResumeEmbedding
+from app.models.resume_fields import Skill, ResumeSkill, ResumeProfile
 
-__all__ = ["Base", "Company", "User", "Job", "Resume"]
+__all__ = [
+    "Base",
+    "Company",
+    "User",
+    "Job",
+    "Resume",
+    "ResumeBody",
+    "ResumeStatusEvent",
+    "RecruiterCounters",
+    "JobCounters",
+    "JobTermVector",
+    "ResumeTermVector",
+    "ResumeSignature",
+    "ResumeLshBucket",
+    "FirebaseTask",
+    "JobEmbedding",
+    "ResumeEmbedding",
+    "Skill",
+    "ResumeSkill",
+    "ResumeProfile",
+]
@@ -1,13 +1,26 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
-from sqlalchemy.orm import relationship
+import unicodedata
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import relationship, validates
 from app.config.db import Base
 
 
+def company_name_key(name: str) -> str:
+    """Lookup key for a company name: NFKC-normalized, casefolded, whitespace collapsed."""
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
 class Company(Base):
     __tablename__ = "companies"
+    __table_args__ = (
+        # registration looks companies up (and detects duplicates) by this key
+        Index("uq_companies_name_key", "name_key", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), unique=True, nullable=False)
+    # derived from `name` (see company_name_key); kept in sync by _sync_name_key
+    name_key = Column(String(255), nullable=False)
 
     # nullable FK to users.id (allows two-step creation)
     hr_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -32,3 +45,8 @@ class Company(Base):
     )
 
     jobs = relationship("Job", back_populates="company", cascade="all, delete")
+
+    @validates("name")
+    def _sync_name_key(self, key, name):
+        self.name_key = company_name_key(name)
+        return name
@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from app.config.db import Base
+
+
+class _StatusCounts:
+    """Resume counts per pipeline status (see app.models.resumes.RESUME_STATUSES)."""
+
+    total_resumes = Column(Integer, nullable=False, default=0, server_default="0")
+    pending = Column(Integer, nullable=False, default=0, server_default="0")
+    shortlisted = Column(Integer, nullable=False, default=0, server_default="0")
+    interviewed = Column(Integer, nullable=False, default=0, server_default="0")
+    rejected = Column(Integer, nullable=False, default=0, server_default="0")
+    hired = Column(Integer, nullable=False, default=0, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class RecruiterCounters(_StatusCounts, Base):
+    """
+    Denormalized dashboard totals for one recruiter.
+    Maintained in the same transaction as job/resume writes (app/utils/counters.py);
+    `python -m app.utils.counters rebuild` reconciles drift.
+    """
+
+    __tablename__ = "recruiter_counters"
+
+    recruiter_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    total_jobs = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class JobCounters(_StatusCounts, Base):
+    """Per-job resume totals, maintained alongside RecruiterCounters."""
+
+    __tablename__ = "job_counters"
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    recruiter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,38 @@
+from sqlalchemy import BigInteger, Column, Integer, LargeBinary, ForeignKey, Index
+from app.config.db import Base
+
+
+class ResumeSignature(Base):
+    """
+    MinHash signature of a resume (app/core/dedup.py).
+    cluster_id is the id of the first resume in its near-duplicate cluster
+    (equal to resume_id for resumes with no earlier duplicate).
+    """
+
+    __tablename__ = "resume_signatures"
+    __table_args__ = (
+        Index("ix_resume_signatures_company_cluster", "company_id", "cluster_id"),
+    )
+
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    cluster_id = Column(Integer, nullable=False)
+    signature = Column(LargeBinary, nullable=False)  # NUM_PERM little-endian uint32
+
+
+class ResumeLshBucket(Base):
+    """One row per (resume, LSH band): lookups are index probes on (company_id, bucket)."""
+
+    __tablename__ = "resume_lsh_buckets"
+    __table_args__ = (
+        Index("ix_resume_lsh_buckets_company_bucket", "company_id", "bucket"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    bucket = Column(BigInteger, nullable=False)
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+    )
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, LargeBinary, ForeignKey, DateTime, Index, func
+from app.config.db import Base
+
+
+class JobEmbedding(Base):
+    """Dense embedding of Job.description (see app/core/embeddings.py)."""
+
+    __tablename__ = "job_embeddings"
+    __table_args__ = (
+        # vector index catch-up: a company's vectors committed since a timestamp
+        Index("ix_job_embeddings_company_created", "company_id", "created_at"),
+    )
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    # copied from the job so a company's index loads with one indexed scan
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False, index=True)
+    vector = Column(LargeBinary, nullable=False)  # little-endian float32[EMBEDDING_DIM]
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ResumeEmbedding(Base):
+    """
+    Dense embedding of Resume.extracted_text. Only ever read by primary key:
+    it is the query vector, never a search target.
+    """
+
+    __tablename__ = "resume_embeddings"
+
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    vector = Column(LargeBinary, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
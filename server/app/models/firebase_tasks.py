@@ -0,0 +1,25 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text, func
+from app.config.db import Base
+
+
+class FirebaseTask(Base):
+    """
+    Outbox row for a Firebase Admin side effect (see app/utils/firebase_tasks.py).
+    Deleted once the call succeeds; `next_attempt_at` is NULL for tasks that
+    exhausted their retries.
+    """
+
+    __tablename__ = "firebase_outbox"
+    __table_args__ = (Index("ix_firebase_outbox_next_attempt_at", "next_attempt_at"),)
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(32), nullable=False)  # 'set_claims' | 'revoke_tokens'
+    uid = Column(String(128), nullable=False)
+    payload = Column(JSON, nullable=True)
+
+    attempts = Column(Integer, nullable=False, default=0)
+    # naive UTC; doubles as a lease while a worker holds the task
+    next_attempt_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,10 +1,25 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    ForeignKey,
+    DateTime,
+    Index,
+    func,
+)
 from sqlalchemy.orm import relationship
 from app.config.db import Base
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # keyset pagination of a recruiter's jobs: (recruiter_id, created_at, id) range scans
+        Index("ix_jobs_recruiter_created_id", "recruiter_id", "created_at", "id"),
+        # HR company-wide job list
+        Index("ix_jobs_company_created_id", "company_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -0,0 +1,50 @@
+from sqlalchemy import Column, Integer, String, LargeBinary, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
+from app.config.db import Base
+from app.core.compression import DEFAULT_CODEC, compress_text, decompress_text
+
+
+class ResumeBody(Base):
+    """
+    Compressed extracted text of a resume, kept off the hot `resumes` row.
+    Loaded only when the text is needed (Resume.extracted_text).
+    """
+
+    __tablename__ = "resume_bodies"
+    __table_args__ = (
+        # full-text search (app/utils/search.py); Postgres only, SQLite uses an in-process index
+        Index(
+            "ix_resume_bodies_search_vector", "search_vector", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    codec = Column(String(10), nullable=False)  # zstd | zlib | none
+    data = Column(LargeBinary, nullable=False)
+    text_length = Column(Integer, nullable=False)  # characters, uncompressed
+
+    # to_tsvector(text) on Postgres; unused (NULL) elsewhere
+    search_vector = deferred(
+        Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True)
+    )
+
+    resume = relationship("Resume", back_populates="body")
+
+    @property
+    def text(self) -> str:
+        cached = self.__dict__.get("_text")
+        if cached is None:
+            cached = decompress_text(self.data, self.codec)
+            self.__dict__["_text"] = cached
+        return cached
+
+    @text.setter
+    def text(self, value: str) -> None:
+        value = value or ""
+        self.codec = DEFAULT_CODEC
+        self.data = compress_text(value, self.codec)
+        self.text_length = len(value)
+        self.__dict__["_text"] = value
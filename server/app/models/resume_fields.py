@@ -0,0 +1,59 @@
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, SmallInteger, String
+from app.config.db import Base
+
+
+class Skill(Base):
+    """Skill dictionary (seeded from app/core/fields.py SKILLS); slug is canonical."""
+
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True)
+    slug = Column(String(64), nullable=False, unique=True)
+    name = Column(String(100), nullable=False)
+
+
+class ResumeSkill(Base):
+    """
+    Resume <-> skill association. company_id / job_id are copied from the
+    resume so "resumes of this company with skill X" is one index range.
+    """
+
+    __tablename__ = "resume_skills"
+    __table_args__ = (
+        Index("ix_resume_skills_company_skill", "company_id", "skill_id", "resume_id"),
+        Index("ix_resume_skills_job_skill", "job_id", "skill_id", "resume_id"),
+    )
+
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+
+
+class ResumeProfile(Base):
+    """Scalar fields parsed from Resume.extracted_text at ingest (NULL = not found)."""
+
+    __tablename__ = "resume_profiles"
+    __table_args__ = (
+        Index("ix_resume_profiles_company_experience", "company_id", "experience_years"),
+        Index(
+            "ix_resume_profiles_company_location",
+            "company_id",
+            "location_country",
+            "location_city",
+        ),
+        Index("ix_resume_profiles_company_education", "company_id", "education_level"),
+    )
+
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
+    experience_years = Column(Float, nullable=True)
+    location_city = Column(String(100), nullable=True)
+    location_country = Column(String(100), nullable=True)
+    # index into app.core.fields.EDUCATION_LEVELS, so ">= bachelor" is a range scan
+    education_level = Column(SmallInteger, nullable=True)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import relationship
+from app.config.db import Base
+
+
+class ResumeStatusEvent(Base):
+    """One pipeline move of a resume (append-only audit trail)."""
+
+    __tablename__ = "resume_status_history"
+    __table_args__ = (Index("ix_resume_status_history_resume_id", "resume_id", "id"),)
+
+    id = Column(Integer, primary_key=True)
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False
+    )
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    from_status = Column(String(50), nullable=False)
+    to_status = Column(String(50), nullable=False)
+    changed_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    note = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    resume = relationship("Resume", back_populates="status_history")
+    user = relationship("User")
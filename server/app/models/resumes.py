@@ -1,22 +1,98 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Enum, Integer, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.config.db import Base
+from app.models.resume_bodies import ResumeBody
+
+# pipeline stages, in board order
+RESUME_STATUSES = ("pending", "shortlisted", "interviewed", "rejected", "hired")
+
+# allowed moves between stages (app.utils.pipeline enforces these)
+STATUS_TRANSITIONS = {
+    "pending": ("shortlisted", "rejected"),
+    "shortlisted": ("interviewed", "rejected", "pending"),
+    "interviewed": ("hired", "rejected", "shortlisted"),
+    "rejected": ("pending",),
+    "hired": (),
+}
 
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # pipeline board columns: one (job_id, status) range scan per stage,
+        # already in (created_at, id) order for keyset paging
+        Index("ix_resumes_job_status_created", "job_id", "status", "created_at", "id"),
+        Index("ix_resumes_job_created_id", "job_id", "created_at", "id"),
+        # HR candidate views: every filter combination is a prefix range scan on one
+        # of these, with no join through jobs (company_id is denormalized)
+        Index("ix_resumes_company_created_id", "company_id", "created_at", "id"),
+        Index(
+            "ix_resumes_company_status_created_id",
+            "company_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_resumes_company_recruiter_created_id",
+            "company_id",
+            "recruiter_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    resume_url = Column(String(500), nullable=False)  # S3 file URL
-    extracted_text = Column(Text, nullable=False)  # Full parsed text
-    status = Column(String(50), nullable=False, default="pending")
-    # pending | shortlisted | interviewed | rejected | hired
+    resume_url = Column(String(500), nullable=False)  # storage URL, see app/core/storage.py
+    # VARCHAR + CHECK rather than a native ENUM type, so adding a stage later
+    # doesn't need ALTER TYPE and existing String(50) columns stay compatible
+    status = Column(
+        Enum(
+            *RESUME_STATUSES,
+            name="resume_status",
+            native_enum=False,
+            create_constraint=True,
+            length=50,
+            validate_strings=True,
+        ),
+        nullable=False,
+        default="pending",
+    )
 
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     recruiter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # copy of jobs.company_id, set on insert (see app.utils.resumes.add_resumes)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     job = relationship("Job", back_populates="resumes")
     recruiter = relationship("User")
+    status_history = relationship(
+        "ResumeStatusEvent",
+        back_populates="resume",
+        order_by="ResumeStatusEvent.id",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Full parsed text lives compressed in resume_bodies so list/count queries stay
+    # on a narrow row; it is loaded only through `extracted_text`.
+    body = relationship(
+        "ResumeBody",
+        back_populates="resume",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def extracted_text(self) -> str:
+        return self.body.text if self.body is not None else ""
+
+    @extracted_text.setter
+    def extracted_text(self, value: str) -> None:
+        if self.body is None:
+            self.body = ResumeBody()
+        self.body.text = value
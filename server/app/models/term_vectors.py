@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, LargeBinary, ForeignKey, DateTime, func
+from app.config.db import Base
+
+
+class JobTermVector(Base):
+    """Hashed term counts of Job.description (see app/core/matching.py)."""
+
+    __tablename__ = "job_term_vectors"
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    terms = Column(LargeBinary, nullable=False)  # packed int32 [ids..., counts...]
+    length = Column(Integer, nullable=False)  # token count
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ResumeTermVector(Base):
+    """
+    Hashed term counts of Resume.extracted_text. job_id is copied from the resume
+    so a job's whole candidate pool loads with one indexed scan.
+    """
+
+    __tablename__ = "resume_term_vectors"
+
+    resume_id = Column(
+        Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
+    terms = Column(LargeBinary, nullable=False)
+    length = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,86 @@
+# server/app/routers/hr/candidates.py
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.models.resumes import RESUME_STATUSES, Resume
+from app.utils.auth import require_hr_async
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    apply_created_range,
+    apply_keyset,
+    split_page,
+)
+from app.schemas.resumes import CandidateList
+from app.utils.response_cache import cached_json, company_scope
+
+router = APIRouter(prefix="/hr", tags=["hr-candidates"])
+
+
+@router.get("/candidates", status_code=status.HTTP_200_OK, response_model=CandidateList)
+async def list_company_candidates(
+    request: Request,
+    job_id: Optional[int] = Query(None),
+    recruiter_id: Optional[int] = Query(None),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_hr_async),
+):
+    """
+    Resumes across every job/recruiter of the HR's company, newest first.
+      - job_id, recruiter_id, status: optional filters (combinable)
+      - created_from / created_to: ISO datetimes, [from, to)
+      - cursor: `next_cursor` from the previous page
+    Reads only the resumes table: company_id is denormalized onto it, and each
+    filter combination is served by a (company_id | job_id, ..., created_at, id) index.
+    Supports If-None-Match (304).
+    """
+    if status_filter:
+        status_filter = status_filter.strip().lower()
+        if status_filter not in RESUME_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"status must be one of: {', '.join(RESUME_STATUSES)}.",
+            )
+
+    async def build():
+        stmt = select(
+            Resume.id,
+            Resume.job_id,
+            Resume.recruiter_id,
+            Resume.status,
+            Resume.resume_url,
+            Resume.created_at,
+        ).where(Resume.company_id == current_user.company_id)
+
+        if job_id is not None:
+            stmt = stmt.where(Resume.job_id == job_id)
+        if recruiter_id is not None:
+            stmt = stmt.where(Resume.recruiter_id == recruiter_id)
+        if status_filter:
+            stmt = stmt.where(Resume.status == status_filter)
+        stmt = apply_created_range(stmt, Resume.created_at, created_from, created_to)
+        stmt = apply_keyset(stmt, Resume.created_at, Resume.id, cursor, limit)
+
+        rows = (await db.execute(stmt)).all()
+        page, next_cursor = split_page(rows, limit)
+
+        # rows go to CandidateList as-is (validated from attributes)
+        return {"count": len(page), "candidates": page, "next_cursor": next_cursor}
+
+    return await cached_json(
+        request,
+        current_user.id,
+        [company_scope(current_user.company_id)],
+        build,
+        CandidateList,
+    )
@@ -0,0 +1,26 @@
+# server/app/routers/hr/events.py
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.utils.auth import require_hr_async
+from app.utils.events import event_stream
+from app.utils.response_cache import company_scope
+
+router = APIRouter(prefix="/hr", tags=["hr-events"])
+
+
+@router.get("/events")
+async def company_events(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_hr_async),
+):
+    """
+    Server-sent events for every recruiter of the HR's company (same event
+    types as GET /recruiter/events). Use with EventSource; reconnects resume
+    from Last-Event-ID.
+    """
+    # the stream is long-lived: don't keep a pooled connection from authentication
+    await db.close()
+    return await event_stream(request, [company_scope(current_user.company_id)])
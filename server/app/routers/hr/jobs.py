@@ -0,0 +1,80 @@
+# server/app/routers/hr/jobs.py
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.models.counters import JobCounters
+from app.models.jobs import Job
+from app.utils.auth import require_hr_async
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    apply_created_range,
+    apply_keyset,
+    split_page,
+)
+from app.schemas.jobs import CompanyJobList
+from app.utils.response_cache import cached_json, company_scope
+
+router = APIRouter(prefix="/hr", tags=["hr-jobs"])
+
+
+@router.get("/jobs", status_code=status.HTTP_200_OK, response_model=CompanyJobList)
+async def list_company_jobs(
+    request: Request,
+    recruiter_id: Optional[int] = Query(None),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_hr_async),
+):
+    """
+    All jobs of the HR's company (every recruiter), newest first, one page at a time.
+      - recruiter_id: only this recruiter's jobs
+      - created_from / created_to: ISO datetimes, [from, to)
+      - cursor: `next_cursor` from the previous page
+    Range scan on ix_jobs_company_created_id (or ix_jobs_recruiter_created_id);
+    per-job resume counts are primary-key lookups into job_counters.
+    Supports If-None-Match (304).
+    """
+
+    async def build():
+        stmt = (
+            select(
+                Job.id,
+                Job.title,
+                Job.recruiter_id,
+                Job.created_at,
+                # no counters row yet -> 0, so rows serialize as-is
+                func.coalesce(JobCounters.total_resumes, 0).label("total_resumes"),
+                func.coalesce(JobCounters.shortlisted, 0).label("shortlisted"),
+                func.coalesce(JobCounters.interviewed, 0).label("interviewed"),
+                func.coalesce(JobCounters.hired, 0).label("hired"),
+            )
+            .outerjoin(JobCounters, JobCounters.job_id == Job.id)
+            .where(Job.company_id == current_user.company_id)
+        )
+        if recruiter_id is not None:
+            stmt = stmt.where(Job.recruiter_id == recruiter_id)
+        stmt = apply_created_range(stmt, Job.created_at, created_from, created_to)
+        stmt = apply_keyset(stmt, Job.created_at, Job.id, cursor, limit)
+
+        rows = (await db.execute(stmt)).all()
+        page, next_cursor = split_page(rows, limit)
+
+        # rows go to CompanyJobList as-is (validated from attributes)
+        return {"count": len(page), "jobs": page, "next_cursor": next_cursor}
+
+    return await cached_json(
+        request,
+        current_user.id,
+        [company_scope(current_user.company_id)],
+        build,
+        CompanyJobList,
+    )
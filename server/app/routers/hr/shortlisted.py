@@ -0,0 +1,65 @@
+# server/app/routers/hr/shortlisted.py
+from fastapi import Depends, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.models.jobs import Job
+from app.models.resumes import Resume
+from app.routers.pipeline import load_resume, pipeline_router
+from app.schemas.resumes import ResumePreview
+from app.utils.auth import require_hr_async
+from app.utils.identity_cache import CurrentUser
+from app.utils.response_cache import cached_json, company_scope
+from app.utils.resume_files import file_response, load_preview
+
+
+def _in_company(job: Job, user: CurrentUser) -> bool:
+    return job.company_id == user.company_id
+
+
+# pipeline boards and status moves of every job in the HR's company
+router = pipeline_router(
+    "/hr",
+    ["hr-shortlisted"],
+    require_user=require_hr_async,
+    can_access=_in_company,
+    cache_scope=lambda user: company_scope(user.company_id),
+)
+
+
+async def _company_resume(db: AsyncSession, resume_id: int, user: CurrentUser) -> Resume:
+    return await load_resume(db, resume_id, user, _in_company)
+
+
+@router.get("/resumes/{resume_id}/file", status_code=status.HTTP_200_OK)
+async def download_resume_file(
+    resume_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_hr_async),
+):
+    """The uploaded file of a company resume (same contract as the recruiter endpoint)."""
+    resume = await _company_resume(db, resume_id, current_user)
+    resume_id, resume_url = resume.id, resume.resume_url
+    # release the pooled connection before a slow client reads the file
+    await db.close()
+    return file_response(resume_id, resume_url)
+
+
+@router.get(
+    "/resumes/{resume_id}/preview",
+    status_code=status.HTTP_200_OK,
+    response_model=ResumePreview,
+)
+async def resume_preview(
+    request: Request,
+    resume_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_hr_async),
+):
+    """Beginning of a company resume's extracted text (ETag-cached)."""
+    resume = await _company_resume(db, resume_id, current_user)
+
+    async def build():
+        return await db.run_sync(load_preview, resume.id)
+
+    return await cached_json(request, resume.id, [], build, ResumePreview)
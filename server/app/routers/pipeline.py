@@ -0,0 +1,178 @@
+# server/app/routers/pipeline.py
+"""
+Pipeline board and status routes, shared by /recruiter (a recruiter's own jobs)
+and /hr (every job of the HR's company): see pipeline_router.
+"""
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config.db import get_async_db
+from app.models.jobs import Job
+from app.models.resumes import Resume
+from app.schemas.resumes import (
+    Board,
+    BoardStagePage,
+    StatusChange,
+    StatusChangeResult,
+    StatusHistory,
+)
+from app.utils.identity_cache import CurrentUser
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.utils.pipeline import (
+    InvalidTransition,
+    StaleStatus,
+    change_resume_status,
+    list_status_history,
+    load_board,
+    load_stage,
+    parse_stage,
+    parse_stages,
+)
+from app.utils.response_cache import cached_json
+
+# (job, current user) -> may the user see and move the job's resumes
+CanAccessJob = Callable[[Job, CurrentUser], bool]
+
+
+async def load_job(
+    db: AsyncSession, job_id: int, user: CurrentUser, can_access: CanAccessJob
+) -> Job:
+    job = await db.get(Job, job_id)
+    if not job or not can_access(job, user):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+    return job
+
+
+async def load_resume(
+    db: AsyncSession, resume_id: int, user: CurrentUser, can_access: CanAccessJob
+) -> Resume:
+    resume = await db.scalar(
+        select(Resume).options(selectinload(Resume.job)).where(Resume.id == resume_id)
+    )
+    if not resume or not can_access(resume.job, user):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found."
+        )
+    return resume
+
+
+def pipeline_router(
+    prefix: str,
+    tags: list,
+    require_user: Callable,
+    can_access: CanAccessJob,
+    cache_scope: Callable[[CurrentUser], str],
+) -> APIRouter:
+    """
+    Board, board column, status change and status history routes under `prefix`.
+      - require_user: auth dependency (e.g. require_recruiter_async)
+      - can_access: which jobs (and their resumes) the user may see; 404 otherwise
+      - cache_scope: response-cache scope of the user's boards (app/utils/response_cache.py)
+    """
+    router = APIRouter(prefix=prefix, tags=tags)
+
+    @router.get(
+        "/jobs/{job_id}/board", status_code=status.HTTP_200_OK, response_model=Board
+    )
+    async def job_board(
+        request: Request,
+        job_id: int,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        stages: Optional[str] = Query(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user=Depends(require_user),
+    ):
+        """
+        Pipeline board of one job: per stage the total count and the newest `limit`
+        resumes, plus a `next_cursor` for GET /jobs/{job_id}/board/{stage}.
+          - stages: optional comma-separated subset, e.g. `stages=shortlisted,interviewed`
+        Supports If-None-Match (304).
+        """
+        selected = parse_stages(stages)
+        job = await load_job(db, job_id, current_user, can_access)
+
+        async def build():
+            board = await db.run_sync(load_board, job.id, selected, limit)
+            return {"job_id": job.id, "stages": board}
+
+        return await cached_json(
+            request, current_user.id, [cache_scope(current_user)], build, Board
+        )
+
+    @router.get(
+        "/jobs/{job_id}/board/{stage}",
+        status_code=status.HTTP_200_OK,
+        response_model=BoardStagePage,
+    )
+    async def job_board_stage(
+        job_id: int,
+        stage: str,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user=Depends(require_user),
+    ):
+        """Next page of one board column (pass the column's `next_cursor`)."""
+        stage = parse_stage(stage)
+        job = await load_job(db, job_id, current_user, can_access)
+        page = await db.run_sync(load_stage, job.id, stage, cursor, limit)
+        return {"job_id": job.id, "stage": stage, **page}
+
+    @router.patch(
+        "/resumes/{resume_id}/status",
+        status_code=status.HTTP_200_OK,
+        response_model=StatusChangeResult,
+    )
+    async def update_resume_status(
+        resume_id: int,
+        payload: StatusChange,
+        db: AsyncSession = Depends(get_async_db),
+        current_user=Depends(require_user),
+    ):
+        """
+        Move a resume to another pipeline stage
+        (e.g. record interview outcomes: interviewed -> hired / rejected).
+        JSON body: { "status": "shortlisted", "note": "optional" }
+        Allowed moves are in app.models.resumes.STATUS_TRANSITIONS (409 otherwise);
+        an unknown status is rejected by StatusChange (422).
+        """
+        new_status, note = payload.status, payload.note
+
+        resume = await load_resume(db, resume_id, current_user, can_access)
+        old_status = resume.status
+        try:
+            await db.run_sync(
+                change_resume_status, resume, new_status, current_user.id, note
+            )
+        except (InvalidTransition, StaleStatus) as e:
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+        await db.commit()
+
+        return {
+            "id": resume.id,
+            "job_id": resume.job_id,
+            "from_status": old_status,
+            "status": new_status,
+        }
+
+    @router.get(
+        "/resumes/{resume_id}/history",
+        status_code=status.HTTP_200_OK,
+        response_model=StatusHistory,
+    )
+    async def resume_status_history(
+        resume_id: int,
+        db: AsyncSession = Depends(get_async_db),
+        current_user=Depends(require_user),
+    ):
+        """Pipeline moves of a resume, oldest first."""
+        resume = await load_resume(db, resume_id, current_user, can_access)
+        history = await db.run_sync(list_status_history, resume.id)
+        return {"id": resume.id, "status": resume.status, "history": history}
+
+    return router
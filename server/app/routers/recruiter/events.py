@@ -0,0 +1,26 @@
+# server/app/routers/recruiter/events.py
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.utils.auth import require_recruiter_async
+from app.utils.events import event_stream
+from app.utils.response_cache import recruiter_scope
+
+router = APIRouter(prefix="/recruiter", tags=["recruiter-events"])
+
+
+@router.get("/events")
+async def recruiter_events(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Server-sent events for the recruiter's own jobs and resumes (job_created,
+    jobs_imported, resumes_added, resume_status_changed; resync = refetch).
+    Use with EventSource; reconnects resume from Last-Event-ID.
+    """
+    # the stream is long-lived: don't keep a pooled connection from authentication
+    await db.close()
+    return await event_stream(request, [recruiter_scope(current_user.id)])
@@ -0,0 +1,182 @@
+# server/app/routers/recruiter/filters.py
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.core.fields import EDUCATION_LEVELS, canonical_city, canonical_country, skill_slug
+from app.models import Resume, ResumeProfile
+from app.schemas.resumes import CandidateList, ResumeFacets, SearchResults
+from app.utils.auth import require_recruiter_async
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, apply_keyset, split_page
+from app.utils.response_cache import cached_json, company_scope
+from app.utils.resume_fields import facet_counts, profile_filters
+from app.utils.search import load_company_index, search_resumes
+
+router = APIRouter(prefix="/recruiter", tags=["recruiter-filters"])
+
+
+def _company_id(current_user) -> int:
+    company_id = getattr(current_user, "company_id", None)
+    if company_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recruiter is not associated with any company.",
+        )
+    return company_id
+
+
+def field_filters(
+    job_id: Optional[int] = None,
+    skills: Optional[str] = Query(None, max_length=500),
+    min_experience: Optional[float] = Query(None, ge=0),
+    max_experience: Optional[float] = Query(None, ge=0),
+    country: Optional[str] = Query(None, max_length=100),
+    city: Optional[str] = Query(None, max_length=100),
+    education: Optional[str] = Query(None),
+) -> dict:
+    """
+    Query parameters shared by the structured-field endpoints:
+      - skills: comma-separated names or aliases, all required (e.g. python,k8s)
+      - min_experience / max_experience: years
+      - country / city: exact, any common spelling (e.g. uk, Bangalore)
+      - education: minimum level (high_school, associate, bachelor, master, doctorate)
+    """
+    slugs = []
+    if skills:
+        names = [name for name in skills.split(",") if name.strip()]
+        unknown = [name.strip() for name in names if skill_slug(name) is None]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown skill(s): {', '.join(unknown)}.",
+            )
+        slugs = sorted({skill_slug(name) for name in names})
+
+    min_education = None
+    if education:
+        level = education.strip().lower()
+        if level not in EDUCATION_LEVELS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"education must be one of: {', '.join(EDUCATION_LEVELS)}.",
+            )
+        min_education = EDUCATION_LEVELS.index(level)
+
+    return {
+        "job_id": job_id,
+        "skills": slugs,
+        "min_experience": min_experience,
+        "max_experience": max_experience,
+        "country": canonical_country(country) if country else None,
+        "city": canonical_city(city) if city else None,
+        "min_education": min_education,
+    }
+
+
+@router.get(
+    "/resumes/search", status_code=status.HTTP_200_OK, response_model=SearchResults
+)
+async def search_company_resumes(
+    q: str = Query(..., min_length=1, max_length=500),
+    job_id: Optional[int] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Ranked full-text search over the recruiter's company resumes.
+      - q: words (AND), "exact phrase", a OR b, -excluded
+      - job_id / status: optional filters
+    Uses the tsvector GIN index on Postgres, an in-process inverted index otherwise.
+    """
+    company_id = _company_id(current_user)
+
+    index = await load_company_index(company_id)
+    rows = await db.run_sync(
+        search_resumes, company_id, q, job_id, status_filter, limit, offset, index
+    )
+
+    results = [
+        {
+            "resume_id": r["id"],
+            "job_id": r["job_id"],
+            "job_title": r["job_title"],
+            "status": r["status"],
+            "resume_url": r["resume_url"],
+            "score": round(float(r["score"]), 4),
+            "created_at": r["created_at"],
+        }
+        for r in rows
+    ]
+    return {"count": len(results), "results": results}
+
+
+@router.get(
+    "/resumes/facets", status_code=status.HTTP_200_OK, response_model=ResumeFacets
+)
+async def company_resume_facets(
+    request: Request,
+    filters: dict = Depends(field_filters),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Counts of the company's resumes matching the filters, per skill, experience
+    bucket, country, city and education level (see field_filters).
+    Fields are parsed at upload (app/utils/resume_fields.py); this is one grouped
+    query over indexed tables. Supports If-None-Match (304).
+    """
+    company_id = _company_id(current_user)
+
+    async def build():
+        clauses = await db.run_sync(profile_filters, company_id, **filters)
+        return await db.run_sync(facet_counts, clauses)
+
+    return await cached_json(
+        request, current_user.id, [company_scope(company_id)], build, ResumeFacets
+    )
+
+
+@router.get(
+    "/resumes/filter", status_code=status.HTTP_200_OK, response_model=CandidateList
+)
+async def filter_company_resumes(
+    request: Request,
+    filters: dict = Depends(field_filters),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    The company's resumes matching the structured-field filters (see
+    field_filters), newest first; `cursor` is `next_cursor` from the previous page.
+    """
+    company_id = _company_id(current_user)
+
+    async def build():
+        clauses = await db.run_sync(profile_filters, company_id, **filters)
+        stmt = (
+            select(
+                Resume.id,
+                Resume.job_id,
+                Resume.recruiter_id,
+                Resume.status,
+                Resume.resume_url,
+                Resume.created_at,
+            )
+            .join(ResumeProfile, ResumeProfile.resume_id == Resume.id)
+            .where(*clauses)
+        )
+        stmt = apply_keyset(stmt, Resume.created_at, Resume.id, cursor, limit)
+        page, next_cursor = split_page((await db.execute(stmt)).all(), limit)
+        return {"count": len(page), "candidates": page, "next_cursor": next_cursor}
+
+    return await cached_json(
+        request, current_user.id, [company_scope(company_id)], build, CandidateList
+    )
@@ -1,62 +1,55 @@
 # server/app/routers/recruiter/jobs.py
-from fastapi import APIRouter, Request, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import List, Optional
 
-from app.config.db import get_db
-from app.utils.auth import require_recruiter
+import csv
+
+from fastapi import (
+    APIRouter,
+    Request,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.utils.auth import require_recruiter_async
+from app.utils.rate_limit import upload_rate_limit
 from app.models.jobs import Job
 from app.models.company import Company
+from app.models.counters import RecruiterCounters
+from app.models.resumes import RESUME_STATUSES
+from app.utils.counters import count_recruiter, record_job_created
+from app.utils.job_import import ImportFormatError, detect_format, run_import
+from app.utils.matching import index_job_terms
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    apply_keyset,
+    split_page,
+)
+from app.utils.events import publish_event
+from app.utils.response_cache import cached_json, mark_stale, recruiter_scope
+from app.utils.vectors import index_job_embedding
+from app.schemas.jobs import (
+    Job as JobSchema,
+    JobCreate,
+    JobImportResult,
+    JobList,
+    RecruiterSummary,
+)
 
 router = APIRouter(prefix="/recruiter", tags=["recruiter-jobs"])
 
 
-@router.post("/jobs", status_code=status.HTTP_201_CREATED)
-async def create_job(
-    request: Request,
-    db: Session = Depends(get_db),
-    current_user=Depends(require_recruiter),
-):
-    """
-    Create a job for the recruiter's company.
-    Frontend should send JSON body:
-      { "title": "...", "description": "..." }
-    Company is derived from current_user (server-side).
-    """
-    # parse body
-    print("Req comes to create job", request.cookies)
-    try:
-        payload = await request.json()
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON body."
-        )
-
-    title = (payload.get("title") or "").strip()
-    description = (payload.get("description") or "").strip()
-
-    # Basic validation
-    if not title or not description:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Both title and description are required.",
-        )
-    if len(title) > 255:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Title too long (max 255)."
-        )
-    if len(description) < 10:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Description too short (min 10).",
-        )
-
-    # Derive company_id from current_user (preferred for single-company recruiters)
+async def _recruiter_company_id(db: AsyncSession, current_user) -> int:
+    # Derive company_id from current_user (server-side, never from the body)
     company_id = getattr(current_user, "company_id", None)
-    if company_id is None:
-        # maybe relationship `company` exists
-        company_rel = getattr(current_user, "company", None)
-        if company_rel is not None and getattr(company_rel, "id", None) is not None:
-            company_id = company_rel.id
 
     if company_id is None:
         raise HTTPException(
@@ -65,12 +58,32 @@ async def create_job(
         )
 
     # Verify company actually exists (defense-in-depth)
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = await db.get(Company, company_id)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Associated company not found.",
         )
+    return company_id
+
+
+@router.post("/jobs", status_code=status.HTTP_201_CREATED, response_model=JobSchema)
+async def create_job(
+    payload: JobCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Create a job for the recruiter's company.
+    Frontend should send JSON body:
+      { "title": "...", "description": "..." }
+    (validated by JobCreate: title 1-255 chars, description >= 10; 422 otherwise)
+    Company is derived from current_user (server-side).
+    """
+    title = payload.title
+    description = payload.description
+
+    company_id = await _recruiter_company_id(db, current_user)
 
     # Create job
     job = Job(
@@ -81,143 +94,174 @@ async def create_job(
     )
 
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.flush()  # populates job.id
+    # dashboard counters move in the same transaction as the job row
+    await db.run_sync(record_job_created, current_user.id, job.id)
+    # term vector for /recruiter/jobs/{id}/matches, persisted with the job
+    await db.run_sync(index_job_terms, job)
+    # embedding for job recommendations / similar jobs (app/utils/vectors.py)
+    await db.run_sync(index_job_embedding, job)
+    mark_stale(db, recruiter_id=current_user.id, company_id=job.company_id)
+    publish_event(
+        db,
+        "job_created",
+        {"job_id": job.id, "title": job.title, "recruiter_id": current_user.id},
+        recruiter_id=current_user.id,
+        company_id=job.company_id,
+    )
+    await db.commit()
+    await db.refresh(job)
+
+    return job
+
+
+@router.post(
+    "/jobs/import",
+    status_code=status.HTTP_201_CREATED,
+    response_model=JobImportResult,
+    dependencies=[Depends(upload_rate_limit)],
+)
+async def import_jobs(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|jsonl)$"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Create many jobs from one CSV or JSON Lines upload (multipart field `file`).
+      - CSV: header with `title` and `description` columns
+      - JSONL: one {"title": ..., "description": ...} object per line
+      - format: optional, otherwise taken from the extension (.csv / .jsonl / .ndjson)
+
+    Rows are validated like POST /recruiter/jobs and inserted in batched
+    transactions (see app/utils/job_import.py); the file is streamed, never held
+    in memory. Invalid rows don't stop the import: they are listed in `errors`
+    with their line number.
+    """
+    company_id = await _recruiter_company_id(db, current_user)
+    # the route's session isn't used by the import; don't hold its connection
+    await db.close()
+
+    try:
+        fmt = detect_format(file.filename, format)
+        return await run_in_threadpool(
+            run_import, file.file, fmt, company_id, current_user.id
+        )
+    except (ImportFormatError, UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
-    # Return a plain JSON object (no Pydantic model)
-    return {
-        "id": job.id,
-        "title": job.title,
-        "description": job.description,
-        "company_id": job.company_id,
-        "recruiter_id": job.recruiter_id,
-        "created_at": job.created_at.isoformat() if job.created_at else None,
-    }
+# fields a list view may request via ?fields=...; id/created_at are always selected (cursor)
+JOB_LIST_FIELDS = {
+    "id": Job.id,
+    "title": Job.title,
+    "description": Job.description,
+    "company_id": Job.company_id,
+    "company_name": Company.name,
+    "recruiter_id": Job.recruiter_id,
+    "created_at": Job.created_at,
+}
 
 
-@router.get("/jobs", status_code=status.HTTP_200_OK)
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    if not fields:
+        return list(JOB_LIST_FIELDS)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in JOB_LIST_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return requested
+
+
+@router.get(
+    "/jobs",
+    status_code=status.HTTP_200_OK,
+    response_model=JobList,
+    response_model_exclude_unset=True,
+)
 async def list_recruiter_jobs(
-    db: Session = Depends(get_db),
-    current_user=Depends(require_recruiter),
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
 ):
     """
-    List ALL jobs created by the logged-in recruiter.
-    No search, no pagination.
+    List jobs created by the logged-in recruiter, newest first, one page at a time.
+      - cursor: `next_cursor` from the previous page (omit for the first page)
+      - fields: optional comma-separated projection, e.g. `fields=id,title,company_name`
+        (list views can skip `description`)
+    Company name is joined in the same query; each page is a single SELECT.
+    Conditional GET: send the ETag back as If-None-Match to get a 304 when
+    nothing changed (see app/utils/response_cache.py).
     """
-    jobs = (
-        db.query(Job)
-        .filter(Job.recruiter_id == current_user.id)
-        .order_by(Job.created_at.desc())
-        .all()
-    )
+    requested = _parse_fields(fields)
+
+    async def build():
+        selected = dict.fromkeys(["id", "created_at", *requested])
 
-    results = []
-    for j in jobs:
-        # Defensive: company relationship may not always be loaded
-        company_name = None
-        try:
-            company_name = j.company.name if getattr(j, "company", None) else None
-        except Exception:
-            company_name = None
-
-        results.append(
-            {
-                "id": j.id,
-                "title": j.title,
-                "description": j.description,
-                "company_id": j.company_id,
-                "company_name": company_name,
-                "recruiter_id": j.recruiter_id,
-                "created_at": j.created_at.isoformat() if j.created_at else None,
-            }
+        stmt = select(*(JOB_LIST_FIELDS[f].label(f) for f in selected)).where(
+            Job.recruiter_id == current_user.id
         )
+        if "company_name" in selected:
+            stmt = stmt.join(Company, Job.company_id == Company.id)
+        stmt = apply_keyset(stmt, Job.created_at, Job.id, cursor, limit)
 
-    return {"total": len(results), "jobs": results}
+        rows = (await db.execute(stmt)).all()
+        page, next_cursor = split_page(rows, limit)
 
+        # only the requested fields are set, so only they are serialized
+        results = [{f: getattr(row, f) for f in requested} for row in page]
+        return {"count": len(results), "jobs": results, "next_cursor": next_cursor}
 
-# GET /recruiter/jobs/summary
-@router.get("/summary", status_code=status.HTTP_200_OK)
+    return await cached_json(
+        request,
+        current_user.id,
+        [recruiter_scope(current_user.id)],
+        build,
+        JobList,
+        exclude_unset=True,
+    )
+
+
+# GET /recruiter/summary
+@router.get("/summary", status_code=status.HTTP_200_OK, response_model=RecruiterSummary)
 async def recruiter_summary(
-    db: Session = Depends(get_db),
-    current_user=Depends(require_recruiter),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
 ):
     """
     Return totals for the logged-in recruiter:
       - total_jobs: number of jobs created by this recruiter
       - total_resumes: number of resumes submitted to this recruiter's jobs
-      - total_shortlisted: number of shortlisted resumes (best-effort based on schema)
+      - total_shortlisted: number of resumes currently in the shortlisted stage
+      - resumes_by_status: resume count per pipeline status
 
-    Behavior is defensive so this endpoint works across slightly different schema shapes.
+    Read from the incrementally maintained recruiter_counters row (one primary-key
+    lookup); a recruiter without one yet (data from before counters existed) is
+    counted from jobs/resumes. See app/utils/counters.py. Supports If-None-Match (304).
     """
-    # Import models lazily so file-level imports don't fail if optional models are missing
-    from app.models.jobs import Job
 
-    # Jobs count (straightforward)
-    jobs_count = db.query(Job).filter(Job.recruiter_id == current_user.id).count()
+    async def build():
+        counters = await db.get(RecruiterCounters, current_user.id)
+        if counters is None:
+            row = await db.run_sync(count_recruiter, current_user.id)
+        else:
+            row = {c: getattr(counters, c) for c in ("total_jobs", "total_resumes", *RESUME_STATUSES)}
+        by_status = {s: row[s] or 0 for s in RESUME_STATUSES}
 
-    # Resumes count: join Resume -> Job and filter by recruiter's jobs
-    resumes_count = 0
-    try:
-        from app.models.resumes import Resume
+        return {
+            "total_jobs": row["total_jobs"] or 0,
+            "total_resumes": row["total_resumes"] or 0,
+            "total_shortlisted": by_status["shortlisted"],
+            "resumes_by_status": by_status,
+        }
 
-        resumes_count = (
-            db.query(Resume)
-            .join(Job, Resume.job_id == Job.id)
-            .filter(Job.recruiter_id == current_user.id)
-            .count()
-        )
-    except Exception:
-        # If Resume model is missing, keep resumes_count = 0 (defensive)
-        resumes_count = 0
-
-    # Shortlisted count: try to use an explicit Shortlist/Shortlisted model first,
-    # otherwise check for a resume-level boolean flag `is_shortlisted`.
-    shortlisted_count = 0
-    ShortlistModel = None
-    try:
-        # common candidate model names: app.models.shortlisted.Shortlisted
-        from app.models.shortlisted import Shortlisted as ShortlistModel
-    except Exception:
-        try:
-            # app.models.shortlist.Shortlist
-            from app.models.shortlist import Shortlist as ShortlistModel
-        except Exception:
-            ShortlistModel = None
-
-    if ShortlistModel is not None:
-        # If there's an explicit shortlist model, assume it has job_id FK
-        try:
-            shortlisted_count = (
-                db.query(ShortlistModel)
-                .join(Job, getattr(ShortlistModel, "job_id") == Job.id)
-                .filter(Job.recruiter_id == current_user.id)
-                .count()
-            )
-        except Exception:
-            shortlisted_count = 0
-    else:
-        # fallback: if Resume model exists and has `is_shortlisted` boolean column
-        try:
-            # Resume may already be imported above; re-import to be safe
-            from app.models.resumes import Resume
-
-            if hasattr(Resume, "is_shortlisted"):
-                shortlisted_count = (
-                    db.query(Resume)
-                    .join(Job, Resume.job_id == Job.id)
-                    .filter(
-                        Job.recruiter_id == current_user.id,
-                        getattr(Resume, "is_shortlisted") == True,
-                    )
-                    .count()
-                )
-            else:
-                shortlisted_count = 0
-        except Exception:
-            shortlisted_count = 0
-
-    return {
-        "total_jobs": jobs_count,
-        "total_resumes": resumes_count,
-        "total_shortlisted": shortlisted_count,
-    }
+    return await cached_json(
+        request, current_user.id, [recruiter_scope(current_user.id)], build, RecruiterSummary
+    )
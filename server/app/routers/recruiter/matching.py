@@ -0,0 +1,149 @@
+# server/app/routers/recruiter/matching.py
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import get_async_db
+from app.core.matching import rank
+from app.models.jobs import Job
+from app.models.resumes import Resume
+from app.schemas.jobs import JobRecommendations, SimilarJobs
+from app.schemas.resumes import MatchList
+from app.utils.auth import require_recruiter_async
+from app.utils.matching import load_job_vector, load_resume_vectors
+from app.utils.vectors import load_company_index, recommend_jobs, similar_jobs
+
+router = APIRouter(prefix="/recruiter", tags=["recruiter-matching"])
+
+
+@router.get(
+    "/jobs/{job_id}/matches", status_code=status.HTTP_200_OK, response_model=MatchList
+)
+async def job_matches(
+    job_id: int,
+    k: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Top-k resumes for one of the recruiter's jobs, ranked by BM25 of
+    Resume.extracted_text against Job.description.
+    Term vectors are precomputed at write time; scoring is one vectorized pass
+    over the job's candidate pool (see app/core/matching.py).
+    """
+    job = await db.get(Job, job_id)
+    if not job or job.recruiter_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+
+    job_vector = await db.run_sync(load_job_vector, job)
+    pool = await db.run_sync(load_resume_vectors, job.id)
+
+    # CPU-bound: keep it off the event loop
+    ranked = await run_in_threadpool(
+        rank,
+        job_vector.terms,
+        [terms for _, terms, _ in pool],
+        [length for _, _, length in pool],
+        k,
+    )
+    scores = {pool[row][0]: score for row, score in ranked}
+
+    resumes = {}
+    if scores:
+        rows = await db.execute(
+            select(Resume.id, Resume.resume_url, Resume.status, Resume.created_at).where(
+                Resume.id.in_(list(scores))
+            )
+        )
+        resumes = {r.id: r for r in rows}
+
+    matches = []
+    for resume_id, score in scores.items():
+        r = resumes.get(resume_id)
+        if r is None:
+            continue
+        matches.append(
+            {
+                "resume_id": resume_id,
+                "score": round(score, 4),
+                "resume_url": r.resume_url,
+                "status": r.status,
+                "created_at": r.created_at,
+            }
+        )
+
+    return {"job_id": job.id, "total_candidates": len(pool), "matches": matches}
+
+
+async def _scored_jobs(db: AsyncSession, company_id: int, scored) -> list:
+    """Job rows for (job_id, score) pairs, in score order (jobs of other companies dropped)."""
+    if not scored:
+        return []
+    rows = await db.execute(
+        select(Job.id, Job.title, Job.recruiter_id, Job.created_at).where(
+            Job.id.in_([job_id for job_id, _ in scored]), Job.company_id == company_id
+        )
+    )
+    jobs = {r.id: r for r in rows}
+    return [
+        {
+            "job_id": job_id,
+            "score": round(score, 4),
+            "title": jobs[job_id].title,
+            "recruiter_id": jobs[job_id].recruiter_id,
+            "created_at": jobs[job_id].created_at,
+        }
+        for job_id, score in scored
+        if job_id in jobs
+    ]
+
+
+@router.get(
+    "/resumes/{resume_id}/job-recommendations",
+    status_code=status.HTTP_200_OK,
+    response_model=JobRecommendations,
+)
+async def resume_job_recommendations(
+    resume_id: int,
+    k: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Other jobs of the company that fit one of the recruiter's candidates, by
+    cosine similarity of the resume and job description embeddings.
+    The resume vector is read by primary key and only the company's job index is
+    searched (see app/utils/vectors.py), so the cost doesn't grow with the
+    number of resumes.
+    """
+    resume = await db.get(Resume, resume_id)
+    if not resume or resume.recruiter_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found.")
+
+    index = await load_company_index(resume.company_id)
+    scored = await db.run_sync(recommend_jobs, resume, index, k)
+    return {
+        "resume_id": resume.id,
+        "job_id": resume.job_id,
+        "jobs": await _scored_jobs(db, resume.company_id, scored),
+    }
+
+
+@router.get(
+    "/jobs/{job_id}/similar", status_code=status.HTTP_200_OK, response_model=SimilarJobs
+)
+async def job_similar(
+    job_id: int,
+    k: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """Jobs of the company whose descriptions are closest to one of the recruiter's jobs."""
+    job = await db.get(Job, job_id)
+    if not job or job.recruiter_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+
+    index = await load_company_index(job.company_id)
+    scored = await db.run_sync(similar_jobs, job, index, k)
+    return {"job_id": job.id, "jobs": await _scored_jobs(db, job.company_id, scored)}
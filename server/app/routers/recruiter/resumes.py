@@ -0,0 +1,318 @@
+# server/app/routers/recruiter/resumes.py
+import asyncio
+import hashlib
+import os
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Tuple
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.db import SessionLocal, get_async_db
+from app.core.extraction import (
+    EXTRACTION_WORKERS,
+    SUPPORTED_EXTENSIONS,
+    ExtractionError,
+    extract_text,
+    get_extraction_pool,
+    reset_extraction_pool,
+)
+from app.core.logger import get_logger
+from app.core.storage import content_key, get_storage, staging_dir
+from app.models.jobs import Job
+from app.models.resumes import Resume
+from app.schemas.resumes import BulkUploadResult, DuplicateClusters, ResumePreview
+from app.utils.auth import require_recruiter_async
+from app.utils.rate_limit import upload_rate_limit
+from app.utils.dedup import list_duplicate_clusters
+from app.utils.response_cache import cached_json
+from app.utils.resume_files import file_response, load_preview
+from app.utils.resumes import add_resumes
+
+MAX_RESUME_BYTES = int(os.getenv("MAX_RESUME_BYTES", str(10 * 1024 * 1024)))
+# whole request body of an upload; enforced while it is received, before parsing
+MAX_UPLOAD_BODY_BYTES = int(os.getenv("MAX_UPLOAD_BODY_BYTES", str(200 * 1024 * 1024)))
+MAX_BULK_FILES = int(os.getenv("MAX_BULK_FILES", "500"))
+RESUME_INSERT_BATCH = int(os.getenv("RESUME_INSERT_BATCH", "100"))
+# files of one bulk upload staged/extracted/stored at a time
+BULK_UPLOAD_CONCURRENCY = int(os.getenv("BULK_UPLOAD_CONCURRENCY", str(2 * EXTRACTION_WORKERS)))
+_COPY_CHUNK = 1024 * 1024
+
+
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Request body too large (max {MAX_UPLOAD_BODY_BYTES} bytes).",
+    )
+
+
+class _BoundedBodyRoute(APIRoute):
+    """
+    Rejects (413) a request body over MAX_UPLOAD_BODY_BYTES: up front from
+    Content-Length, otherwise as soon as that many bytes have been received, so
+    the multipart parser never spools more than the cap.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def bounded_handler(request: Request):
+            length = request.headers.get("content-length")
+            if length and length.isdigit() and int(length) > MAX_UPLOAD_BODY_BYTES:
+                raise _body_too_large()
+            receive = request.receive
+            received = 0
+
+            async def bounded_receive():
+                nonlocal received
+                message = await receive()
+                if message["type"] == "http.request":
+                    received += len(message.get("body", b""))
+                    if received > MAX_UPLOAD_BODY_BYTES:
+                        raise _body_too_large()
+                return message
+
+            return await handler(Request(request.scope, bounded_receive))
+
+        return bounded_handler
+
+
+router = APIRouter(
+    prefix="/recruiter", tags=["recruiter-resumes"], route_class=_BoundedBodyRoute
+)
+log = get_logger("resumes")
+
+
+class _UploadTooLarge(Exception):
+    pass
+
+
+def _stage_upload(upload: UploadFile, extension: str) -> Tuple[str, str]:
+    """
+    Copy an upload to the staging dir in fixed-size chunks, hashing it on the
+    way; returns the temp path and the SHA-256 hex digest.
+    """
+    fd, path = tempfile.mkstemp(suffix=extension, dir=staging_dir())
+    digest = hashlib.sha256()
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            upload.file.seek(0)
+            while chunk := upload.file.read(_COPY_CHUNK):
+                written += len(chunk)
+                if written > MAX_RESUME_BYTES:
+                    raise _UploadTooLarge()
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path, digest.hexdigest()
+
+
+async def _extract(staged: str, extension: str) -> str:
+    """extract_text in the process pool; retried once on a fresh pool if a worker died."""
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_extraction_pool()
+        try:
+            return await loop.run_in_executor(pool, extract_text, staged, extension)
+        except BrokenProcessPool:
+            # a worker crashed (e.g. OOM on a hostile PDF) and every file in flight
+            # failed with it; the culprit fails again on the retry, the others don't
+            reset_extraction_pool(pool)
+            if attempt:
+                raise
+
+
+async def _process_upload(upload: UploadFile, slots: asyncio.Semaphore) -> dict:
+    """Stage -> extract (process pool) -> store. Returns a result or error entry."""
+    filename = upload.filename or "resume"
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        return {"filename": filename, "error": f"Unsupported file type: {extension or '?'}"}
+
+    async with slots:
+        try:
+            staged, digest = await run_in_threadpool(_stage_upload, upload, extension)
+        except _UploadTooLarge:
+            return {"filename": filename, "error": f"File too large (max {MAX_RESUME_BYTES} bytes)."}
+        except OSError as e:
+            log.warning("resume staging failed", extra={"upload_filename": filename, "error": str(e)})
+            return {"filename": filename, "error": "Could not store file."}
+
+        try:
+            text = await _extract(staged, extension)
+            # content-addressed: an identical file already stored is kept, not stored again
+            key = content_key(digest, extension)
+            resume_url = await run_in_threadpool(get_storage().put_file, staged, key)
+        except ExtractionError as e:
+            return {"filename": filename, "error": str(e)}
+        except BrokenProcessPool:
+            return {"filename": filename, "error": "Could not read file (the parser crashed)."}
+        except OSError as e:
+            log.warning("resume storage failed", extra={"upload_filename": filename, "error": str(e)})
+            return {"filename": filename, "error": "Could not store file."}
+        finally:
+            if os.path.exists(staged):
+                os.unlink(staged)
+    return {"filename": filename, "resume_url": resume_url, "text": text}
+
+
+def _save_batch(job_id: int, recruiter_id: int, items: List[Tuple[str, str]]) -> List[Dict]:
+    """Insert and index one batch with a session of its own, committed (blocking)."""
+    with SessionLocal() as db:
+        job = db.get(Job, job_id)
+        resumes, duplicates = add_resumes(db, job, recruiter_id, items)
+        saved = [
+            {"id": r.id, "resume_url": r.resume_url, "duplicate_of": duplicates.get(r.id)}
+            for r in resumes
+        ]
+        db.commit()
+    return saved
+
+
+@router.post(
+    "/jobs/{job_id}/resumes/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BulkUploadResult,
+    dependencies=[Depends(upload_rate_limit)],
+)
+async def bulk_upload_resumes(
+    job_id: int,
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Upload many resumes (PDF/DOCX/TXT) to one of the recruiter's jobs at once.
+    Multipart field name: `files` (repeat per file).
+
+    The request body is capped at MAX_UPLOAD_BODY_BYTES while it is received (413
+    beyond that). Starlette parses it before this runs, keeping parts under 1 MB in
+    memory and spooling larger ones to disk, so memory use is bounded by the cap.
+    Files are then copied to storage in chunks under their content hash, so
+    duplicates are stored once; text extraction runs in a process pool
+    (BULK_UPLOAD_CONCURRENCY files in flight), and rows are inserted in batches of
+    RESUME_INSERT_BATCH in the threadpool (term vectors, embeddings and field
+    extraction are CPU work that must not run on the event loop).
+    Per-file failures (unreadable file, crashed parser, storage error) are
+    reported in `errors` without failing the rest of the upload.
+    """
+    if len(files) > MAX_BULK_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many files (max {MAX_BULK_FILES}).",
+        )
+
+    job = await db.get(Job, job_id)
+    if not job or job.recruiter_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+
+    # bounded: each file in flight holds a threadpool thread or a pool worker
+    slots = asyncio.Semaphore(BULK_UPLOAD_CONCURRENCY)
+    processed = await asyncio.gather(*(_process_upload(f, slots) for f in files))
+
+    ok = [p for p in processed if "error" not in p]
+    errors = [p for p in processed if "error" in p]
+
+    created = []
+    for start in range(0, len(ok), RESUME_INSERT_BATCH):
+        batch = ok[start : start + RESUME_INSERT_BATCH]
+        try:
+            saved = await run_in_threadpool(
+                _save_batch,
+                job.id,
+                current_user.id,
+                [(p["resume_url"], p["text"]) for p in batch],
+            )
+        except Exception:
+            log.exception("resume batch insert failed", extra={"job_id": job.id})
+            # stored files may be shared with other resumes; unreferenced ones are
+            # removed by `python -m app.utils.resume_files gc`
+            for p in batch:
+                errors.append({"filename": p["filename"], "error": "Could not save resume."})
+            continue
+        created.extend({**row, "filename": p["filename"]} for row, p in zip(saved, batch))
+
+    return {"created": len(created), "resumes": created, "errors": errors}
+
+
+@router.get(
+    "/resumes/duplicates",
+    status_code=status.HTTP_200_OK,
+    response_model=DuplicateClusters,
+)
+async def list_resume_duplicates(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    Near-duplicate resume clusters in the recruiter's company (largest first).
+    Clusters are assigned at upload time with MinHash/LSH (app/core/dedup.py);
+    `cluster_id` is the id of the earliest resume in the cluster.
+    """
+    company_id = getattr(current_user, "company_id", None)
+    if company_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recruiter is not associated with any company.",
+        )
+
+    clusters = await db.run_sync(list_duplicate_clusters, company_id, limit, offset)
+    # member rows are passed through as-is; DuplicateClusters reads their attributes
+    return {"count": len(clusters), "clusters": clusters}
+
+
+async def _own_resume_url(db: AsyncSession, resume_id: int, recruiter_id: int) -> str:
+    resume_url = await db.scalar(
+        select(Resume.resume_url)
+        .join(Job, Job.id == Resume.job_id)
+        .where(Resume.id == resume_id, Job.recruiter_id == recruiter_id)
+    )
+    if resume_url is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found.")
+    return resume_url
+
+
+@router.get("/resumes/{resume_id}/file", status_code=status.HTTP_200_OK)
+async def download_resume_file(
+    resume_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """
+    The uploaded file of one of the recruiter's resumes, inline. Supports Range
+    requests (PDF viewers fetch the first pages right away); with S3 storage
+    this is a redirect to a short-lived pre-signed URL.
+    """
+    resume_url = await _own_resume_url(db, resume_id, current_user.id)
+    # release the pooled connection before a slow client reads the file
+    await db.close()
+    return file_response(resume_id, resume_url)
+
+
+@router.get(
+    "/resumes/{resume_id}/preview",
+    status_code=status.HTTP_200_OK,
+    response_model=ResumePreview,
+)
+async def resume_preview(
+    request: Request,
+    resume_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter_async),
+):
+    """Beginning of the resume's extracted text, for quick flipping (ETag-cached)."""
+    await _own_resume_url(db, resume_id, current_user.id)
+
+    async def build():
+        return await db.run_sync(load_preview, resume_id)
+
+    return await cached_json(request, resume_id, [], build, ResumePreview)
@@ -0,0 +1,13 @@
+# server/app/routers/recruiter/shortlisted.py
+from app.routers.pipeline import pipeline_router
+from app.utils.auth import require_recruiter_async
+from app.utils.response_cache import recruiter_scope
+
+# pipeline boards and status moves of the recruiter's own jobs
+router = pipeline_router(
+    "/recruiter",
+    ["recruiter-shortlisted"],
+    require_user=require_recruiter_async,
+    can_access=lambda job, user: job.recruiter_id == user.id,
+    cache_scope=lambda user: recruiter_scope(user.id),
+)
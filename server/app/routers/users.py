@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -11,26 +12,27 @@ load_dotenv()
 
 from app.config.db import get_db
 from app.models.users import User
-from app.models.company import Company
 from app.utils.auth import decode_session_cookie_best_effort
+from app.utils.companies import (
+    clean_company_name,
+    conflict_detail,
+    find_company,
+    insert_or_fetch_company,
+)
+from app.utils.firebase_tasks import enqueue_revoke_tokens, enqueue_set_claims
+from app.utils.identity_cache import load_identity
+from app.utils.rate_limit import check_user_ip_limit, enforce_rate_limit
+from app.utils.session_cache import session_cache
 
 
 from app.core.firebase import firebase_auth
+from app.core.logger import get_logger
 
+log = get_logger("users")
 router = APIRouter()
 _security = HTTPBearer()
 
 
-def _set_custom_claims_safe(uid: str, role: str, company_name: str):
-    """Try to set Firebase custom claims for user. Log errors but do not block DB creation."""
-    try:
-        claims = {"role": role, "company": company_name}
-        firebase_auth.set_custom_user_claims(uid, claims)
-        print(f"[FIREBASE] set_custom_user_claims OK for uid={uid}, claims={claims}")
-    except Exception as e:
-        print(f"[FIREBASE ERROR] Failed setting custom claims for uid={uid}: {e}")
-
-
 def _make_session_cookie_response(content: dict, status_code: int, id_token: str):
     """Create a session cookie (14 days) from id_token and attach it to the JSONResponse."""
     expires_in = timedelta(days=14)
@@ -39,15 +41,14 @@ def _make_session_cookie_response(content: dict, status_code: int, id_token: str
             id_token, expires_in=expires_in
         )
     except Exception as e:
-        print(f"[FIREBASE ERROR] create_session_cookie failed: {e}")
+        log.warning("create_session_cookie failed", extra={"error": str(e)})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Failed to create session cookie: {e}",
         )
 
-    print(
-        f"[SESSION COOKIE] Generated session cookie (length={len(session_cookie)}): {session_cookie}"
-    )
+    # never log the cookie itself: it is a bearer credential
+    log.debug("session cookie issued", extra={"cookie_length": len(session_cookie)})
     resp = JSONResponse(content=content, status_code=status_code)
     resp.set_cookie(
         key="session",
@@ -61,7 +62,7 @@ def _make_session_cookie_response(content: dict, status_code: int, id_token: str
     return resp
 
 
-@router.post("/check-user")
+@router.post("/check-user", dependencies=[Depends(check_user_ip_limit)])
 def check_user(
     request: Request,
     payload: dict | None = Body(None),  # optional body
@@ -77,30 +78,28 @@ def check_user(
           * Enforces HR/Recruiter rules and creates a new user (201), sets claims, sets cookie.
     The client must send Authorization: Bearer <idToken> for this endpoint.
     """
-    print("Req rec at /check-user")
-    print("Incoming cookies:", request.cookies)
     raw_token = credentials.credentials
     # verify id token to extract uid/email/name
     try:
         token_data = firebase_auth.verify_id_token(raw_token, clock_skew_seconds=10)
     except Exception as e:
-        print(f"[AUTH ERROR] Token verification failed in check_user: {e}")
+        log.info("check_user: id token rejected", extra={"error": str(e)})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid or expired ID token: {e}",
         )
 
     uid = token_data.get("uid")
+    # per-IP limit is the route dependency; per-uid needs the verified token
+    enforce_rate_limit("check_user", "uid", uid)
     email = token_data.get("email")
     name = token_data.get("name") or token_data.get("displayName") or ""
 
     # If no payload or empty payload -> LOGIN CHECK mode
     if not payload:
-        user = db.query(User).filter(User.firebase_uid == uid).first()
+        # user + company name in one query (or none: app/utils/identity_cache.py)
+        user = load_identity(db, uid)
         if user:
-            # derive company_name from related Company row (if present)
-            company_name = user.company.name if user.company else None
-
             content = {
                 "message": "User exists",
                 "user": {
@@ -108,7 +107,7 @@ def check_user(
                     "name": user.name,
                     "email": user.email,
                     "role": user.role,
-                    "company_name": company_name,
+                    "company_name": user.company_name,
                 },
             }
             # Create session cookie and include it in response
@@ -124,136 +123,106 @@ def check_user(
     # Otherwise payload present -> REGISTRATION mode
     role = (payload.get("role") or "").strip()
     company_name_raw = payload.get("company_name", "")
-    company_name = company_name_raw.strip() if isinstance(company_name_raw, str) else ""
+    company_name = (
+        clean_company_name(company_name_raw) if isinstance(company_name_raw, str) else ""
+    )
 
     if not role or not company_name:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="role and company_name are required in request body for registration",
         )
+    if role.lower() not in ("hr", "recruiter"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid role. Must be 'HR' or 'Recruiter'.",
+        )
 
-    # Check if user already exists — if so, reject registration attempt
+    # Check if user already exists — if so, reject registration attempt.
+    # (fast path only: a concurrent sign-up of the same uid is caught by the
+    # unique constraint below)
     existing_user = db.query(User).filter(User.firebase_uid == uid).first()
     if existing_user:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_409_CONFLICT,
             detail="User already registered. Please login instead.",
         )
 
-    # Normalize company matching for lookups (case-insensitive)
-    existing_company_user = (
-        db.query(Company).filter(Company.name.ilike(company_name)).first()
-    )
-
-    # HR registration: company must NOT exist
-    if role.lower() == "hr":
-        if existing_company_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Company already exists. Cannot create HR for this company.",
-            )
-
-        # Create HR user first (company_id left NULL), then create Company with hr_user_id,
-        # then update user's company_id to point back to company.
-        try:
-            # 1) create HR user with company_id = None temporarily
+    try:
+        if role.lower() == "hr":
+            # HR registration: company must NOT exist. The insert itself decides
+            # (ON CONFLICT on companies.name_key), so two HRs racing for the same
+            # company can't both succeed.
+            company, created = insert_or_fetch_company(db, company_name)
+            if not created:
+                db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Company already exists. Cannot create HR for this company.",
+                )
             new_user = User(
                 firebase_uid=uid,
                 email=email,
                 name=name,
                 role="HR",
-                company_id=None,
+                company_id=company.id,
             )
             db.add(new_user)
             db.flush()  # populates new_user.id
-
-            # 2) create Company referencing the new_user as hr_user
-            new_company = Company(name=company_name, hr_user_id=new_user.id)
-            db.add(new_company)
-            db.flush()  # populates new_company.id
-
-            # 3) update the user to reference the company
-            new_user.company_id = new_company.id
-            db.add(new_user)
-
-            db.commit()
-            db.refresh(new_user)
-            db.refresh(new_company)
-
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Registration failed: {e}",
-            )
-
-        # Set custom claims in Firebase (best-effort)
-        _set_custom_claims_safe(new_user.firebase_uid, new_user.role, new_company.name)
-
-        content = {
-            "message": "HR user created successfully",
-            "user": {
-                "uid": new_user.firebase_uid,
-                "name": new_user.name,
-                "email": new_user.email,
-                "role": new_user.role,
-                "company_name": new_company.name,
-            },
-        }
-        return _make_session_cookie_response(
-            content, status_code=status.HTTP_201_CREATED, id_token=raw_token
-        )
-
-    # Recruiter registration: company MUST exist
-    if role.lower() == "recruiter":
-        if not existing_company_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Company does not exist. Please contact HR.",
-            )
-
-        # Use the canonical company_name from DB to keep consistency
-        try:
+            company.hr_user_id = new_user.id
+        else:
+            # Recruiter registration: company MUST exist (indexed name_key lookup)
+            company = find_company(db, company_name)
+            if company is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Company does not exist. Please contact HR.",
+                )
             new_user = User(
                 firebase_uid=uid,
                 email=email,
                 name=name,
                 role="Recruiter",
-                company_id=existing_company_user.id,
+                company_id=company.id,
             )
             db.add(new_user)
-            db.commit()
-            db.refresh(new_user)
-        except Exception as e:
-            db.rollback()
+
+        # Firebase custom claims are set in the background once this commits
+        # (outbox row in the same transaction, retried until Firebase accepts it);
+        # the canonical company name from the DB keeps claims consistent
+        enqueue_set_claims(db, uid, {"role": new_user.role, "company": company.name})
+        db.commit()
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        detail = conflict_detail(e)
+        if detail is None:
+            log.error("registration failed", extra={"uid": uid, "error": str(e)})
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Registration failed: {e}",
+                detail="Registration failed.",
             )
-
-        # Set custom claims in Firebase (best-effort)
-        _set_custom_claims_safe(
-            new_user.firebase_uid, new_user.role, existing_company_user.name
-        )
-
-        content = {
-            "message": "Recruiter user created successfully",
-            "user": {
-                "uid": new_user.firebase_uid,
-                "name": new_user.name,
-                "email": new_user.email,
-                "role": new_user.role,
-                "company_name": existing_company_user.name,
-            },
-        }
-        return _make_session_cookie_response(
-            content, status_code=status.HTTP_201_CREATED, id_token=raw_token
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Registration failed: {e}",
         )
 
-    # Invalid role
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail="Invalid role. Must be 'HR' or 'Recruiter'.",
+    content = {
+        "message": f"{new_user.role} user created successfully",
+        "user": {
+            "uid": new_user.firebase_uid,
+            "name": new_user.name,
+            "email": new_user.email,
+            "role": new_user.role,
+            "company_name": company.name,
+        },
+    }
+    return _make_session_cookie_response(
+        content, status_code=status.HTTP_201_CREATED, id_token=raw_token
     )
 
 
@@ -266,21 +235,33 @@ COOKIE_HTTPONLY = True
 
 
 @router.post("/session-logout")
-def session_logout(decoded: dict | None = Depends(decode_session_cookie_best_effort)):
+def session_logout(
+    request: Request,
+    decoded: dict | None = Depends(decode_session_cookie_best_effort),
+    db: Session = Depends(get_db),
+):
     """
     Logout route:
     - best-effort decode session cookie to get UID (optional)
-    - revoke refresh tokens if desired
+    - drop cached claims for this cookie and bump the uid's local revocation epoch
+    - revoke refresh tokens (queued; done in the background, see app/utils/firebase_tasks.py)
     - clear cookie in response
     """
+    session_cookie = request.cookies.get(COOKIE_NAME)
+    if session_cookie:
+        session_cache.invalidate(session_cookie)
+
     uid = decoded.get("uid") if decoded else None
     if uid:
+        # other cached cookies of this uid must be re-verified with Firebase
+        session_cache.bump_revocation_epoch(uid)
         try:
             # optional: revoke Firebase refresh tokens
-            firebase_auth.revoke_refresh_tokens(uid)
-            print(f"[FIREBASE] Revoked refresh tokens for uid={uid}")
+            enqueue_revoke_tokens(db, uid)
+            db.commit()
         except Exception as e:
-            print(f"[FIREBASE] Failed to revoke tokens for uid={uid}: {e}")
+            db.rollback()
+            log.warning("queueing token revocation failed", extra={"uid": uid, "error": str(e)})
 
     # Clear cookie in response
     from fastapi.responses import JSONResponse
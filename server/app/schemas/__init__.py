@@ -0,0 +1,81 @@
+from app.schemas.base import Schema
+from app.schemas.jobs import (
+    CompanyJob,
+    CompanyJobList,
+    Job,
+    JobCreate,
+    JobImportError,
+    JobImportResult,
+    JobList,
+    JobListItem,
+    JobRecommendations,
+    RecruiterSummary,
+    ScoredJob,
+    SimilarJobs,
+)
+from app.schemas.resumes import (
+    Board,
+    BoardColumn,
+    BoardResume,
+    BoardStagePage,
+    BulkUploadResult,
+    Candidate,
+    CandidateList,
+    DuplicateCluster,
+    DuplicateClusters,
+    DuplicateResume,
+    FacetCount,
+    Match,
+    MatchList,
+    ResumeFacets,
+    ResumePreview,
+    ResumeStatus,
+    SearchHit,
+    SearchResults,
+    StatusChange,
+    StatusChangeResult,
+    StatusEvent,
+    StatusHistory,
+    UploadError,
+    UploadedResume,
+)
+
+__all__ = [
+    "Schema",
+    "CompanyJob",
+    "CompanyJobList",
+    "Job",
+    "JobCreate",
+    "JobImportError",
+    "JobImportResult",
+    "JobList",
+    "JobListItem",
+    "JobRecommendations",
+    "RecruiterSummary",
+    "ScoredJob",
+    "SimilarJobs",
+    "Board",
+    "BoardColumn",
+    "BoardResume",
+    "BoardStagePage",
+    "BulkUploadResult",
+    "Candidate",
+    "CandidateList",
+    "DuplicateCluster",
+    "DuplicateClusters",
+    "DuplicateResume",
+    "FacetCount",
+    "Match",
+    "MatchList",
+    "ResumeFacets",
+    "ResumePreview",
+    "ResumeStatus",
+    "SearchHit",
+    "SearchResults",
+    "StatusChange",
+    "StatusChangeResult",
+    "StatusEvent",
+    "StatusHistory",
+    "UploadError",
+    "UploadedResume",
+]
@@ -0,0 +1,12 @@
+# app/schemas/base.py
+from pydantic import BaseModel, ConfigDict
+
+
+class Schema(BaseModel):
+    """
+    Base for response schemas. `from_attributes` lets routes hand SQLAlchemy
+    result rows (or ORM objects) straight to FastAPI; validation and JSON
+    encoding then run in pydantic-core without building intermediate dicts.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
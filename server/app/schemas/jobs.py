@@ -0,0 +1,98 @@
+# app/schemas/jobs.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import Schema
+
+
+class JobCreate(BaseModel):
+    """Body of POST /recruiter/jobs. Company comes from the session, not the body."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    title: str = Field(min_length=1, max_length=255)
+    description: str = Field(min_length=10)
+
+
+class JobImportError(Schema):
+    line: int
+    errors: List[str]
+
+
+class JobImportResult(Schema):
+    created: int
+    failed: int
+    errors: List[JobImportError]
+    errors_truncated: bool = False
+
+
+class Job(Schema):
+    id: int
+    title: str
+    description: str
+    company_id: int
+    recruiter_id: int
+    created_at: Optional[datetime] = None
+
+
+class JobListItem(Schema):
+    """Projection of a job; only the fields requested via ?fields= are emitted."""
+
+    id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    company_id: Optional[int] = None
+    company_name: Optional[str] = None
+    recruiter_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+
+class JobList(Schema):
+    count: int
+    jobs: List[JobListItem]
+    next_cursor: Optional[str] = None
+
+
+class RecruiterSummary(Schema):
+    total_jobs: int
+    total_resumes: int
+    total_shortlisted: int
+    resumes_by_status: Dict[str, int]
+
+
+class ScoredJob(Schema):
+    job_id: int
+    score: float
+    title: str
+    recruiter_id: int
+    created_at: Optional[datetime] = None
+
+
+class JobRecommendations(Schema):
+    resume_id: int
+    job_id: int
+    jobs: List[ScoredJob]
+
+
+class SimilarJobs(Schema):
+    job_id: int
+    jobs: List[ScoredJob]
+
+
+class CompanyJob(Schema):
+    id: int
+    title: str
+    recruiter_id: int
+    created_at: Optional[datetime] = None
+    total_resumes: int = 0
+    shortlisted: int = 0
+    interviewed: int = 0
+    hired: int = 0
+
+
+class CompanyJobList(Schema):
+    count: int
+    jobs: List[CompanyJob]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,172 @@
+# app/schemas/resumes.py
+from datetime import datetime
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.resumes import RESUME_STATUSES
+from app.schemas.base import Schema
+
+ResumeStatus = Literal[RESUME_STATUSES]
+
+
+class StatusChange(BaseModel):
+    """Body of PATCH .../resumes/{id}/status."""
+
+    status: ResumeStatus
+    note: Optional[str] = Field(None, max_length=2000)
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _normalize_status(cls, value):
+        return value.strip().lower() if isinstance(value, str) else value
+
+
+class StatusChangeResult(Schema):
+    id: int
+    job_id: int
+    from_status: ResumeStatus
+    status: ResumeStatus
+
+
+class StatusEvent(Schema):
+    from_status: str
+    to_status: str
+    changed_by: Optional[int] = None
+    note: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class StatusHistory(Schema):
+    id: int
+    status: ResumeStatus
+    history: List[StatusEvent]
+
+
+class BoardResume(Schema):
+    id: int
+    status: ResumeStatus
+    resume_url: str
+    created_at: Optional[datetime] = None
+
+
+class BoardColumn(Schema):
+    count: int
+    resumes: List[BoardResume]
+    next_cursor: Optional[str] = None
+
+
+class Board(Schema):
+    job_id: int
+    stages: Dict[str, BoardColumn]
+
+
+class BoardStagePage(Schema):
+    job_id: int
+    stage: ResumeStatus
+    resumes: List[BoardResume]
+    next_cursor: Optional[str] = None
+
+
+class Candidate(Schema):
+    id: int
+    job_id: int
+    recruiter_id: int
+    status: ResumeStatus
+    resume_url: str
+    created_at: Optional[datetime] = None
+
+
+class CandidateList(Schema):
+    count: int
+    candidates: List[Candidate]
+    next_cursor: Optional[str] = None
+
+
+class FacetCount(Schema):
+    value: str
+    label: str
+    count: int
+
+
+class ResumeFacets(Schema):
+    total: int
+    skills: List[FacetCount]
+    experience: List[FacetCount]
+    countries: List[FacetCount]
+    cities: List[FacetCount]
+    education: List[FacetCount]
+
+
+class Match(Schema):
+    resume_id: int
+    score: float
+    resume_url: str
+    status: ResumeStatus
+    created_at: Optional[datetime] = None
+
+
+class MatchList(Schema):
+    job_id: int
+    total_candidates: int
+    matches: List[Match]
+
+
+class SearchHit(Schema):
+    resume_id: int
+    job_id: int
+    job_title: str
+    status: ResumeStatus
+    resume_url: str
+    score: float
+    created_at: Optional[datetime] = None
+
+
+class SearchResults(Schema):
+    count: int
+    results: List[SearchHit]
+
+
+class UploadedResume(Schema):
+    id: int
+    filename: str
+    resume_url: str
+    duplicate_of: Optional[int] = None
+
+
+class UploadError(Schema):
+    filename: str
+    error: str
+
+
+class BulkUploadResult(Schema):
+    created: int
+    resumes: List[UploadedResume]
+    errors: List[UploadError]
+
+
+class ResumePreview(Schema):
+    resume_id: int
+    text: str
+    text_length: int
+    truncated: bool
+
+
+class DuplicateResume(Schema):
+    id: int
+    job_id: int
+    job_title: str
+    status: ResumeStatus
+    resume_url: str
+    created_at: Optional[datetime] = None
+
+
+class DuplicateCluster(Schema):
+    cluster_id: int
+    size: int
+    resumes: List[DuplicateResume]
+
+
+class DuplicateClusters(Schema):
+    count: int
+    clusters: List[DuplicateCluster]
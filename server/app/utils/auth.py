@@ -3,12 +3,21 @@ import os
 from typing import Optional, Dict, Any
 
 from fastapi import Request, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core import firebase as firebase_core  # ensures firebase module is present
 from app.core.firebase import firebase_auth
-from app.config.db import get_db
+from app.config.db import get_db, get_async_db
 from app.models.users import User
+from app.utils.identity_cache import (
+    CurrentUser,
+    fetch_identity,
+    get_cached_identity,
+    load_identity,
+)
+from app.utils.session_cache import get_cached_claims, store_claims
 
 COOKIE_NAME = os.getenv("COOKIE_NAME", "session")
 
@@ -20,6 +29,8 @@ def verify_session_cookie(
     Strict verification of the Firebase session cookie.
     Raises HTTPException(401) on failure.
     Returns decoded token dict on success.
+    Verified claims are cached (see app/utils/session_cache.py), so unchanged
+    cookies skip the Firebase round-trip until exp / re-check / logout.
     """
     session_cookie = request.cookies.get(COOKIE_NAME)
     if not session_cookie:
@@ -27,6 +38,17 @@ def verify_session_cookie(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="No session cookie found."
         )
 
+    cached = get_cached_claims(session_cookie, check_revoked=check_revoked)
+    if cached is not None:
+        return cached
+
+    return _verify_session_cookie_remote(session_cookie, check_revoked)
+
+
+def _verify_session_cookie_remote(
+    session_cookie: str, check_revoked: bool
+) -> Dict[str, Any]:
+    """Firebase round-trip for a cookie that missed the cache; caches the result."""
     try:
         decoded = firebase_auth.verify_session_cookie(
             session_cookie, check_revoked=check_revoked
@@ -38,6 +60,7 @@ def verify_session_cookie(
             detail=f"Invalid/expired session cookie: {e}",
         )
 
+    store_claims(session_cookie, decoded, checked_revoked=check_revoked)
     return decoded
 
 
@@ -58,48 +81,131 @@ def decode_session_cookie_best_effort(request: Request) -> Optional[Dict[str, An
     session_cookie = request.cookies.get(COOKIE_NAME)
     if not session_cookie:
         return None
+    cached = get_cached_claims(session_cookie, check_revoked=False)
+    if cached is not None:
+        return cached
     try:
         decoded = firebase_auth.verify_session_cookie(
             session_cookie, check_revoked=False
         )
+        store_claims(session_cookie, decoded, checked_revoked=False)
         return decoded
     except Exception:
         return None
 
 
-def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
-    """
-    Full dependency that (1) verifies session cookie (revocation enforced),
-    (2) loads the User from DB and returns the SQLAlchemy User instance.
-    Raises 401 if cookie invalid or user not found.
-    """
-    decoded = verify_session_cookie(request, check_revoked=True)
+def _require_uid(decoded: Dict[str, Any]) -> str:
     uid = decoded.get("uid")
     if not uid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token: missing uid.",
         )
+    return uid
 
-    user = db.query(User).filter(User.firebase_uid == uid).first()
-    if not user:
+
+def _require_identity(identity: Optional[CurrentUser]) -> CurrentUser:
+    if identity is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found."
         )
-    # optional: check user.is_active or other flags here
-    return user
+    # optional: check is_active or other flags here
+    return identity
 
 
-# Role-based helpers
-def require_hr(current_user: User = Depends(get_current_user)) -> User:
-    if not getattr(current_user, "role", "").lower() == "hr":
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> CurrentUser:
+    """
+    Full dependency that (1) verifies session cookie (revocation enforced),
+    (2) resolves the user as a CurrentUser snapshot (id, role, company_id,
+    company_name, ...) from the identity cache, querying the DB only on a miss.
+    Raises 401 if cookie invalid or user not found.
+    Routes that need the ORM User use get_current_user_model.
+    """
+    decoded = verify_session_cookie(request, check_revoked=True)
+    return _require_identity(load_identity(db, _require_uid(decoded)))
+
+
+def get_current_user_model(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> User:
+    """The ORM User of the authenticated user (primary-key lookup)."""
+    return _require_identity(db.get(User, current_user.id))
+
+
+# Role-based helpers (snapshot only, no DB access)
+def require_hr(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    if not (current_user.role or "").lower() == "hr":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="HR only")
     return current_user
 
 
-def require_recruiter(current_user: User = Depends(get_current_user)) -> User:
-    if not getattr(current_user, "role", "").lower() == "recruiter":
+def require_recruiter(
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
+    if not (current_user.role or "").lower() == "recruiter":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Recruiter only"
         )
     return current_user
+
+
+# Async variants for `async def` routes (AsyncSession, no blocking calls on the event loop)
+async def verify_session_cookie_async(
+    request: Request, check_revoked: bool = True
+) -> Dict[str, Any]:
+    """
+    Same contract as verify_session_cookie. Cache hits return inline; a Firebase
+    round-trip (cache miss) runs in the threadpool.
+    """
+    session_cookie = request.cookies.get(COOKIE_NAME)
+    if not session_cookie:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="No session cookie found."
+        )
+
+    cached = get_cached_claims(session_cookie, check_revoked=check_revoked)
+    if cached is not None:
+        return cached
+
+    return await run_in_threadpool(
+        _verify_session_cookie_remote, session_cookie, check_revoked
+    )
+
+
+async def get_current_user_async(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
+    """
+    Async counterpart of get_current_user. A cache hit needs no DB access at
+    all (the request's AsyncSession isn't even given a connection).
+    """
+    decoded = await verify_session_cookie_async(request, check_revoked=True)
+    uid = _require_uid(decoded)
+    identity = get_cached_identity(uid)
+    if identity is None:
+        identity = await db.run_sync(fetch_identity, uid)
+    return _require_identity(identity)
+
+
+async def get_current_user_model_async(
+    current_user: CurrentUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    The ORM User, loaded through the request's AsyncSession (relationships are
+    NOT lazy-loadable; use FK columns).
+    """
+    return _require_identity(await db.get(User, current_user.id))
+
+
+async def require_hr_async(
+    current_user: CurrentUser = Depends(get_current_user_async),
+) -> CurrentUser:
+    return require_hr(current_user)
+
+
+async def require_recruiter_async(
+    current_user: CurrentUser = Depends(get_current_user_async),
+) -> CurrentUser:
+    return require_recruiter(current_user)
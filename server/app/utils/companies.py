@@ -0,0 +1,136 @@
+# app/utils/companies.py
+"""
+Company lookup and creation by normalized name.
+
+Companies are matched on `companies.name_key` (see company_name_key), which has
+a unique index, so "Acme  Corp" and "acme corp" are the same company and a
+lookup is one index probe instead of a case-insensitive scan over `name`.
+
+Creation is a single `INSERT ... ON CONFLICT (name_key) DO NOTHING RETURNING`:
+of two concurrent sign-ups for the same company exactly one inserts, the other
+gets `created=False` and the existing row, without an error or a retry loop.
+
+Existing databases (created before name_key existed):
+    python -m app.utils.companies backfill-name-keys
+"""
+import argparse
+from collections import defaultdict
+from typing import Optional, Tuple
+
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import Company
+from app.models.company import company_name_key
+from app.utils.db_helpers import upsert_insert
+
+# unique columns whose violation means "already registered", matched against
+# the driver error (constraint names on Postgres, "table.column" on SQLite)
+_CONFLICT_DETAILS = (
+    ("firebase_uid", "User already registered. Please login instead."),
+    ("email", "Email is already registered to another account."),
+    ("name", "Company already exists."),
+)
+
+
+def clean_company_name(name: str) -> str:
+    """Display form of a submitted company name: whitespace collapsed."""
+    return " ".join(name.split())
+
+
+def find_company(db: Session, name: str) -> Optional[Company]:
+    return db.scalar(select(Company).where(Company.name_key == company_name_key(name)))
+
+
+def insert_or_fetch_company(
+    db: Session, name: str, hr_user_id: Optional[int] = None
+) -> Tuple[Company, bool]:
+    """
+    Create the company `name` unless one with the same name_key exists.
+    Returns (company, created); the caller commits.
+    """
+    key = company_name_key(name)
+    stmt = (
+        upsert_insert(db, Company)
+        .values(name=name, name_key=key, hr_user_id=hr_user_id)
+        .on_conflict_do_nothing(index_elements=[Company.name_key])
+        .returning(Company)
+    )
+    company = db.scalars(stmt).one_or_none()
+    if company is not None:
+        return company, True
+    return db.scalar(select(Company).where(Company.name_key == key)), False
+
+
+def conflict_detail(exc: IntegrityError) -> Optional[str]:
+    """Client-facing message for a unique violation during registration, if known."""
+    message = str(exc.orig).lower()
+    if "unique" not in message:
+        return None
+    for column, detail in _CONFLICT_DETAILS:
+        if column in message:
+            return detail
+    return None
+
+
+def backfill_name_keys(db: Session, batch_size: int = 1000) -> int:
+    """
+    Add/fill companies.name_key and create its unique index. Idempotent; returns
+    the number of rows filled. Fails, listing them, if existing companies only
+    differ in case/whitespace; merge or rename those first.
+    """
+    bind = db.get_bind()
+    columns = {c["name"] for c in inspect(bind).get_columns("companies")}
+    if "name_key" not in columns:
+        db.execute(text("ALTER TABLE companies ADD COLUMN name_key VARCHAR(255)"))
+        db.commit()
+
+    # casefold/NFKC aren't portable SQL, so keys are computed here
+    filled = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Company.id, Company.name)
+            .where(Company.name_key.is_(None), Company.id > last_id)
+            .order_by(Company.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        db.execute(
+            update(Company),
+            [{"id": r.id, "name_key": company_name_key(r.name)} for r in rows],
+        )
+        db.commit()
+        filled += len(rows)
+
+    names_by_key = defaultdict(list)
+    for key, name in db.execute(select(Company.name_key, Company.name)):
+        names_by_key[key].append(name)
+    duplicates = [names for names in names_by_key.values() if len(names) > 1]
+    if duplicates:
+        raise RuntimeError(
+            "Companies with equivalent names: "
+            + "; ".join(", ".join(repr(n) for n in names) for names in duplicates)
+        )
+
+    if bind.dialect.name == "postgresql":
+        db.execute(text("ALTER TABLE companies ALTER COLUMN name_key SET NOT NULL"))
+        db.commit()
+    for index in Company.__table__.indexes:
+        index.create(bind, checkfirst=True)
+    return filled
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Company table maintenance.")
+    parser.add_argument("command", choices=["backfill-name-keys"])
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        filled = backfill_name_keys(session)
+    print(f"[COMPANIES] Filled name_key on {filled} companies; indexes up to date")
@@ -0,0 +1,216 @@
+# app/utils/counters.py
+"""
+Incrementally maintained dashboard counters (recruiter_counters / job_counters).
+
+Every function here takes a *sync* Session and only adds statements to the
+caller's transaction; the caller commits together with the job/resume write,
+so counters never drift from a partially applied write. Async routes call
+them through `await db.run_sync(record_job_created, ...)`. The record_*
+functions are called after the change they record has been written.
+
+Recruiters with data from before counters existed have no row: their first
+write creates it from jobs/resumes (which then already include that write),
+and reads fall back to counting (count_recruiter) until then. Reconcile drift
+(e.g. after manual SQL or a restore):
+    python -m app.utils.counters rebuild
+"""
+import argparse
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models import Job, JobCounters, RecruiterCounters, Resume
+from app.models.resumes import RESUME_STATUSES
+from app.utils.db_helpers import upsert_insert
+
+
+def _bump(db: Session, model, key: Dict[str, int], deltas: Dict[str, int]) -> None:
+    """Atomic `INSERT ... ON CONFLICT DO UPDATE SET col = col + delta`."""
+    deltas = {col: n for col, n in deltas.items() if n}
+    if not deltas:
+        return
+    table = model.__table__
+    stmt = (
+        upsert_insert(db, model)
+        .values(**key, **deltas)
+        .on_conflict_do_update(
+            index_elements=list(table.primary_key.columns),
+            # Column.onupdate is not applied to the DO UPDATE branch
+            set_={
+                **{col: table.c[col] + n for col, n in deltas.items()},
+                "updated_at": func.now(),
+            },
+        )
+    )
+    db.execute(stmt)
+
+
+def _count_rows(db: Session, recruiter_id: Optional[int] = None):
+    """
+    (recruiter_id -> recruiter_counters row, job_id -> job_counters row) counted
+    from jobs/resumes, for every recruiter or just `recruiter_id`.
+    """
+    recruiters: Dict[int, dict] = {}
+    jobs: Dict[int, dict] = {}
+    scope = [] if recruiter_id is None else [Job.recruiter_id == recruiter_id]
+
+    def _row(bucket, key, **extra):
+        if key not in bucket:
+            bucket[key] = {**extra, "total_resumes": 0, **{s: 0 for s in RESUME_STATUSES}}
+        return bucket[key]
+
+    for rid, total_jobs in db.execute(
+        select(Job.recruiter_id, func.count()).where(*scope).group_by(Job.recruiter_id)
+    ):
+        _row(recruiters, rid, recruiter_id=rid)["total_jobs"] = total_jobs
+
+    for job_id, rid in db.execute(select(Job.id, Job.recruiter_id).where(*scope)):
+        _row(jobs, job_id, job_id=job_id, recruiter_id=rid)
+
+    for job_id, rid, status, n in db.execute(
+        select(Job.id, Job.recruiter_id, func.lower(Resume.status), func.count())
+        .join(Resume, Resume.job_id == Job.id)
+        .where(*scope)
+        .group_by(Job.id, Job.recruiter_id, func.lower(Resume.status))
+    ):
+        column = status if status in RESUME_STATUSES else "pending"
+        for row in (
+            _row(jobs, job_id, job_id=job_id, recruiter_id=rid),
+            _row(recruiters, rid, recruiter_id=rid),
+        ):
+            row["total_resumes"] += n
+            row[column] += n
+
+    for row in recruiters.values():
+        row.setdefault("total_jobs", 0)
+    return recruiters, jobs
+
+
+def _recruiter_row(recruiters: Dict[int, dict], recruiter_id: int) -> dict:
+    return recruiters.get(recruiter_id) or {
+        "recruiter_id": recruiter_id,
+        "total_jobs": 0,
+        "total_resumes": 0,
+        **{s: 0 for s in RESUME_STATUSES},
+    }
+
+
+def count_recruiter(db: Session, recruiter_id: int) -> dict:
+    """A recruiter_counters row counted from jobs/resumes (read-only)."""
+    recruiters, _ = _count_rows(db, recruiter_id)
+    return _recruiter_row(recruiters, recruiter_id)
+
+
+def _seed_recruiter(db: Session, recruiter_id: int) -> bool:
+    """
+    Create the counters rows of a recruiter that has none, counted from the data
+    (including the caller's change). True if this transaction created them: the
+    change is then already counted and must not be bumped again.
+    """
+    exists = db.scalar(
+        select(RecruiterCounters.recruiter_id).where(
+            RecruiterCounters.recruiter_id == recruiter_id
+        )
+    )
+    if exists is not None:
+        return False
+    recruiters, jobs = _count_rows(db, recruiter_id)
+    row = _recruiter_row(recruiters, recruiter_id)
+    # a concurrent first write may win the insert: this one then bumps as usual
+    created = db.execute(
+        upsert_insert(db, RecruiterCounters).values(**row).on_conflict_do_nothing()
+    ).rowcount
+    if not created:
+        return False
+    if jobs:
+        db.execute(
+            upsert_insert(db, JobCounters).on_conflict_do_nothing(), list(jobs.values())
+        )
+    return True
+
+
+def _status_column(status: Optional[str]) -> str:
+    status = (status or "pending").lower()
+    if status not in RESUME_STATUSES:
+        raise ValueError(f"Unknown resume status: {status}")
+    return status
+
+
+def record_job_created(db: Session, recruiter_id: int, job_id: int) -> None:
+    if _seed_recruiter(db, recruiter_id):
+        return
+    _bump(db, RecruiterCounters, {"recruiter_id": recruiter_id}, {"total_jobs": 1})
+    db.execute(
+        upsert_insert(db, JobCounters)
+        .values(job_id=job_id, recruiter_id=recruiter_id)
+        .on_conflict_do_nothing()
+    )
+
+
+def record_jobs_created(db: Session, recruiter_id: int, job_ids: List[int]) -> None:
+    """Bulk variant of record_job_created (two statements for the whole batch)."""
+    if not job_ids or _seed_recruiter(db, recruiter_id):
+        return
+    _bump(db, RecruiterCounters, {"recruiter_id": recruiter_id}, {"total_jobs": len(job_ids)})
+    # executemany: one cached statement, not a freshly compiled N-row VALUES list
+    db.execute(
+        upsert_insert(db, JobCounters).on_conflict_do_nothing(),
+        [{"job_id": job_id, "recruiter_id": recruiter_id} for job_id in job_ids],
+    )
+
+
+def record_resumes_added(
+    db: Session, recruiter_id: int, job_id: int, status: str = "pending", count: int = 1
+) -> None:
+    deltas = {"total_resumes": count, _status_column(status): count}
+    if _seed_recruiter(db, recruiter_id):
+        return
+    _bump(db, RecruiterCounters, {"recruiter_id": recruiter_id}, deltas)
+    _bump(db, JobCounters, {"job_id": job_id, "recruiter_id": recruiter_id}, deltas)
+
+
+def record_resumes_removed(
+    db: Session, recruiter_id: int, job_id: int, status: str = "pending", count: int = 1
+) -> None:
+    record_resumes_added(db, recruiter_id, job_id, status, -count)
+
+
+def record_resume_status_change(
+    db: Session, recruiter_id: int, job_id: int, old_status: str, new_status: str
+) -> None:
+    old_col, new_col = _status_column(old_status), _status_column(new_status)
+    if old_col == new_col or _seed_recruiter(db, recruiter_id):
+        return
+    deltas = {old_col: -1, new_col: 1}
+    _bump(db, RecruiterCounters, {"recruiter_id": recruiter_id}, deltas)
+    _bump(db, JobCounters, {"job_id": job_id, "recruiter_id": recruiter_id}, deltas)
+
+
+def rebuild_counters(db: Session) -> Dict[str, int]:
+    """
+    Recompute both counter tables from jobs/resumes and replace their contents.
+    Runs in the caller's transaction (commit to apply).
+    """
+    recruiters, jobs = _count_rows(db)
+
+    db.execute(delete(JobCounters))
+    db.execute(delete(RecruiterCounters))
+    if recruiters:
+        db.execute(RecruiterCounters.__table__.insert(), list(recruiters.values()))
+    if jobs:
+        db.execute(JobCounters.__table__.insert(), list(jobs.values()))
+    return {"recruiters": len(recruiters), "jobs": len(jobs)}
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Maintain dashboard counters.")
+    parser.add_argument("command", choices=["rebuild"])
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        result = rebuild_counters(session)
+        session.commit()
+    print(f"[COUNTERS] Rebuilt counters: {result}")
@@ -0,0 +1,15 @@
+# app/utils/db_helpers.py
+"""Small SQL helpers shared by the app/utils modules."""
+from sqlalchemy.orm import Session
+
+
+def upsert_insert(db: Session, model):
+    """
+    `INSERT` for the session's dialect, with `on_conflict_do_nothing` /
+    `on_conflict_do_update` (Postgres and SQLite spell them the same way).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
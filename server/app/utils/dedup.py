@@ -0,0 +1,150 @@
+# app/utils/dedup.py
+"""
+Near-duplicate bookkeeping at resume ingest (see app/core/dedup.py).
+
+`index_resume_signatures` runs inside the add_resumes transaction: it probes
+the (company_id, bucket) index for LSH candidates, confirms them by signature
+similarity, assigns each new resume to a cluster and stores its signature and
+band buckets. Resumes without extractable text get no signature and are never
+reported as duplicates. Sync Session; async routes use `await db.run_sync(...)`.
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.dedup import (
+    DUPLICATE_THRESHOLD,
+    band_keys,
+    minhash,
+    pack_signature,
+    similarity,
+    unpack_signature,
+)
+from app.models import Job, Resume, ResumeLshBucket, ResumeSignature
+
+
+def index_resume_signatures(
+    db: Session, resumes: List[Resume], company_id: int
+) -> Dict[int, int]:
+    """
+    Store signatures/buckets for freshly inserted resumes.
+    Returns {resume_id: cluster_id} for resumes that are near-duplicates of an
+    earlier resume of the same company (including earlier ones in this batch).
+    """
+    signatures = {r.id: minhash(r.extracted_text) for r in resumes}
+    resumes = [r for r in resumes if signatures[r.id] is not None]
+    if not resumes:
+        return {}
+
+    keys = {r.id: band_keys(signatures[r.id]) for r in resumes}
+
+    # candidates already stored for this company: one indexed IN probe
+    all_keys = {k for ks in keys.values() for k in ks}
+    bucket_members: Dict[int, set] = defaultdict(set)
+    for bucket, resume_id in db.execute(
+        select(ResumeLshBucket.bucket, ResumeLshBucket.resume_id).where(
+            ResumeLshBucket.company_id == company_id,
+            ResumeLshBucket.bucket.in_(all_keys),
+        )
+    ):
+        bucket_members[bucket].add(resume_id)
+
+    known: Dict[int, tuple] = {}  # resume_id -> (signature, cluster_id)
+    candidate_ids = set().union(*bucket_members.values()) if bucket_members else set()
+    if candidate_ids:
+        for resume_id, blob, cluster_id in db.execute(
+            select(
+                ResumeSignature.resume_id,
+                ResumeSignature.signature,
+                ResumeSignature.cluster_id,
+            ).where(ResumeSignature.resume_id.in_(candidate_ids))
+        ):
+            known[resume_id] = (unpack_signature(blob), cluster_id)
+
+    duplicates: Dict[int, int] = {}
+    signature_rows, bucket_rows = [], []
+    for resume in sorted(resumes, key=lambda r: r.id):
+        sig = signatures[resume.id]
+        candidates = {c for k in keys[resume.id] for c in bucket_members.get(k, ())}
+
+        best_id, best_score = None, 0.0
+        for candidate in candidates:
+            if candidate not in known:
+                continue
+            score = similarity(sig, known[candidate][0])
+            if score >= DUPLICATE_THRESHOLD and (
+                score > best_score or (score == best_score and candidate < best_id)
+            ):
+                best_id, best_score = candidate, score
+
+        cluster_id = known[best_id][1] if best_id is not None else resume.id
+        if best_id is not None:
+            duplicates[resume.id] = cluster_id
+
+        # later resumes in this batch can match this one
+        known[resume.id] = (sig, cluster_id)
+        for k in keys[resume.id]:
+            bucket_members[k].add(resume.id)
+
+        signature_rows.append(
+            {
+                "resume_id": resume.id,
+                "company_id": company_id,
+                "cluster_id": cluster_id,
+                "signature": pack_signature(sig),
+            }
+        )
+        bucket_rows.extend(
+            {"company_id": company_id, "bucket": k, "resume_id": resume.id}
+            for k in keys[resume.id]
+        )
+
+    db.execute(insert(ResumeSignature), signature_rows)
+    db.execute(insert(ResumeLshBucket), bucket_rows)
+    return duplicates
+
+
+def list_duplicate_clusters(
+    db: Session, company_id: int, limit: int = 20, offset: int = 0
+) -> List[dict]:
+    """Clusters with 2+ resumes for a company, largest first."""
+    size = func.count().label("size")
+    clusters = db.execute(
+        select(ResumeSignature.cluster_id, size)
+        .where(ResumeSignature.company_id == company_id)
+        .group_by(ResumeSignature.cluster_id)
+        .having(func.count() > 1)
+        .order_by(size.desc(), ResumeSignature.cluster_id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+    if not clusters:
+        return []
+
+    members: Dict[int, list] = defaultdict(list)
+    for row in db.execute(
+        select(
+            ResumeSignature.cluster_id,
+            Resume.id,
+            Resume.job_id,
+            Job.title.label("job_title"),
+            Resume.status,
+            Resume.resume_url,
+            Resume.created_at,
+        )
+        .join(Resume, Resume.id == ResumeSignature.resume_id)
+        .join(Job, Job.id == Resume.job_id)
+        .where(
+            ResumeSignature.company_id == company_id,
+            ResumeSignature.cluster_id.in_([c.cluster_id for c in clusters]),
+        )
+        .order_by(Resume.id)
+    ):
+        members[row.cluster_id].append(row)
+
+    return [
+        {"cluster_id": c.cluster_id, "size": c.size, "resumes": members[c.cluster_id]}
+        for c in clusters
+    ]
@@ -0,0 +1,440 @@
+# app/utils/events.py
+"""
+Live pipeline updates pushed to dashboards over server-sent events, in place of
+polling.
+
+Writes stage compact delta events with `publish_event` (same scopes as the
+response cache: "recruiter:<id>", "company:<id>"); they are published once the
+caller's transaction commits and dropped on rollback. `event_stream` serves a
+text/event-stream of the topics a user may see:
+  - job_created            {job_id, title, recruiter_id}
+  - jobs_imported          {job_ids, recruiter_id}
+  - resumes_added          {job_id, resume_ids, status}
+  - resume_status_changed  {resume_id, job_id, from_status, to_status, changed_by}
+  - resync                 {}  events were missed (client buffer overflowed, replay
+                               window exceeded, broker reconnected): refetch once
+
+Every event has an id, increasing across the deployment. Each process keeps the
+last EVENTS_REPLAY_SIZE events per topic, so a reconnecting EventSource (which
+sends Last-Event-ID) gets what it missed, or a `resync` when that is no longer
+available.
+
+Backends (EVENTS_BACKEND):
+  - memory (default): in-process fan-out; correct for a single worker only
+  - redis: one Redis pub/sub channel shared by all workers (needs the optional
+    `redis` package and REDIS_URL); ids come from a Redis counter
+"""
+import asyncio
+import itertools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.logger import get_logger
+from app.core.metrics import Counter, Gauge, Histogram
+from app.utils.response_cache import REDIS_URL, company_scope, recruiter_scope
+
+EVENTS_ENABLED = os.getenv("EVENTS_ENABLED", "true").lower() in ("1", "true", "yes")
+EVENTS_BACKEND = os.getenv("EVENTS_BACKEND", "memory")
+EVENTS_REPLAY_SIZE = int(os.getenv("EVENTS_REPLAY_SIZE", "256"))
+EVENTS_REPLAY_TOPICS = int(os.getenv("EVENTS_REPLAY_TOPICS", "10000"))
+EVENTS_SUBSCRIBER_QUEUE = int(os.getenv("EVENTS_SUBSCRIBER_QUEUE", "1000"))
+EVENTS_MAX_SUBSCRIBERS = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "1000"))
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+# streams end after this long; the browser reconnects (Last-Event-ID) and is re-authenticated
+EVENTS_STREAM_MAX_SECONDS = float(os.getenv("EVENTS_STREAM_MAX_SECONDS", "600"))
+EVENTS_RETRY_MS = int(os.getenv("EVENTS_RETRY_MS", "2000"))
+
+logger = get_logger("events")
+
+EVENTS_PUBLISHED = Counter(
+    "events_published_total",
+    "Live update events published after commit.",
+    ["type"],
+)
+EVENTS_DROPPED = Counter(
+    "events_dropped_total",
+    "Live update streams that fell behind and were sent a resync instead.",
+    ["reason"],
+)
+EVENTS_DELIVERY_SECONDS = Histogram(
+    "events_delivery_seconds",
+    "Time from publish to fan-out to this process's subscribers.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+RESYNC = "resync"
+
+# (id, type, data) as delivered to subscribers
+Event = Tuple[int, str, Dict[str, Any]]
+
+
+class Subscriber:
+    """One open stream: a bounded queue owned by the event loop that serves it."""
+
+    def __init__(self, topics: Tuple[str, ...], loop: asyncio.AbstractEventLoop):
+        self.topics = topics
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=EVENTS_SUBSCRIBER_QUEUE)
+
+    def push(self, item: Optional[Event]) -> None:
+        """Enqueue from any thread; None ends the stream."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, item)
+        except RuntimeError:
+            pass  # loop already closed
+
+    def _put(self, item: Optional[Event]) -> None:
+        if item is not None and self.queue.full():
+            # a stalled client: replace the backlog with a single resync
+            EVENTS_DROPPED.inc(reason="overflow")
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            item = (item[0], RESYNC, {})
+        self.queue.put_nowait(item)
+
+
+class EventBroker:
+    """
+    Local fan-out plus the per-topic replay buffers. `dispatch` is called by the
+    backend for every event (from a commit hook or the Redis listener thread).
+    """
+
+    def __init__(self, horizon: int = 0):
+        self._subscribers: Dict[str, Set[Subscriber]] = {}
+        self._replay: "OrderedDict[str, Deque[Event]]" = OrderedDict()
+        # ids <= horizon may be missing from a topic's buffer
+        self._horizon: Dict[str, int] = {}
+        self._default_horizon = horizon
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._all_subscribers())
+
+    def _all_subscribers(self) -> Set[Subscriber]:
+        return {s for subs in self._subscribers.values() for s in subs}
+
+    def subscribe(
+        self, topics: Iterable[str], last_event_id: Optional[int] = None
+    ) -> Tuple[Subscriber, List[Event], int]:
+        """
+        Register a stream. Returns it with the events it missed since
+        `last_event_id` (or a single resync) and the id it is now caught up to.
+        """
+        subscriber = Subscriber(tuple(sorted(set(topics))), asyncio.get_running_loop())
+        with self._lock:
+            for topic in subscriber.topics:
+                self._subscribers.setdefault(topic, set()).add(subscriber)
+            horizon = max(self._horizon.get(t, self._default_horizon) for t in subscriber.topics)
+            buffered = [e for t in subscriber.topics for e in self._replay.get(t, ())]
+        cursor = max([horizon] + [e[0] for e in buffered])
+        if last_event_id is None:
+            return subscriber, [], cursor
+        if last_event_id < horizon:
+            return subscriber, [(cursor, RESYNC, {})], cursor
+        # an event sent to two topics of the same stream appears once
+        backlog = sorted({e[0]: e for e in buffered if e[0] > last_event_id}.values())
+        return subscriber, backlog, cursor
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            for topic in subscriber.topics:
+                subs = self._subscribers.get(topic)
+                if subs is not None:
+                    subs.discard(subscriber)
+                    if not subs:
+                        del self._subscribers[topic]
+
+    def dispatch(self, topics: Iterable[str], item: Event) -> None:
+        targets: Set[Subscriber] = set()
+        with self._lock:
+            for topic in topics:
+                self._remember(topic, item)
+                targets.update(self._subscribers.get(topic, ()))
+        for subscriber in targets:
+            subscriber.push(item)
+
+    def _remember(self, topic: str, item: Event) -> None:
+        buffer = self._replay.get(topic)
+        if buffer is None:
+            buffer = self._replay[topic] = deque()
+        self._replay.move_to_end(topic)
+        buffer.append(item)
+        if len(buffer) > EVENTS_REPLAY_SIZE:
+            self._horizon[topic] = buffer.popleft()[0]
+        while len(self._replay) > EVENTS_REPLAY_TOPICS:
+            evicted_topic, evicted = self._replay.popitem(last=False)
+            self._horizon.pop(evicted_topic, None)
+            if evicted:
+                self._default_horizon = max(self._default_horizon, evicted[-1][0])
+
+    def resync_all(self, horizon: int) -> None:
+        """Events may have been lost (e.g. broker reconnect): every stream refetches."""
+        with self._lock:
+            self._replay.clear()
+            self._horizon.clear()
+            self._default_horizon = max(self._default_horizon, horizon)
+            targets = self._all_subscribers()
+        for subscriber in targets:
+            subscriber.push((horizon, RESYNC, {}))
+
+    def close(self) -> None:
+        """End every open stream (clients reconnect elsewhere)."""
+        with self._lock:
+            targets = self._all_subscribers()
+        for subscriber in targets:
+            subscriber.push(None)
+
+
+class EventsBackend:
+    def __init__(self, broker: EventBroker):
+        self.broker = broker
+
+    def publish(self, topics: List[str], event_type: str, data: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.broker.close()
+
+    @staticmethod
+    def _deliver(broker: EventBroker, message: Dict[str, Any], event_id: int) -> None:
+        EVENTS_DELIVERY_SECONDS.observe(max(0.0, time.time() - message["ts"]))
+        broker.dispatch(message["topics"], (event_id, message["type"], message["data"]))
+
+
+class MemoryBackend(EventsBackend):
+    """Direct fan-out; ids continue from the wall clock, so they grow across restarts."""
+
+    def __init__(self):
+        start = time.time_ns() // 1000
+        super().__init__(EventBroker(horizon=start))
+        self._ids = itertools.count(start + 1)
+
+    def publish(self, topics: List[str], event_type: str, data: Dict[str, Any]) -> None:
+        message = {"topics": topics, "type": event_type, "data": data, "ts": time.time()}
+        self._deliver(self.broker, message, next(self._ids))
+
+
+# INCR the id and publish "<id> <json>" in one round trip
+_PUBLISH_SCRIPT = """
+local id = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', KEYS[2], id .. ' ' .. ARGV[1])
+return id
+"""
+
+
+class RedisBackend(EventsBackend):
+    """
+    Shared pub/sub: every process subscribes to one channel and fans out to its
+    own streams. A listener thread reconnects with backoff and sends a resync to
+    local streams after a gap.
+    """
+
+    def __init__(self, url: str, prefix: str = "hirehub:ev:"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("EVENTS_BACKEND=redis requires the 'redis' package.")
+        self.client = redis.Redis.from_url(url)
+        self.channel = f"{prefix}channel"
+        self.sequence = f"{prefix}seq"
+        self._publish = self.client.register_script(_PUBLISH_SCRIPT)
+        super().__init__(EventBroker(horizon=self._current_id()))
+        self._stop = threading.Event()
+        self._listening = threading.Event()
+        self._thread = threading.Thread(target=self._listen, name="events-listener", daemon=True)
+        self._thread.start()
+        # publish-after-subscribe: don't miss events committed right after startup
+        self._listening.wait(timeout=5)
+
+    def _current_id(self) -> int:
+        value = self.client.get(self.sequence)
+        return int(value) if value is not None else 0
+
+    def publish(self, topics: List[str], event_type: str, data: Dict[str, Any]) -> None:
+        message = {"topics": topics, "type": event_type, "data": data, "ts": time.time()}
+        self._publish(keys=[self.sequence, self.channel], args=[json.dumps(message)])
+
+    def _listen(self) -> None:
+        backoff = 0.5
+        first = True
+        while not self._stop.is_set():
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                if not first:
+                    self.broker.resync_all(self._current_id())
+                first = False
+                self._listening.set()
+                backoff = 0.5
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    event_id, _, payload = message["data"].partition(b" ")
+                    self._deliver(self.broker, json.loads(payload), int(event_id))
+            except Exception:
+                logger.exception("Event listener disconnected; reconnecting")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                pubsub.close()
+
+    def close(self) -> None:
+        self._stop.set()
+        super().close()
+
+
+_backend: Optional[EventsBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_events_backend() -> EventsBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if EVENTS_BACKEND == "memory":
+                    _backend = MemoryBackend()
+                elif EVENTS_BACKEND == "redis":
+                    _backend = RedisBackend(REDIS_URL)
+                else:
+                    raise RuntimeError(f"Unknown EVENTS_BACKEND: {EVENTS_BACKEND}")
+    return _backend
+
+
+def shutdown_events() -> None:
+    if _backend is not None:
+        _backend.close()
+
+
+# --- publishing ---------------------------------------------------------------------
+
+
+def publish_event(
+    db: Session,
+    event_type: str,
+    data: Dict[str, Any],
+    recruiter_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+) -> None:
+    """Publish `data` to the given scopes once the caller's transaction commits."""
+    if not EVENTS_ENABLED:
+        return
+    topics = []
+    if recruiter_id is not None:
+        topics.append(recruiter_scope(recruiter_id))
+    if company_id is not None:
+        topics.append(company_scope(company_id))
+    if topics:
+        db.info.setdefault("events_pending", []).append((topics, event_type, data))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    pending = session.info.pop("events_pending", None)
+    if not pending:
+        return
+    backend = get_events_backend()
+    for topics, event_type, data in pending:
+        try:
+            backend.publish(topics, event_type, data)
+        except Exception:
+            # the write is committed; streams catch up through replay / resync
+            logger.exception("Could not publish event", extra={"type": event_type})
+            continue
+        EVENTS_PUBLISHED.inc(type=event_type)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop("events_pending", None)
+
+
+# --- serving ------------------------------------------------------------------------
+
+
+def _format(item: Event) -> str:
+    event_id, event_type, data = item
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+
+
+def _last_event_id(request: Request) -> Optional[int]:
+    raw = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
+
+async def event_stream(request: Request, topics: List[str]) -> StreamingResponse:
+    """
+    text/event-stream of `topics`, starting after Last-Event-ID (header, or the
+    `last_event_id` query parameter) when given. Comment lines keep idle
+    connections open every EVENTS_HEARTBEAT_SECONDS.
+    """
+    if not EVENTS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Live updates are disabled."
+        )
+    broker = get_events_backend().broker
+    if broker.subscriber_count >= EVENTS_MAX_SUBSCRIBERS:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live update streams, please retry shortly.",
+            headers={"Retry-After": "5"},
+        )
+    last_event_id = _last_event_id(request)
+
+    async def body() -> AsyncIterator[str]:
+        # subscribed once the response starts, so the finally below always runs
+        subscriber, backlog, cursor = broker.subscribe(topics, last_event_id)
+        deadline = time.monotonic() + EVENTS_STREAM_MAX_SECONDS
+        try:
+            if backlog:
+                yield f"retry: {EVENTS_RETRY_MS}\n\n"
+            else:
+                # id-only message: a reconnect resumes from here even if nothing was sent
+                yield f"retry: {EVENTS_RETRY_MS}\nid: {cursor}\n\n"
+            for item in backlog:
+                yield _format(item)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    item = await asyncio.wait_for(
+                        subscriber.queue.get(), min(EVENTS_HEARTBEAT_SECONDS, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if item is None:
+                    return
+                yield _format(item)
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+Gauge(
+    "events_subscribers",
+    "Open live update streams in this process.",
+    callback=lambda: {(): _backend.broker.subscriber_count if _backend is not None else 0},
+)
@@ -0,0 +1,272 @@
+# app/utils/firebase_tasks.py
+"""
+Firebase Admin side effects (custom claims, refresh-token revocation) off the
+request path.
+
+Routes call `enqueue_set_claims` / `enqueue_revoke_tokens`, which only add a
+firebase_outbox row to the caller's transaction. Once that commits, the row is
+handed to `firebase_tasks`: FIREBASE_TASK_WORKERS threads fed by a bounded
+queue (FIREBASE_TASK_QUEUE_SIZE). A row is deleted when its call succeeds; a
+failed call is rescheduled with exponential backoff and parked
+(next_attempt_at = NULL) after FIREBASE_TASK_MAX_ATTEMPTS.
+
+A poller re-queues due rows every FIREBASE_OUTBOX_POLL_SECONDS (and once at
+start-up), so retries, queue overflow and tasks left behind by a restart all
+take the same path. Claiming a row sets next_attempt_at to now + lease with a
+conditional UPDATE, so several processes can share the outbox without running
+one task twice at the same time.
+
+Metrics: firebase_task_queue_depth, firebase_tasks_total{kind,outcome}.
+"""
+import os
+import queue
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, event, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.config.db import SessionLocal
+from app.core.firebase import firebase_auth
+from app.core.logger import get_logger
+from app.core.metrics import Counter, Gauge
+from app.models import FirebaseTask
+
+FIREBASE_TASK_WORKERS = int(os.getenv("FIREBASE_TASK_WORKERS", "4"))
+FIREBASE_TASK_QUEUE_SIZE = int(os.getenv("FIREBASE_TASK_QUEUE_SIZE", "1000"))
+FIREBASE_TASK_MAX_ATTEMPTS = int(os.getenv("FIREBASE_TASK_MAX_ATTEMPTS", "10"))
+FIREBASE_TASK_BACKOFF_SECONDS = float(os.getenv("FIREBASE_TASK_BACKOFF_SECONDS", "5"))
+FIREBASE_TASK_MAX_BACKOFF_SECONDS = float(
+    os.getenv("FIREBASE_TASK_MAX_BACKOFF_SECONDS", "600")
+)
+# must exceed the slowest Firebase call, or a slow task may be claimed twice
+FIREBASE_TASK_LEASE_SECONDS = float(os.getenv("FIREBASE_TASK_LEASE_SECONDS", "60"))
+FIREBASE_OUTBOX_POLL_SECONDS = float(os.getenv("FIREBASE_OUTBOX_POLL_SECONDS", "5"))
+
+SET_CLAIMS = "set_claims"
+REVOKE_TOKENS = "revoke_tokens"
+
+log = get_logger("firebase_tasks")
+
+FIREBASE_TASKS = Counter(
+    "firebase_tasks_total",
+    "Firebase side-effect task outcomes (ok, retry, failed, deferred).",
+    ["kind", "outcome"],
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _backoff(attempts: int) -> float:
+    delay = FIREBASE_TASK_BACKOFF_SECONDS * 2 ** (attempts - 1)
+    # jitter spreads retries of a burst that failed together (e.g. a Firebase outage)
+    return min(delay, FIREBASE_TASK_MAX_BACKOFF_SECONDS) * random.uniform(0.75, 1.0)
+
+
+def _call(kind: str, uid: str, payload) -> None:
+    if kind == SET_CLAIMS:
+        firebase_auth.set_custom_user_claims(uid, payload)
+    elif kind == REVOKE_TOKENS:
+        firebase_auth.revoke_refresh_tokens(uid)
+    else:
+        raise ValueError(f"Unknown Firebase task kind: {kind}")
+
+
+class FirebaseTaskRunner:
+    """Bounded worker pool + outbox poller; `start()` at app start-up."""
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self._queue: "queue.Queue[Optional[int]]" = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.workers):
+            self._threads.append(
+                threading.Thread(target=self._work, name=f"firebase-task-{i}", daemon=True)
+            )
+        self._threads.append(
+            threading.Thread(target=self._poll, name="firebase-outbox-poller", daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop after in-flight calls; queued tasks stay in the outbox for the next start."""
+        if not self._threads:
+            return
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in range(self.workers):
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, task_id: int, kind: str) -> bool:
+        """Queue a claimed task; if the pool is stopped or full the poller picks it up later."""
+        if not self._threads:
+            return False
+        try:
+            self._queue.put_nowait(task_id)
+            return True
+        except queue.Full:
+            FIREBASE_TASKS.inc(kind=kind, outcome="deferred")
+            return False
+
+    # --- workers ----------------------------------------------------------------------
+
+    def _work(self) -> None:
+        while True:
+            task_id = self._queue.get()
+            if task_id is None:
+                return
+            try:
+                self.run_task(task_id)
+            except Exception as e:
+                # DB trouble: the lease expires and the poller retries the task
+                log.error("firebase task crashed", extra={"task_id": task_id, "error": str(e)})
+
+    def run_task(self, task_id: int) -> None:
+        # no connection is held during the Firebase call
+        with SessionLocal() as db:
+            task = db.get(FirebaseTask, task_id)
+            if task is None:
+                return  # already done
+            kind, uid, payload, attempts = task.kind, task.uid, task.payload, task.attempts
+
+        try:
+            _call(kind, uid, payload)
+        except Exception as e:
+            attempts += 1
+            parked = attempts >= FIREBASE_TASK_MAX_ATTEMPTS
+            next_attempt_at = None if parked else _utcnow() + timedelta(seconds=_backoff(attempts))
+            with SessionLocal() as db:
+                db.execute(
+                    update(FirebaseTask)
+                    .where(FirebaseTask.id == task_id)
+                    .values(
+                        attempts=attempts,
+                        next_attempt_at=next_attempt_at,
+                        last_error=str(e)[:2000],
+                    )
+                )
+                db.commit()
+            FIREBASE_TASKS.inc(kind=kind, outcome="failed" if parked else "retry")
+            extra = {"task_id": task_id, "kind": kind, "uid": uid, "attempts": attempts, "error": str(e)}
+            if parked:
+                log.error("firebase task failed permanently", extra=extra)
+            else:
+                log.warning("firebase task failed; will retry", extra=extra)
+            return
+
+        with SessionLocal() as db:
+            db.execute(delete(FirebaseTask).where(FirebaseTask.id == task_id))
+            db.commit()
+        FIREBASE_TASKS.inc(kind=kind, outcome="ok")
+
+    # --- poller -----------------------------------------------------------------------
+
+    def _poll(self) -> None:
+        wait = 0.0  # replay the outbox right away at start-up
+        while not self._stop.wait(wait):
+            wait = FIREBASE_OUTBOX_POLL_SECONDS
+            try:
+                self.claim_due()
+            except Exception as e:
+                log.warning("firebase outbox poll failed", extra={"error": str(e)})
+
+    def claim_due(self) -> int:
+        """Lease due tasks (as many as fit the queue) and queue them."""
+        free = self._queue.maxsize - self._queue.qsize()
+        if free <= 0:
+            return 0
+        now = _utcnow()
+        with SessionLocal() as db:
+            due = (
+                select(FirebaseTask.id)
+                .where(FirebaseTask.next_attempt_at <= now)
+                .order_by(FirebaseTask.next_attempt_at)
+                .limit(free)
+            )
+            # re-checks next_attempt_at, so a row another process claimed is skipped
+            claimed = db.execute(
+                update(FirebaseTask)
+                .where(FirebaseTask.id.in_(due.scalar_subquery()), FirebaseTask.next_attempt_at <= now)
+                .values(next_attempt_at=now + timedelta(seconds=FIREBASE_TASK_LEASE_SECONDS))
+                .returning(FirebaseTask.id, FirebaseTask.kind)
+                .execution_options(synchronize_session=False)
+            ).all()
+            db.commit()
+        for task_id, kind in claimed:
+            self.submit(task_id, kind)
+        return len(claimed)
+
+
+firebase_tasks = FirebaseTaskRunner(FIREBASE_TASK_WORKERS, FIREBASE_TASK_QUEUE_SIZE)
+
+Gauge(
+    "firebase_task_queue_depth",
+    "Firebase side-effect tasks waiting for a worker in this process.",
+    callback=lambda: {(): firebase_tasks.queue_depth()},
+)
+
+
+# --- enqueueing (request path) --------------------------------------------------------
+
+
+def _enqueue(db: Session, kind: str, uid: str, payload=None) -> FirebaseTask:
+    task = FirebaseTask(
+        kind=kind,
+        uid=uid,
+        payload=payload,
+        attempts=0,
+        # leased by this process; handed to a worker on commit
+        next_attempt_at=_utcnow() + timedelta(seconds=FIREBASE_TASK_LEASE_SECONDS),
+    )
+    db.add(task)
+    db.info.setdefault("firebase_tasks_pending", []).append((task, kind))
+    return task
+
+
+def enqueue_set_claims(db: Session, uid: str, claims: dict) -> FirebaseTask:
+    """Set custom claims once the caller's transaction commits."""
+    return _enqueue(db, SET_CLAIMS, uid, claims)
+
+
+def enqueue_revoke_tokens(db: Session, uid: str) -> FirebaseTask:
+    """Revoke the uid's refresh tokens once the caller's transaction commits."""
+    return _enqueue(db, REVOKE_TOKENS, uid)
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_committed_tasks(session: Session) -> None:
+    for task, kind in session.info.pop("firebase_tasks_pending", ()):
+        # identity, not task.id: attributes are expired and can't be loaded here
+        identity = inspect(task).identity
+        if identity is not None:
+            firebase_tasks.submit(identity[0], kind)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tasks(session: Session) -> None:
+    session.info.pop("firebase_tasks_pending", None)
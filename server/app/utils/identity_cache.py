@@ -0,0 +1,219 @@
+# app/utils/identity_cache.py
+"""
+In-process cache of who a `firebase_uid` is: a small read-only snapshot of the
+user row plus its company name (`CurrentUser`), so authenticated requests skip
+the users/companies lookup.
+
+Entries live until whichever comes first:
+  - IDENTITY_CACHE_TTL_SECONDS (bounds staleness across processes and for
+    changes made outside the ORM, e.g. manual SQL)
+  - a committed ORM change to that user, or to the user's company, in this
+    process (see the Session listeners below)
+  - LRU eviction beyond IDENTITY_CACHE_MAX_ENTRIES
+
+Unknown uids are not cached, so a user is found as soon as registration commits.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import Gauge
+from app.models import Company, User
+
+IDENTITY_CACHE_ENABLED = os.getenv("IDENTITY_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+IDENTITY_CACHE_TTL_SECONDS = int(os.getenv("IDENTITY_CACHE_TTL_SECONDS", "60"))
+IDENTITY_CACHE_MAX_ENTRIES = int(os.getenv("IDENTITY_CACHE_MAX_ENTRIES", "10000"))
+
+
+class CurrentUser:
+    """Identity of the authenticated user; what `get_current_user*` return."""
+
+    __slots__ = ("id", "firebase_uid", "name", "email", "role", "company_id", "company_name")
+
+    def __init__(self, id, firebase_uid, name, email, role, company_id, company_name):
+        self.id = id
+        self.firebase_uid = firebase_uid
+        self.name = name
+        self.email = email
+        self.role = role
+        self.company_id = company_id
+        self.company_name = company_name
+
+    def __repr__(self) -> str:
+        return f"CurrentUser(id={self.id}, role={self.role!r}, company_id={self.company_id})"
+
+
+class IdentityCache:
+    """Thread-safe TTL'd LRU of CurrentUser snapshots keyed by firebase_uid."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[CurrentUser, float]]" = OrderedDict()
+        # bumped by every invalidation; a snapshot read before one is not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, uid: str) -> Optional[CurrentUser]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is None:
+                self.misses += 1
+                return None
+            identity, expires_at = entry
+            if now >= expires_at:
+                del self._entries[uid]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(uid)
+            self.hits += 1
+            return identity
+
+    def put(self, identity: CurrentUser, generation: int) -> None:
+        """Store a snapshot read from the DB when the cache was at `generation`."""
+        with self._lock:
+            if generation != self._generation:
+                return  # a user/company changed while it was being read
+            self._entries[identity.firebase_uid] = (
+                identity,
+                time.monotonic() + self.ttl_seconds,
+            )
+            self._entries.move_to_end(identity.firebase_uid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, uids=(), company_ids=()) -> None:
+        company_ids = set(company_ids)
+        with self._lock:
+            self._generation += 1
+            stale = set(uids)
+            if company_ids:
+                stale.update(
+                    uid
+                    for uid, (identity, _) in self._entries.items()
+                    if identity.company_id in company_ids
+                )
+            for uid in stale:
+                if self._entries.pop(uid, None) is not None:
+                    self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": IDENTITY_CACHE_ENABLED,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+identity_cache = IdentityCache(
+    max_entries=IDENTITY_CACHE_MAX_ENTRIES,
+    ttl_seconds=IDENTITY_CACHE_TTL_SECONDS,
+)
+
+
+def get_cached_identity(uid: str) -> Optional[CurrentUser]:
+    if not IDENTITY_CACHE_ENABLED:
+        return None
+    return identity_cache.get(uid)
+
+
+def fetch_identity(db: Session, uid: str) -> Optional[CurrentUser]:
+    """One users LEFT JOIN companies query; caches the snapshot. None if not registered."""
+    generation = identity_cache.generation
+    row = db.execute(
+        select(
+            User.id,
+            User.firebase_uid,
+            User.name,
+            User.email,
+            User.role,
+            User.company_id,
+            Company.name.label("company_name"),
+        )
+        .outerjoin(Company, User.company_id == Company.id)
+        .where(User.firebase_uid == uid)
+    ).first()
+    if row is None:
+        return None
+
+    identity = CurrentUser(*row)
+    if IDENTITY_CACHE_ENABLED:
+        identity_cache.put(identity, generation)
+    return identity
+
+
+def load_identity(db: Session, uid: str) -> Optional[CurrentUser]:
+    """CurrentUser for `uid`: cached, else fetched. Sync; async callers use `db.run_sync`."""
+    return get_cached_identity(uid) or fetch_identity(db, uid)
+
+
+# --- invalidation -----------------------------------------------------------------
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_identity_changes(session: Session, flush_context) -> None:
+    changed = [*session.new, *session.dirty, *session.deleted]
+    if not any(isinstance(obj, (User, Company)) for obj in changed):
+        return
+    uids, company_ids = session.info.setdefault("identity_stale", (set(), set()))
+    for obj in changed:
+        if isinstance(obj, User):
+            uids.add(obj.firebase_uid)
+        elif isinstance(obj, Company) and obj.id is not None:
+            company_ids.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_identities(session: Session) -> None:
+    stale = session.info.pop("identity_stale", None)
+    if stale is not None:
+        identity_cache.invalidate(*stale)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_identity_changes(session: Session) -> None:
+    session.info.pop("identity_stale", None)
+
+
+def _cache_stats():
+    stats = identity_cache.stats()
+    return {(key,): stats[key] for key in ("hits", "misses", "evictions", "size")}
+
+
+Gauge(
+    "identity_cache_events",
+    "Current-user snapshot cache counters (cumulative) and current size.",
+    ["event"],
+    callback=_cache_stats,
+)
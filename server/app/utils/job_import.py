@@ -0,0 +1,216 @@
+# app/utils/job_import.py
+"""
+Bulk job import from CSV or JSON Lines (POST /recruiter/jobs/import).
+
+The upload is read as a stream, one record at a time, and every record is
+validated with JobCreate (the same rules as POST /recruiter/jobs). Valid rows
+are inserted JOB_IMPORT_BATCH at a time with a multi-row `INSERT ... RETURNING`;
+each batch commits together with its term vectors, embeddings, counter updates
+and cache invalidation, so memory stays flat however large the file is and a
+failing batch only loses its own rows.
+
+  - CSV: header row with `title` and `description` (case-insensitive; other
+    columns are ignored)
+  - JSONL: one `{"title": ..., "description": ...}` object per line
+
+Errors are reported per record with the line it ends on.
+"""
+import csv
+import io
+import json
+import os
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config.db import SessionLocal
+from app.models import Job
+from app.schemas.jobs import JobCreate
+from app.utils.counters import record_jobs_created
+from app.utils.matching import index_jobs_terms
+from app.utils.events import publish_event
+from app.utils.response_cache import mark_stale
+from app.utils.vectors import index_jobs_embeddings
+
+JOB_IMPORT_BATCH = int(os.getenv("JOB_IMPORT_BATCH", "500"))
+JOB_IMPORT_MAX_ROWS = int(os.getenv("JOB_IMPORT_MAX_ROWS", "50000"))
+# the report lists at most this many errors; `failed` still counts all of them
+JOB_IMPORT_MAX_ERRORS = int(os.getenv("JOB_IMPORT_MAX_ERRORS", "1000"))
+
+IMPORT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+REQUIRED_COLUMNS = ("title", "description")
+
+# csv's default (128 KiB) is too small for long descriptions
+csv.field_size_limit(10 * 1024 * 1024)
+
+
+class ImportFormatError(ValueError):
+    """The file as a whole can't be imported (unknown format, missing columns)."""
+
+
+class _BadRecord:
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def detect_format(filename: Optional[str], explicit: Optional[str] = None) -> str:
+    if explicit:
+        return explicit
+    extension = os.path.splitext(filename or "")[1].lower()
+    fmt = IMPORT_FORMATS.get(extension)
+    if fmt is None:
+        raise ImportFormatError(
+            "Unknown file type; upload a .csv or .jsonl file or pass ?format=csv|jsonl."
+        )
+    return fmt
+
+
+def open_records(stream: BinaryIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Lazily yield (line, record) from an upload. The CSV header is checked here,
+    before anything is imported; raises ImportFormatError.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "jsonl":
+        return _jsonl_records(text)
+
+    reader = csv.DictReader(text)
+    if reader.fieldnames is None:
+        return iter(())
+    reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames]
+    missing = [c for c in REQUIRED_COLUMNS if c not in reader.fieldnames]
+    if missing:
+        raise ImportFormatError(f"CSV header is missing column(s): {', '.join(missing)}.")
+    return ((reader.line_num, record) for record in reader)
+
+
+def _jsonl_records(text: io.TextIOBase) -> Iterator[Tuple[int, Any]]:
+    for line_no, line in enumerate(text, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as e:
+            yield line_no, _BadRecord(f"Invalid JSON: {e}")
+
+
+def _validation_messages(e: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in err['loc']) or 'record'}: {err['msg']}"
+        for err in e.errors()
+    ]
+
+
+class _Report:
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def error(self, line: int, messages: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < JOB_IMPORT_MAX_ERRORS:
+            self.errors.append({"line": line, "errors": messages})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def _insert_batch(
+    db: Session,
+    batch: List[Tuple[int, JobCreate]],
+    company_id: int,
+    recruiter_id: int,
+    report: _Report,
+) -> None:
+    try:
+        job_ids = db.scalars(
+            insert(Job).returning(Job.id, sort_by_parameter_order=True),
+            [
+                {
+                    "title": job.title,
+                    "description": job.description,
+                    "company_id": company_id,
+                    "recruiter_id": recruiter_id,
+                }
+                for _, job in batch
+            ],
+        ).all()
+        index_jobs_terms(db, [(job_id, job.description) for job_id, (_, job) in zip(job_ids, batch)])
+        index_jobs_embeddings(
+            db, [(job_id, company_id, job.description) for job_id, (_, job) in zip(job_ids, batch)]
+        )
+        record_jobs_created(db, recruiter_id, job_ids)
+        mark_stale(db, recruiter_id=recruiter_id, company_id=company_id)
+        publish_event(
+            db,
+            "jobs_imported",
+            {"job_ids": list(job_ids), "recruiter_id": recruiter_id},
+            recruiter_id=recruiter_id,
+            company_id=company_id,
+        )
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        for line, _ in batch:
+            report.error(line, [f"Could not save: {e.__class__.__name__}"])
+        return
+    report.created += len(job_ids)
+
+
+def import_jobs(
+    db: Session,
+    records: Iterator[Tuple[int, Any]],
+    company_id: int,
+    recruiter_id: int,
+) -> Dict[str, Any]:
+    """Validate and insert `records` (from open_records); returns the import report."""
+    report = _Report()
+    batch: List[Tuple[int, JobCreate]] = []
+    seen = 0
+    line = 0
+    try:
+        for line, record in records:
+            seen += 1
+            if seen > JOB_IMPORT_MAX_ROWS:
+                report.error(line, [f"Too many rows (max {JOB_IMPORT_MAX_ROWS}); rest of file skipped."])
+                break
+            if isinstance(record, _BadRecord):
+                report.error(line, [record.message])
+                continue
+            if not isinstance(record, dict):
+                report.error(line, ["Expected an object with title and description."])
+                continue
+            try:
+                job = JobCreate.model_validate(record)
+            except ValidationError as e:
+                report.error(line, _validation_messages(e))
+                continue
+            batch.append((line, job))
+            if len(batch) >= JOB_IMPORT_BATCH:
+                _insert_batch(db, batch, company_id, recruiter_id, report)
+                batch = []
+    except (UnicodeDecodeError, csv.Error) as e:
+        # unreadable from here on; rows read so far are still imported
+        report.error(line + 1, [f"Could not read file: {e}; rest of file skipped."])
+
+    if batch:
+        _insert_batch(db, batch, company_id, recruiter_id, report)
+    return report.as_dict()
+
+
+def run_import(stream: BinaryIO, fmt: str, company_id: int, recruiter_id: int) -> Dict[str, Any]:
+    """Blocking entry point for a worker thread: parse + import with its own Session."""
+    records = open_records(stream, fmt)
+    with SessionLocal() as db:
+        return import_jobs(db, records, company_id, recruiter_id)
@@ -0,0 +1,148 @@
+# app/utils/matching.py
+"""
+Persistence of matching term vectors (app/core/matching.py).
+
+Like app/utils/counters.py these helpers take a sync Session and only add
+rows to the caller's transaction, so vectors are written together with the
+job/resume they describe. Async routes use `await db.run_sync(...)`.
+
+The read helpers never write: a job or resume without a stored vector (written
+before vectors existed) is vectorized in memory for that request. Persist them
+once with:
+    python -m app.utils.matching backfill
+"""
+import argparse
+from typing import List, Optional, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.matching import pack_vector, term_vector
+from app.models import Job, JobTermVector, Resume, ResumeTermVector
+
+
+def _job_term_vector(job: Job) -> JobTermVector:
+    ids, counts, length = term_vector(job.description)
+    return JobTermVector(job_id=job.id, terms=pack_vector(ids, counts), length=length)
+
+
+def index_job_terms(db: Session, job: Job) -> JobTermVector:
+    """Compute and stage the term vector for a (flushed) job."""
+    return db.merge(_job_term_vector(job))
+
+
+def index_jobs_terms(db: Session, jobs: List[Tuple[int, str]]) -> None:
+    """Bulk variant of index_job_terms for freshly inserted (job_id, description) pairs."""
+    rows = []
+    for job_id, description in jobs:
+        ids, counts, length = term_vector(description)
+        rows.append({"job_id": job_id, "terms": pack_vector(ids, counts), "length": length})
+    if rows:
+        db.execute(insert(JobTermVector), rows)
+
+
+def index_resume_terms(db: Session, resume: Resume) -> ResumeTermVector:
+    """Compute and stage the term vector for a (flushed) resume."""
+    ids, counts, length = term_vector(resume.extracted_text)
+    vector = ResumeTermVector(
+        resume_id=resume.id,
+        job_id=resume.job_id,
+        terms=pack_vector(ids, counts),
+        length=length,
+    )
+    return db.merge(vector)
+
+
+def index_resumes_terms(db: Session, resumes: List[Resume]) -> None:
+    """Bulk variant of index_resume_terms for freshly inserted resumes (one INSERT)."""
+    rows = []
+    for resume in resumes:
+        ids, counts, length = term_vector(resume.extracted_text)
+        rows.append(
+            {
+                "resume_id": resume.id,
+                "job_id": resume.job_id,
+                "terms": pack_vector(ids, counts),
+                "length": length,
+            }
+        )
+    if rows:
+        db.execute(insert(ResumeTermVector), rows)
+
+
+def _missing_resumes(db: Session, *filters, limit: Optional[int] = None) -> List[Resume]:
+    query = (
+        select(Resume)
+        .options(selectinload(Resume.body))
+        .outerjoin(ResumeTermVector, ResumeTermVector.resume_id == Resume.id)
+        .where(ResumeTermVector.resume_id.is_(None), *filters)
+    )
+    return db.scalars(query.limit(limit)).all()
+
+
+def load_job_vector(db: Session, job: Job) -> JobTermVector:
+    """Stored job vector; computed (not persisted) for jobs created before vectors existed."""
+    vector = db.get(JobTermVector, job.id)
+    if vector is None:
+        vector = _job_term_vector(job)
+    return vector
+
+
+def load_resume_vectors(db: Session, job_id: int) -> List[Tuple[int, bytes, int]]:
+    """
+    (resume_id, packed terms, length) for every resume of a job, by resume id.
+    Resumes written before vectors existed are vectorized in memory.
+    """
+    rows = [
+        tuple(r)
+        for r in db.execute(
+            select(
+                ResumeTermVector.resume_id, ResumeTermVector.terms, ResumeTermVector.length
+            ).where(ResumeTermVector.job_id == job_id)
+        )
+    ]
+    for resume in _missing_resumes(db, Resume.job_id == job_id):
+        ids, counts, length = term_vector(resume.extracted_text)
+        rows.append((resume.id, pack_vector(ids, counts), length))
+    rows.sort(key=lambda r: r[0])
+    return rows
+
+
+def backfill_term_vectors(db: Session, batch_size: int = 500) -> Tuple[int, int]:
+    """Store vectors of jobs and resumes that have none; returns the counts."""
+    jobs = 0
+    while True:
+        batch = db.execute(
+            select(Job.id, Job.description)
+            .outerjoin(JobTermVector, JobTermVector.job_id == Job.id)
+            .where(JobTermVector.job_id.is_(None))
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        index_jobs_terms(db, [tuple(row) for row in batch])
+        db.commit()
+        jobs += len(batch)
+
+    resumes = 0
+    while True:
+        batch = _missing_resumes(db, limit=batch_size)
+        if not batch:
+            break
+        index_resumes_terms(db, batch)
+        db.commit()
+        db.expunge_all()
+        resumes += len(batch)
+    return jobs, resumes
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Matching term vector maintenance.")
+    parser.add_argument("command", choices=["backfill"])
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        jobs, resumes = backfill_term_vectors(session)
+    print(f"[MATCHING] Stored term vectors of {jobs} jobs and {resumes} resumes")
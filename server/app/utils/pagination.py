@@ -0,0 +1,116 @@
+# app/utils/pagination.py
+"""
+Keyset (cursor) pagination on (created_at, id), newest first.
+
+The cursor is an opaque urlsafe-base64 JSON pair of the last row's
+(created_at, id). Each page is `WHERE (created_at, id) < cursor ORDER BY
+created_at DESC, id DESC LIMIT n + 1`, which is a range scan on a
+(..., created_at, id) index regardless of how deep the client pages.
+
+The raw column is compared, never an expression of it, so the index applies.
+Rows with a NULL created_at sort where a descending index scan puts them:
+first on Postgres, last on SQLite (see _nulls_first); their cursors carry null.
+"""
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+from app.config.db import engine
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    raw = json.dumps([created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Parse a cursor from a previous page. Raises 400 if it was tampered with."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_raw, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = None if created_raw is None else datetime.fromisoformat(created_raw)
+        return created_at, int(row_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        )
+
+
+def _nulls_first() -> bool:
+    # where ORDER BY created_at DESC puts NULLs without an explicit NULLS FIRST/LAST
+    # (which would stop the index from providing the order)
+    return engine.dialect.name != "sqlite"
+
+
+def _bound(value: datetime) -> datetime:
+    """`value` as comparable with the raw created_at column."""
+    if engine.dialect.name == "sqlite" and value.tzinfo is not None:
+        # stored as naive UTC text (see _sqlite_now in app/config/db.py)
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def apply_keyset(stmt, created_col, id_col, cursor: Optional[str], limit: int):
+    """Add keyset filter, newest-first ordering and LIMIT limit+1 to `stmt`."""
+    if cursor:
+        cursor_created, cursor_id = decode_cursor(cursor)
+        if cursor_created is None:
+            after = and_(created_col.is_(None), id_col < cursor_id)
+            if _nulls_first():
+                after = or_(after, created_col.is_not(None))
+        else:
+            value = _bound(cursor_created)
+            after = or_(
+                created_col < value,
+                and_(created_col == value, id_col < cursor_id),
+            )
+            if not _nulls_first():
+                after = or_(after, created_col.is_(None))
+        stmt = stmt.where(after)
+    return stmt.order_by(created_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+def newest_first(rows: Sequence[Any]) -> List[Any]:
+    """Sort rows (with `created_at` and `id`) in apply_keyset's order, in Python."""
+    nulls_first = _nulls_first()
+
+    def key(row):
+        if row.created_at is None:
+            return (nulls_first, datetime.min, row.id)
+        created = row.created_at
+        if created.tzinfo is not None:
+            created = created.astimezone(timezone.utc).replace(tzinfo=None)
+        return (not nulls_first, created, row.id)
+
+    return sorted(rows, key=key, reverse=True)
+
+
+def split_page(rows: Sequence[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim the extra look-ahead row and build next_cursor from the last row kept.
+    Rows must expose `created_at` and `id`.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
+
+
+def apply_created_range(
+    stmt, created_col, created_from: Optional[datetime], created_to: Optional[datetime]
+):
+    """Restrict to created_from <= created_at < created_to (either bound optional)."""
+    if created_from is not None:
+        stmt = stmt.where(created_col >= _bound(created_from))
+    if created_to is not None:
+        stmt = stmt.where(created_col < _bound(created_to))
+    return stmt
@@ -0,0 +1,181 @@
+# app/utils/pipeline.py
+"""
+Shortlist pipeline: board reads and status moves.
+
+Board columns are read with one keyset range scan per stage on
+ix_resumes_job_status_created (job_id, status, created_at, id); all requested
+stages go to the database as a single UNION ALL, so a board costs one round
+trip and touches only `limit + 1` index entries per column, however many
+applicants the job has. Column totals come from job_counters.
+
+Status moves are conditional (`UPDATE ... WHERE status = <old>`), so two
+concurrent moves of the same resume can't both apply and skew the counters.
+Every function takes a sync Session; async routes use `await db.run_sync(...)`.
+"""
+from typing import Dict, Iterable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, select, union_all, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import JobCounters, Resume, ResumeStatusEvent
+from app.models.resumes import RESUME_STATUSES, STATUS_TRANSITIONS
+from app.utils.counters import record_resume_status_change
+from app.utils.pagination import apply_keyset, newest_first, split_page
+from app.utils.events import publish_event
+from app.utils.response_cache import mark_stale
+
+
+class InvalidTransition(ValueError):
+    pass
+
+
+class StaleStatus(ValueError):
+    """The resume left `from_status` concurrently."""
+
+
+def _column_stmt(job_id: int, stage: str, cursor: Optional[str], limit: int):
+    stmt = select(
+        Resume.id,
+        Resume.status,
+        Resume.resume_url,
+        Resume.created_at,
+        literal(stage).label("stage"),
+    ).where(Resume.job_id == job_id, Resume.status == stage)
+    return apply_keyset(stmt, Resume.created_at, Resume.id, cursor, limit)
+
+
+def load_board(
+    db: Session,
+    job_id: int,
+    stages: Iterable[str] = RESUME_STATUSES,
+    limit: int = 20,
+) -> Dict[str, dict]:
+    """First page of every requested stage: {stage: {count, resumes, next_cursor}}."""
+    stages = list(stages)
+    subqueries = [_column_stmt(job_id, s, None, limit).subquery() for s in stages]
+    stmt = union_all(*(select(sq) for sq in subqueries))
+
+    rows_by_stage = {s: [] for s in stages}
+    for row in db.execute(stmt):
+        rows_by_stage[row.stage].append(row)
+
+    counters = db.get(JobCounters, job_id)
+    board = {}
+    for stage in stages:
+        # union_all doesn't keep per-branch order; restore newest-first
+        rows = newest_first(rows_by_stage[stage])
+        page, next_cursor = split_page(rows, limit)
+        board[stage] = {
+            "count": getattr(counters, stage, 0) or 0,
+            "resumes": page,
+            "next_cursor": next_cursor,
+        }
+    return board
+
+
+def load_stage(
+    db: Session, job_id: int, stage: str, cursor: Optional[str], limit: int
+) -> dict:
+    """One page of a single board column."""
+    rows = db.execute(_column_stmt(job_id, stage, cursor, limit)).all()
+    page, next_cursor = split_page(rows, limit)
+    return {"resumes": page, "next_cursor": next_cursor}
+
+
+def change_resume_status(
+    db: Session,
+    resume: Resume,
+    new_status: str,
+    changed_by: Optional[int],
+    note: Optional[str] = None,
+) -> ResumeStatusEvent:
+    """
+    Move `resume` to `new_status`, record the transition and update counters.
+    Raises InvalidTransition / StaleStatus; caller commits.
+    """
+    old_status = resume.status
+    if new_status not in STATUS_TRANSITIONS.get(old_status, ()):
+        raise InvalidTransition(f"Cannot move a resume from {old_status} to {new_status}.")
+
+    result = db.execute(
+        update(Resume)
+        .where(Resume.id == resume.id, Resume.status == old_status)
+        .values(status=new_status)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise StaleStatus("Resume status changed concurrently; reload and retry.")
+    # already written by the UPDATE; refresh the loaded object without dirtying it
+    set_committed_value(resume, "status", new_status)
+
+    record_resume_status_change(
+        db, resume.job.recruiter_id, resume.job_id, old_status, new_status
+    )
+    mark_stale(db, recruiter_id=resume.job.recruiter_id, company_id=resume.job.company_id)
+    publish_event(
+        db,
+        "resume_status_changed",
+        {
+            "resume_id": resume.id,
+            "job_id": resume.job_id,
+            "from_status": old_status,
+            "to_status": new_status,
+            "changed_by": changed_by,
+        },
+        recruiter_id=resume.job.recruiter_id,
+        company_id=resume.job.company_id,
+    )
+    event = ResumeStatusEvent(
+        resume_id=resume.id,
+        job_id=resume.job_id,
+        from_status=old_status,
+        to_status=new_status,
+        changed_by=changed_by,
+        note=note,
+    )
+    db.add(event)
+    return event
+
+
+def list_status_history(db: Session, resume_id: int) -> list:
+    """Rows of (from_status, to_status, changed_by, note, created_at), oldest first."""
+    return db.execute(
+        select(
+            ResumeStatusEvent.from_status,
+            ResumeStatusEvent.to_status,
+            ResumeStatusEvent.changed_by,
+            ResumeStatusEvent.note,
+            ResumeStatusEvent.created_at,
+        )
+        .where(ResumeStatusEvent.resume_id == resume_id)
+        .order_by(ResumeStatusEvent.id)
+    ).all()
+
+
+def parse_stages(stages: Optional[str]) -> list:
+    """`?stages=shortlisted,interviewed` -> validated list (all stages if omitted)."""
+    if not stages:
+        return list(RESUME_STATUSES)
+    requested = list(dict.fromkeys(s.strip().lower() for s in stages.split(",") if s.strip()))
+    if not requested:
+        return list(RESUME_STATUSES)
+    unknown = [s for s in requested if s not in RESUME_STATUSES]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown stage(s): {', '.join(unknown)}. Allowed: {', '.join(RESUME_STATUSES)}.",
+        )
+    return requested
+
+
+def parse_stage(stage: str) -> str:
+    """One stage of a path like `/board/{stage}`; 400 unless it is exactly one known stage."""
+    stage = stage.strip().lower()
+    if stage not in RESUME_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown stage: {stage or '(empty)'}. Allowed: {', '.join(RESUME_STATUSES)}.",
+        )
+    return stage
@@ -0,0 +1,86 @@
+# app/utils/rate_limit.py
+"""
+Per-user and per-IP token-bucket rate limits (app/core/admission.py) for the
+expensive entry points: /check-user (Firebase token verification, sign-up)
+and the upload endpoints (resume bulk upload, job import).
+
+Limits are "N/SECONDS" (N requests per SECONDS, bursts up to N); "0" disables:
+  - RATE_LIMIT_CHECK_USER_UID (default 10/60), RATE_LIMIT_CHECK_USER_IP (30/60)
+  - RATE_LIMIT_UPLOADS_UID (20/60), RATE_LIMIT_UPLOADS_IP (60/60)
+
+Buckets are per process. The client IP is the socket peer unless
+RATE_LIMIT_TRUST_FORWARDED is set, in which case the first X-Forwarded-For
+hop is used (only behind a proxy that sets it).
+"""
+import os
+from typing import Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.core.admission import RATE_LIMITED, TokenBuckets, parse_rate, retry_after
+from app.core.metrics import Gauge
+from app.utils.auth import require_recruiter_async
+
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+_DEFAULTS = {
+    ("check_user", "uid"): "10/60",
+    ("check_user", "ip"): "30/60",
+    ("uploads", "uid"): "20/60",
+    ("uploads", "ip"): "60/60",
+}
+
+# (bucket, key type) -> buckets; missing = unlimited
+_limits: Dict[Tuple[str, str], TokenBuckets] = {}
+for (_bucket, _key), _default in _DEFAULTS.items():
+    _rate = parse_rate(os.getenv(f"RATE_LIMIT_{_bucket.upper()}_{_key.upper()}", _default))
+    if _rate is not None:
+        _limits[(_bucket, _key)] = TokenBuckets(f"{_bucket}:{_key}", *_rate)
+
+
+def client_ip(request: Request) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def enforce_rate_limit(bucket: str, key_type: str, key: Optional[str]) -> None:
+    """Spend one token for `key`; 429 with Retry-After when the bucket is empty."""
+    buckets = _limits.get((bucket, key_type))
+    if buckets is None or not key:
+        return
+    wait = buckets.take(key)
+    if wait > 0:
+        RATE_LIMITED.inc(bucket=bucket, key=key_type)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please slow down.",
+            headers={"Retry-After": retry_after(wait)},
+        )
+
+
+def check_user_ip_limit(request: Request) -> None:
+    """Dependency for /check-user; runs before the Firebase token is verified."""
+    enforce_rate_limit("check_user", "ip", client_ip(request))
+
+
+async def upload_rate_limit(
+    request: Request, current_user=Depends(require_recruiter_async)
+) -> None:
+    """Dependency for the upload endpoints: per recruiter uid and per IP."""
+    enforce_rate_limit("uploads", "ip", client_ip(request))
+    enforce_rate_limit("uploads", "uid", current_user.firebase_uid)
+
+
+Gauge(
+    "rate_limit_keys",
+    "Keys (uids / IPs) tracked per token-bucket limit (LRU-bounded).",
+    ["bucket", "key"],
+    callback=lambda: {key: len(buckets) for key, buckets in _limits.items()},
+)
@@ -0,0 +1,281 @@
+# app/utils/response_cache.py
+"""
+Conditional-GET response cache for polled dashboard endpoints.
+
+Every cached response depends on one or more *scopes* ("recruiter:<id>",
+"company:<id>"), each with a version stamp. Writes bump the stamps of the
+scopes they touch once their transaction commits (`mark_stale`). The ETag of a
+response is derived from (route, user, path and query params, backend epoch, scope
+versions, TTL window), so:
+  - If-None-Match matching the current ETag -> 304, nothing is rebuilt
+  - otherwise the serialized body is looked up under the same key, and only
+    built (queries + serialization) on a miss
+The epoch changes whenever version stamps may have been lost (process restart
+for memory, an emptied Redis), so an old ETag can't match reset versions, and
+the TTL window changes every RESPONSE_CACHE_TTL_SECONDS, which bounds how long
+a 304 can hide changes made outside the app.
+
+Backends (RESPONSE_CACHE_BACKEND):
+  - memory (default): per-process LRU; correct for a single worker only, since
+    version bumps are not shared between processes
+  - redis: shared versions + bodies for multi-worker deployments (needs the
+    optional `redis` package and REDIS_URL)
+"""
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config.db import primary_reads
+from app.core.metrics import Counter
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "5000"))
+# upper bound on staleness for changes made outside the app (manual SQL, CLI rebuilds)
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+RESPONSE_CACHE_EVENTS = Counter(
+    "response_cache_events_total",
+    "Conditional-GET cache outcomes (not_modified, hit, miss).",
+    ["route", "outcome"],
+)
+
+
+def recruiter_scope(recruiter_id: int) -> str:
+    return f"recruiter:{recruiter_id}"
+
+
+def company_scope(company_id: int) -> str:
+    return f"company:{company_id}"
+
+
+class CacheBackend:
+    def get_versions(self, scopes: List[str]) -> Tuple[str, List[int]]:
+        """(epoch, version of each scope); versions are only comparable within an epoch."""
+        raise NotImplementedError
+
+    def bump_versions(self, scopes: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, body: bytes, ttl: int) -> None:
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """Thread-safe LRU of response bodies plus a version dict."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        # versions restart at 0 with the process
+        self._epoch = uuid.uuid4().hex
+        self._lock = threading.Lock()
+
+    def get_versions(self, scopes: List[str]) -> Tuple[str, List[int]]:
+        with self._lock:
+            return self._epoch, [self._versions.get(s, 0) for s in scopes]
+
+    def bump_versions(self, scopes: Iterable[str]) -> None:
+        with self._lock:
+            for s in scopes:
+                self._versions[s] = self._versions.get(s, 0) + 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            body, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (body, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._epoch = uuid.uuid4().hex
+
+
+class RedisBackend(CacheBackend):
+    """Shared backend: versions are INCR counters, bodies are SETEX values."""
+
+    def __init__(self, url: str, prefix: str = "hirehub:rc:"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the 'redis' package."
+            )
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get_versions(self, scopes: List[str]) -> Tuple[str, List[int]]:
+        epoch_key = f"{self.prefix}epoch"
+        epoch, *values = self.client.mget([epoch_key] + [f"{self.prefix}v:{s}" for s in scopes])
+        if epoch is None:
+            # new or emptied Redis: the counters started over, start a new epoch
+            self.client.set(epoch_key, uuid.uuid4().hex, nx=True)
+            epoch = self.client.get(epoch_key)
+        return epoch.decode("ascii"), [int(v) if v is not None else 0 for v in values]
+
+    def bump_versions(self, scopes: Iterable[str]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for s in scopes:
+            pipe.incr(f"{self.prefix}v:{s}")
+        pipe.execute()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}b:{key}")
+
+    def set(self, key: str, body: bytes, ttl: int) -> None:
+        self.client.setex(f"{self.prefix}b:{key}", ttl, body)
+
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if RESPONSE_CACHE_BACKEND == "memory":
+                    _backend = MemoryBackend(RESPONSE_CACHE_MAX_ENTRIES)
+                elif RESPONSE_CACHE_BACKEND == "redis":
+                    _backend = RedisBackend(REDIS_URL)
+                else:
+                    raise RuntimeError(
+                        f"Unknown RESPONSE_CACHE_BACKEND: {RESPONSE_CACHE_BACKEND}"
+                    )
+    return _backend
+
+
+# --- invalidation -----------------------------------------------------------------
+
+
+def mark_stale(
+    db: Session, recruiter_id: Optional[int] = None, company_id: Optional[int] = None
+) -> None:
+    """Bump the given scopes once the caller's transaction commits."""
+    scopes = db.info.setdefault("response_cache_stale", set())
+    if recruiter_id is not None:
+        scopes.add(recruiter_scope(recruiter_id))
+    if company_id is not None:
+        scopes.add(company_scope(company_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_stale_scopes(session: Session) -> None:
+    scopes = session.info.pop("response_cache_stale", None)
+    if scopes and RESPONSE_CACHE_ENABLED:
+        get_cache_backend().bump_versions(sorted(scopes))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_scopes(session: Session) -> None:
+    session.info.pop("response_cache_stale", None)
+
+
+# --- serving ------------------------------------------------------------------------
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # weak comparison, as required for If-None-Match
+    candidates = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+@lru_cache(maxsize=None)
+def _adapter(model) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def _render(model, payload: Any, exclude_unset: bool) -> bytes:
+    adapter = _adapter(model)
+    value = adapter.validate_python(payload, from_attributes=True)
+    return adapter.dump_json(value, exclude_unset=exclude_unset)
+
+
+async def cached_json(
+    request: Request,
+    user_key,
+    scopes: List[str],
+    build: Callable[[], Awaitable[Any]],
+    model,
+    exclude_unset: bool = False,
+) -> Response:
+    """
+    Serve `await build()`, serialized as `model` (a schema from app.schemas), with
+    an ETag; answers 304 / a cached body when none of `scopes` changed since.
+    """
+    route = request.scope.get("route")
+    route_label = getattr(route, "path", request.url.path)
+    if not RESPONSE_CACHE_ENABLED:
+        body = _render(model, await build(), exclude_unset)
+        return Response(body, media_type="application/json")
+
+    backend = get_cache_backend()
+    epoch, versions = backend.get_versions(scopes)
+    # route_label is the template ("/jobs/{job_id}/board"): the path params tell jobs apart
+    path_params = sorted(request.path_params.items())
+    params = sorted(request.query_params.multi_items())
+    window = int(time.time() // RESPONSE_CACHE_TTL_SECONDS)
+    raw_key = repr(
+        (route_label, user_key, path_params, params, scopes, epoch, versions, window)
+    )
+    key = hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+    etag = f'W/"{key[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        RESPONSE_CACHE_EVENTS.inc(route=route_label, outcome="not_modified")
+        return Response(status_code=304, headers=headers)
+
+    body = backend.get(key)
+    if body is not None:
+        RESPONSE_CACHE_EVENTS.inc(route=route_label, outcome="hit")
+        return Response(body, media_type="application/json", headers=headers)
+
+    RESPONSE_CACHE_EVENTS.inc(route=route_label, outcome="miss")
+    # keyed by the versions read *before* building: a write that commits meanwhile
+    # bumps the version, so this body can never be served for the newer state.
+    # That only holds if the build sees every write committed before the versions
+    # were read, so it reads from the primary, never a possibly lagging replica.
+    with primary_reads():
+        body = _render(model, await build(), exclude_unset)
+    backend.set(key, body, RESPONSE_CACHE_TTL_SECONDS)
+    return Response(body, media_type="application/json", headers=headers)
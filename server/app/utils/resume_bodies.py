@@ -0,0 +1,83 @@
+# app/utils/resume_bodies.py
+"""
+One-off migration of resume text into compressed `resume_bodies` rows.
+
+Databases created before resume text moved off the `resumes` row still have
+`resumes.extracted_text` (and, on Postgres, `resumes.search_vector`). This
+copies the text into resume_bodies in batches, then drops the old columns:
+    python -m app.utils.resume_bodies migrate
+    python -m app.utils.search reindex      # rebuild search vectors (Postgres)
+"""
+import argparse
+
+from sqlalchemy import inspect, insert, select, table, column, text
+from sqlalchemy.orm import Session
+
+from app.config.db import Base
+from app.core.compression import DEFAULT_CODEC, compress_text
+from app.models import ResumeBody
+
+
+def migrate_resume_bodies(db: Session, batch_size: int = 1000) -> int:
+    """Copy legacy resumes.extracted_text into resume_bodies. Returns rows copied."""
+    bind = db.get_bind()
+    legacy_columns = {c["name"] for c in inspect(bind).get_columns("resumes")}
+    if "extracted_text" not in legacy_columns:
+        return 0
+
+    Base.metadata.create_all(bind=bind, tables=[ResumeBody.__table__])
+    legacy = table("resumes", column("id"), column("extracted_text"))
+
+    copied = 0
+    last_id = 0
+    while True:
+        batch = db.execute(
+            select(legacy.c.id, legacy.c.extracted_text)
+            .where(legacy.c.id > last_id)
+            .order_by(legacy.c.id)
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        existing = set(
+            db.scalars(
+                select(ResumeBody.resume_id).where(
+                    ResumeBody.resume_id.in_([row.id for row in batch])
+                )
+            )
+        )
+        rows = [
+            {
+                "resume_id": row.id,
+                "codec": DEFAULT_CODEC,
+                "data": compress_text(row.extracted_text or "", DEFAULT_CODEC),
+                "text_length": len(row.extracted_text or ""),
+            }
+            for row in batch
+            if row.id not in existing
+        ]
+        if rows:
+            db.execute(insert(ResumeBody), rows)
+        db.commit()
+        copied += len(rows)
+        last_id = batch[-1].id
+
+    if bind.dialect.name == "postgresql":
+        db.execute(text("DROP INDEX IF EXISTS ix_resumes_search_vector"))
+    for name in ("search_vector", "extracted_text"):
+        if name in legacy_columns:
+            db.execute(text(f"ALTER TABLE resumes DROP COLUMN {name}"))
+    db.commit()
+    return copied
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Resume body storage maintenance.")
+    parser.add_argument("command", choices=["migrate"])
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        copied = migrate_resume_bodies(session)
+    print(f"[RESUME BODIES] Copied {copied} resume texts into resume_bodies")
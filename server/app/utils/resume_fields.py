@@ -0,0 +1,291 @@
+# app/utils/resume_fields.py
+"""
+Structured resume fields (app/core/fields.py): written at ingest, read by the
+faceted filters under /recruiter/resumes.
+
+`index_resumes_fields` runs inside the add_resumes transaction and stores one
+resume_profiles row plus the resume_skills rows of every new resume. Reads
+never parse text: each filter is a range on a (company_id, ...) index and
+`facet_counts` is a single statement, a UNION ALL of GROUP BYs over the
+filtered set. Sync Session; async routes use `await db.run_sync(...)`.
+
+The skills table is seeded from SKILLS at app startup (or by the `seed`
+command); read paths only look ids up, so a GET never writes or gets pinned to
+the primary. Back-fill resumes written before this existed (--reparse: all of
+them, e.g. after extending the dictionaries):
+    python -m app.utils.resume_fields seed
+    python -m app.utils.resume_fields backfill [--reparse]
+"""
+import argparse
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import (
+    String,
+    case,
+    cast,
+    delete,
+    event,
+    false,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.fields import EDUCATION_LEVELS, SKILLS, extract_fields
+from app.models import Resume, ResumeProfile, ResumeSkill, Skill
+from app.utils.db_helpers import upsert_insert
+
+EXPERIENCE_BUCKETS = ("0-1", "1-3", "3-5", "5-10", "10+")
+
+_skill_ids: Dict[str, int] = {}
+_skill_ids_lock = threading.Lock()
+
+
+def seed_skills(db: Session) -> Dict[str, int]:
+    """
+    Insert the SKILLS missing from the skills table in the caller's transaction
+    (idempotent); returns slug -> skills.id, cached once that commits.
+    """
+    db.execute(
+        upsert_insert(db, Skill).on_conflict_do_nothing(index_elements=[Skill.slug]),
+        [{"slug": slug, "name": name} for slug, (name, _) in SKILLS.items()],
+    )
+    ids = dict(db.execute(select(Skill.slug, Skill.id)).all())
+    db.info["skill_ids_seeded"] = ids
+    return ids
+
+
+def skill_ids(db: Session) -> Dict[str, int]:
+    """
+    slug -> skills.id, read-only (seed_skills fills the table); cached once
+    every skill is present.
+    """
+    if len(_skill_ids) >= len(SKILLS):
+        return _skill_ids
+    ids = dict(db.execute(select(Skill.slug, Skill.id)).all())
+    # rows seeded by this (uncommitted) transaction are cached by the commit hook
+    if len(ids) >= len(SKILLS) and "skill_ids_seeded" not in db.info:
+        with _skill_ids_lock:
+            _skill_ids.update(ids)
+    return ids
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_seeded_skills(session: Session) -> None:
+    ids = session.info.pop("skill_ids_seeded", None)
+    if ids:
+        with _skill_ids_lock:
+            _skill_ids.update(ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_seeded_skills(session: Session) -> None:
+    session.info.pop("skill_ids_seeded", None)
+
+
+# --- write path -------------------------------------------------------------------
+
+
+def index_resumes_fields(db: Session, resumes: List[Resume]) -> None:
+    """Parse freshly inserted resumes and stage their profile/skill rows."""
+    if not resumes:
+        return
+    ids = skill_ids(db)
+    if len(ids) < len(SKILLS):
+        # not seeded yet (e.g. a script that never started the app)
+        ids = seed_skills(db)
+    profiles, skills = [], []
+    for resume in resumes:
+        fields = extract_fields(resume.extracted_text)
+        profiles.append(
+            {
+                "resume_id": resume.id,
+                "company_id": resume.company_id,
+                "job_id": resume.job_id,
+                "experience_years": fields.experience_years,
+                "location_city": fields.city,
+                "location_country": fields.country,
+                "education_level": fields.education_level,
+            }
+        )
+        skills.extend(
+            {
+                "resume_id": resume.id,
+                "skill_id": ids[slug],
+                "company_id": resume.company_id,
+                "job_id": resume.job_id,
+            }
+            for slug in fields.skills
+        )
+    db.execute(insert(ResumeProfile), profiles)
+    if skills:
+        db.execute(insert(ResumeSkill), skills)
+
+
+# --- filters and facets -----------------------------------------------------------
+
+
+def profile_filters(
+    db: Session,
+    company_id: int,
+    job_id: Optional[int] = None,
+    skills: Sequence[str] = (),
+    min_experience: Optional[float] = None,
+    max_experience: Optional[float] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+    min_education: Optional[int] = None,
+) -> list:
+    """WHERE clauses on ResumeProfile; `skills` (slugs) must all be present."""
+    clauses = [ResumeProfile.company_id == company_id]
+    if job_id is not None:
+        clauses.append(ResumeProfile.job_id == job_id)
+    if min_experience is not None:
+        clauses.append(ResumeProfile.experience_years >= min_experience)
+    if max_experience is not None:
+        clauses.append(ResumeProfile.experience_years <= max_experience)
+    if country:
+        clauses.append(ResumeProfile.location_country == country)
+    if city:
+        clauses.append(ResumeProfile.location_city == city)
+    if min_education is not None:
+        clauses.append(ResumeProfile.education_level >= min_education)
+    if skills:
+        ids = skill_ids(db)
+        for slug in skills:
+            if slug not in ids:
+                clauses.append(false())  # not seeded: no resume can have it
+                continue
+            # one (company_id, skill_id) index range per required skill
+            clauses.append(
+                ResumeProfile.resume_id.in_(
+                    select(ResumeSkill.resume_id).where(
+                        ResumeSkill.company_id == company_id,
+                        ResumeSkill.skill_id == ids[slug],
+                    )
+                )
+            )
+    return clauses
+
+
+def facet_counts(db: Session, clauses: list) -> Dict[str, list]:
+    """
+    Counts of the resumes matching `clauses` (from profile_filters) per skill,
+    experience bucket, country, city and education level, in one query.
+    """
+    matched = select(
+        ResumeProfile.resume_id,
+        ResumeProfile.experience_years,
+        ResumeProfile.location_country,
+        ResumeProfile.location_city,
+        ResumeProfile.education_level,
+    ).where(*clauses).cte("matched")
+    count = func.count().label("count")
+
+    years = matched.c.experience_years
+    bucket = case(
+        (years.is_(None), "unknown"),
+        (years < 1, EXPERIENCE_BUCKETS[0]),
+        (years < 3, EXPERIENCE_BUCKETS[1]),
+        (years < 5, EXPERIENCE_BUCKETS[2]),
+        (years < 10, EXPERIENCE_BUCKETS[3]),
+        else_=EXPERIENCE_BUCKETS[4],
+    )
+    education = func.coalesce(cast(matched.c.education_level, String), "unknown")
+    country = func.coalesce(matched.c.location_country, "unknown")
+    city = func.coalesce(matched.c.location_city, "unknown")
+
+    def grouped(facet: str, value, source=matched):
+        return (
+            select(literal(facet).label("facet"), value.label("value"), count)
+            .select_from(source)
+            .group_by(value)
+        )
+
+    statement = union_all(
+        select(literal("total").label("facet"), literal("").label("value"), count)
+        .select_from(matched),
+        grouped(
+            "skills",
+            Skill.slug,
+            matched.join(ResumeSkill, ResumeSkill.resume_id == matched.c.resume_id).join(
+                Skill, Skill.id == ResumeSkill.skill_id
+            ),
+        ),
+        grouped("experience", bucket),
+        grouped("countries", country),
+        grouped("cities", city),
+        grouped("education", education),
+    )
+
+    facets: Dict[str, list] = {"total": 0}
+    for facet in ("skills", "experience", "countries", "cities", "education"):
+        facets[facet] = []
+    for facet, value, n in db.execute(statement):
+        if facet == "total":
+            facets["total"] = n
+            continue
+        label = value
+        if facet == "skills":
+            label = SKILLS[value][0] if value in SKILLS else value
+        elif facet == "education" and value != "unknown":
+            value = EDUCATION_LEVELS[int(value)]
+            label = value.replace("_", " ").title()
+        facets[facet].append({"value": value, "label": label, "count": n})
+
+    for facet in ("skills", "countries", "cities"):
+        facets[facet].sort(key=lambda f: (-f["count"], f["value"]))
+    order = {v: i for i, v in enumerate(("unknown",) + EXPERIENCE_BUCKETS + EDUCATION_LEVELS)}
+    for facet in ("experience", "education"):
+        facets[facet].sort(key=lambda f: order[f["value"]])
+    return facets
+
+
+# --- maintenance ------------------------------------------------------------------
+
+
+def backfill_fields(db: Session, reparse: bool = False, batch_size: int = 1000) -> int:
+    """Parse resumes that have no profile row (all of them with reparse); returns the count."""
+    if reparse:
+        db.execute(delete(ResumeSkill))
+        db.execute(delete(ResumeProfile))
+        db.commit()
+
+    done = 0
+    while True:
+        batch = db.scalars(
+            select(Resume)
+            .options(selectinload(Resume.body))
+            .outerjoin(ResumeProfile, ResumeProfile.resume_id == Resume.id)
+            .where(ResumeProfile.resume_id.is_(None), Resume.company_id.is_not(None))
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        index_resumes_fields(db, batch)
+        db.commit()
+        db.expunge_all()
+        done += len(batch)
+    return done
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Structured resume fields maintenance.")
+    parser.add_argument("command", choices=["seed", "backfill"])
+    parser.add_argument("--reparse", action="store_true", help="re-parse every resume")
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        if args.command == "seed":
+            seeded = seed_skills(session)
+            session.commit()
+            print(f"[RESUME FIELDS] {len(seeded)} skills in the skills table")
+        else:
+            done = backfill_fields(session, reparse=args.reparse)
+            print(f"[RESUME FIELDS] Parsed {done} resumes")
@@ -0,0 +1,131 @@
+# app/utils/resume_files.py
+"""
+Serving stored resume files (app/core/storage.py) and their text previews.
+
+`file_response` never copies file bytes through the worker when it can avoid it:
+  - s3: 307 to a pre-signed GET; the bucket answers Range requests itself
+  - local + STORAGE_ACCEL_REDIRECT_PREFIX: X-Accel-Redirect, nginx sendfiles
+  - local: FileResponse (Range / multi-range, If-Range), which hands the whole
+    file to the server with the ASGI pathsend extension where supported
+
+Previews are the first RESUME_PREVIEW_CHARS of the extracted text; resume text
+never changes, so they are served through the response cache with no scopes.
+
+Remove stored objects no resume references (e.g. from failed uploads) once
+they are older than the grace period:
+    python -m app.utils.resume_files gc [--grace-hours 24]
+"""
+import argparse
+import os
+import time
+
+from fastapi import HTTPException, status
+from fastapi.responses import FileResponse, RedirectResponse, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.storage import (
+    STORAGE_ACCEL_REDIRECT_PREFIX,
+    StorageBackend,
+    content_type,
+    get_storage,
+)
+from app.models import Resume, ResumeBody
+
+RESUME_PREVIEW_CHARS = int(os.getenv("RESUME_PREVIEW_CHARS", "2000"))
+# resume -> file never changes; the same browser may reuse it for a day
+_FILE_CACHE_CONTROL = "private, max-age=86400"
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume file not found.")
+
+
+def file_response(resume_id: int, resume_url: str) -> Response:
+    """Response serving the stored file of a resume (access already checked)."""
+    storage = get_storage()
+    try:
+        key = storage.key_from_url(resume_url)
+    except ValueError:
+        raise _not_found()
+    filename = f"resume-{resume_id}{os.path.splitext(key)[1]}"
+
+    # pre-signing is a local HMAC computation, no request to the bucket
+    url = storage.download_url(key, filename)
+    if url is not None:
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    path = storage.local_path(key)
+    if path is None or not os.path.isfile(path):
+        raise _not_found()
+    headers = {
+        "Content-Disposition": f'inline; filename="{filename}"',
+        "Cache-Control": _FILE_CACHE_CONTROL,
+    }
+    if STORAGE_ACCEL_REDIRECT_PREFIX:
+        headers["X-Accel-Redirect"] = STORAGE_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + key
+        return Response(media_type=content_type(key), headers=headers)
+    return FileResponse(path, media_type=content_type(key), headers=headers)
+
+
+def load_preview(db: Session, resume_id: int) -> dict:
+    body = db.get(ResumeBody, resume_id)
+    text = body.text if body is not None else ""
+    return {
+        "resume_id": resume_id,
+        "text": text[:RESUME_PREVIEW_CHARS],
+        "text_length": len(text),
+        "truncated": len(text) > RESUME_PREVIEW_CHARS,
+    }
+
+
+# --- maintenance ------------------------------------------------------------------
+
+
+def collect_garbage(
+    db: Session, storage: StorageBackend, grace_seconds: float, batch_size: int = 500
+) -> int:
+    """Delete content-addressed objects no resume references; returns the count."""
+    cutoff = time.time() - grace_seconds
+    removed = 0
+
+    def sweep(batch):
+        nonlocal removed
+        urls = {storage.url_for(key): key for key in batch}
+        referenced = set(
+            db.scalars(select(Resume.resume_url).where(Resume.resume_url.in_(list(urls))))
+        )
+        for url, key in urls.items():
+            if url in referenced:
+                continue
+            # re-check: an upload may have refreshed it since the listing
+            modified = storage.last_modified(key)
+            if modified is not None and modified <= cutoff:
+                storage.delete(key)
+                removed += 1
+
+    batch = []
+    for key, modified in storage.iter_keys("blobs/"):
+        # recent objects may belong to an upload whose rows are not committed yet
+        if modified > cutoff:
+            continue
+        batch.append(key)
+        if len(batch) >= batch_size:
+            sweep(batch)
+            batch = []
+    if batch:
+        sweep(batch)
+    return removed
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Resume file storage maintenance.")
+    parser.add_argument("command", choices=["gc"])
+    parser.add_argument("--grace-hours", type=float, default=24.0)
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        removed = collect_garbage(session, get_storage(), args.grace_hours * 3600)
+    print(f"[RESUME FILES] Removed {removed} unreferenced files")
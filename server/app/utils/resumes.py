@@ -0,0 +1,127 @@
+# app/utils/resumes.py
+"""
+Single write path for new Resume rows.
+
+`add_resumes` inserts a batch of resumes for one job and, in the same
+transaction, updates everything derived from them (dashboard counters,
+matching term vectors, search index, near-duplicate signatures) and stages the
+resumes_added live update event. Takes a sync Session; async routes call
+it through `await db.run_sync(add_resumes, ...)` and commit afterwards.
+
+Databases created before resumes carried `company_id` are upgraded with
+    python -m app.utils.resumes backfill-company
+"""
+import argparse
+from typing import Dict, List, Tuple
+
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.orm import Session
+
+from app.models import Job, Resume
+from app.utils.counters import record_resumes_added
+from app.utils.dedup import index_resume_signatures
+from app.utils.matching import index_resumes_terms
+from app.utils.events import publish_event
+from app.utils.response_cache import mark_stale
+from app.utils.resume_fields import index_resumes_fields
+from app.utils.search import index_resumes_search
+from app.utils.vectors import index_resumes_embeddings
+
+
+def add_resumes(
+    db: Session, job: Job, recruiter_id: int, items: List[Tuple[str, str]]
+) -> Tuple[List[Resume], Dict[int, int]]:
+    """
+    Insert resumes from (resume_url, extracted_text) pairs; caller commits.
+    Returns the new resumes and {resume_id: cluster_id} for near-duplicates.
+    """
+    resumes = [
+        Resume(
+            resume_url=resume_url,
+            extracted_text=text,
+            status="pending",
+            job_id=job.id,
+            recruiter_id=recruiter_id,
+            company_id=job.company_id,
+        )
+        for resume_url, text in items
+    ]
+    if not resumes:
+        return resumes, {}
+
+    db.add_all(resumes)
+    db.flush()  # one multi-row INSERT; populates ids
+
+    record_resumes_added(db, job.recruiter_id, job.id, "pending", len(resumes))
+    index_resumes_terms(db, resumes)
+    index_resumes_embeddings(db, resumes)
+    index_resumes_fields(db, resumes)
+    index_resumes_search(db, resumes, job.company_id)
+    duplicates = index_resume_signatures(db, resumes, job.company_id)
+    mark_stale(db, recruiter_id=job.recruiter_id, company_id=job.company_id)
+    publish_event(
+        db,
+        "resumes_added",
+        {"job_id": job.id, "resume_ids": [r.id for r in resumes], "status": "pending"},
+        recruiter_id=job.recruiter_id,
+        company_id=job.company_id,
+    )
+    return resumes, duplicates
+
+
+def backfill_company_ids(db: Session, batch_size: int = 5000) -> int:
+    """
+    Add/fill resumes.company_id from jobs and create any missing resume/job
+    indexes. Idempotent; returns the number of rows filled.
+    """
+    bind = db.get_bind()
+    columns = {c["name"] for c in inspect(bind).get_columns("resumes")}
+    if "company_id" not in columns:
+        db.execute(
+            text("ALTER TABLE resumes ADD COLUMN company_id INTEGER REFERENCES companies(id)")
+        )
+        db.commit()
+
+    company_of_job = (
+        select(Job.company_id).where(Job.id == Resume.job_id).scalar_subquery()
+    )
+    filled = 0
+    last_id = 0
+    while True:
+        ids = db.scalars(
+            select(Resume.id)
+            .where(Resume.company_id.is_(None), Resume.id > last_id)
+            .order_by(Resume.id)
+            .limit(batch_size)
+        ).all()
+        if not ids:
+            break
+        last_id = ids[-1]
+        db.execute(
+            update(Resume)
+            .where(Resume.id.in_(ids))
+            .values(company_id=company_of_job)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        filled += len(ids)
+
+    if bind.dialect.name == "postgresql":
+        db.execute(text("ALTER TABLE resumes ALTER COLUMN company_id SET NOT NULL"))
+        db.commit()
+    for table in (Resume.__table__, Job.__table__):
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
+    return filled
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Resume table maintenance.")
+    parser.add_argument("command", choices=["backfill-company"])
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        filled = backfill_company_ids(session)
+    print(f"[RESUMES] Filled company_id on {filled} resumes; indexes up to date")
@@ -0,0 +1,265 @@
+# app/utils/search.py
+"""
+Resume full-text search backed by the database where possible.
+
+Postgres: `resume_bodies.search_vector` (tsvector, GIN index) is filled in the same
+transaction as the resume write and queried with `websearch_to_tsquery` /
+`ts_rank_cd`, so a company-wide search is an index lookup.
+
+Other dialects (SQLite dev/tests): one in-process `InvertedIndex` per company,
+built from the DB on first search and then updated incrementally when a
+session that added/removed resumes commits. `load_company_index` loads it in
+the threadpool with a session of its own (never on the event loop, where a
+thread waiting for another request's load would block the very loop that load
+needs), one loader per company; the index is published only once complete, and
+updates committed during the load are replayed onto it first. It is
+per-process, so it is not meant for multi-worker deployments.
+
+Back-fill search vectors for rows written before this existed:
+    python -m app.utils.search reindex
+"""
+import argparse
+import os
+import threading
+from typing import Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, event, func, select, update
+from sqlalchemy.orm import Session
+
+from app.config.db import SessionLocal, engine, primary_reads
+from app.core.compression import decompress_text
+from app.core.search import InvertedIndex, parse_query
+from app.models import Job, Resume, ResumeBody
+
+SEARCH_TS_CONFIG = os.getenv("SEARCH_TS_CONFIG", "english")
+
+_company_indexes: Dict[int, InvertedIndex] = {}
+# guards the registry and the two dicts below; never held during a DB load
+_company_indexes_lock = threading.Lock()
+# company_id -> (op, resume_id, text) committed while its index is being loaded
+_loading_updates: Dict[int, List[tuple]] = {}
+# company_id -> lock held by the caller loading its index
+_loading_locks: Dict[int, threading.Lock] = {}
+
+
+def uses_tsvector(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _set_search_vectors(db: Session, rows: List[dict]) -> None:
+    """executemany UPDATE of resume_bodies.search_vector from {"rid", "body_text"} rows."""
+    bodies = ResumeBody.__table__
+    db.execute(
+        update(bodies)
+        .where(bodies.c.resume_id == bindparam("rid"))
+        .values(search_vector=func.to_tsvector(SEARCH_TS_CONFIG, bindparam("body_text"))),
+        rows,
+    )
+
+
+def index_resume_search(db: Session, resume: Resume, company_id: int) -> None:
+    """Make a (flushed) resume searchable as part of the caller's transaction."""
+    index_resumes_search(db, [resume], company_id)
+
+
+def index_resumes_search(db: Session, resumes: List[Resume], company_id: int) -> None:
+    """Index freshly flushed resumes (one executemany UPDATE on Postgres)."""
+    if not resumes:
+        return
+    if uses_tsvector(db):
+        # the text is compressed at rest, so the tsvector is built from the Python copy
+        _set_search_vectors(
+            db, [{"rid": r.id, "body_text": r.extracted_text} for r in resumes]
+        )
+    else:
+        db.info.setdefault("search_pending", []).extend(
+            ("add", company_id, r.id, r.extracted_text) for r in resumes
+        )
+
+
+def remove_resume_search(db: Session, resume_id: int, company_id: int) -> None:
+    """Drop a resume from the in-process index once the delete commits."""
+    if not uses_tsvector(db):
+        db.info.setdefault("search_pending", []).append(
+            ("remove", company_id, resume_id, None)
+        )
+
+
+def _apply(index: InvertedIndex, op: str, resume_id: int, text: Optional[str]) -> None:
+    if op == "add":
+        index.add(resume_id, text)
+    else:
+        index.remove(resume_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_search_updates(session: Session) -> None:
+    pending = session.info.pop("search_pending", None)
+    if not pending:
+        return
+    ready = []
+    with _company_indexes_lock:
+        for op, company_id, resume_id, text in pending:
+            loading = _loading_updates.get(company_id)
+            if loading is not None:
+                loading.append((op, resume_id, text))
+                continue
+            index = _company_indexes.get(company_id)
+            # None: not built yet; it will be loaded from the DB on first search
+            if index is not None:
+                ready.append((index, op, resume_id, text))
+    for update_ in ready:
+        _apply(*update_)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_search_updates(session: Session) -> None:
+    session.info.pop("search_pending", None)
+
+
+def _load_company_index(company_id: int) -> InvertedIndex:
+    """
+    Load a company's index with a session of its own (blocking; not on the event
+    loop). Concurrent callers for the same company wait for one load.
+    """
+    with _company_indexes_lock:
+        index = _company_indexes.get(company_id)
+        if index is not None:
+            return index
+        loading = _loading_locks.setdefault(company_id, threading.Lock())
+    with loading:
+        index = _company_indexes.get(company_id)
+        if index is not None:
+            return index
+        with _company_indexes_lock:
+            _loading_updates[company_id] = []
+        try:
+            index = InvertedIndex()
+            # commits before the load are only replayed from the primary
+            with primary_reads(), SessionLocal() as db:
+                rows = db.execute(
+                    select(ResumeBody.resume_id, ResumeBody.data, ResumeBody.codec)
+                    .join(Resume, Resume.id == ResumeBody.resume_id)
+                    .where(Resume.company_id == company_id)
+                )
+                for resume_id, data, codec in rows:
+                    index.add(resume_id, decompress_text(data, codec))
+        except BaseException:
+            with _company_indexes_lock:
+                _loading_updates.pop(company_id, None)
+            raise
+        with _company_indexes_lock:
+            # commits that raced with the load, in commit order (add is idempotent)
+            for op, resume_id, text in _loading_updates.pop(company_id):
+                _apply(index, op, resume_id, text)
+            _company_indexes[company_id] = index
+            _loading_locks.pop(company_id, None)
+    return index
+
+
+async def load_company_index(company_id: int) -> Optional[InvertedIndex]:
+    """
+    The company's in-process index, loaded in the threadpool on first use;
+    None on Postgres (searches use the tsvector column).
+    """
+    if engine.dialect.name == "postgresql":
+        return None
+    index = _company_indexes.get(company_id)
+    if index is None:
+        index = await run_in_threadpool(_load_company_index, company_id)
+    return index
+
+
+def search_resumes(
+    db: Session,
+    company_id: int,
+    q: str,
+    job_id: Optional[int] = None,
+    status: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    index: Optional[InvertedIndex] = None,
+) -> List[dict]:
+    """
+    Ranked resumes of a company matching `q` (see app/core/search.py for syntax).
+    Without tsvector, searches `index` (from load_company_index); loads it here,
+    blocking, if it is not given.
+    """
+    columns = (
+        Resume.id,
+        Resume.job_id,
+        Job.title.label("job_title"),
+        Resume.status,
+        Resume.resume_url,
+        Resume.created_at,
+    )
+    filters = [Resume.company_id == company_id]
+    if job_id is not None:
+        filters.append(Resume.job_id == job_id)
+    if status:
+        filters.append(func.lower(Resume.status) == status.lower())
+
+    if uses_tsvector(db):
+        tsquery = func.websearch_to_tsquery(SEARCH_TS_CONFIG, q)
+        score = func.ts_rank_cd(ResumeBody.search_vector, tsquery).label("score")
+        rows = db.execute(
+            select(*columns, score)
+            .join(Job, Resume.job_id == Job.id)
+            .join(ResumeBody, ResumeBody.resume_id == Resume.id)
+            .where(*filters, ResumeBody.search_vector.op("@@")(tsquery))
+            .order_by(score.desc(), Resume.id.desc())
+            .limit(limit)
+            .offset(offset)
+        ).all()
+        return [dict(r._mapping) for r in rows]
+
+    if index is None:
+        index = _load_company_index(company_id)
+    ranked = index.search(parse_query(q))
+    if not ranked:
+        return []
+    scores = dict(ranked)
+    rows = db.execute(
+        select(*columns)
+        .join(Job, Resume.job_id == Job.id)
+        .where(*filters, Resume.id.in_(list(scores)))
+    ).all()
+    rows = sorted(rows, key=lambda r: (-scores[r.id], -r.id))[offset : offset + limit]
+    return [{**r._mapping, "score": scores[r.id]} for r in rows]
+
+
+def reindex_search_vectors(db: Session, batch_size: int = 500) -> int:
+    """Fill missing search vectors (Postgres). Returns number of rows updated."""
+    if not uses_tsvector(db):
+        return 0
+    updated = 0
+    while True:
+        batch = db.execute(
+            select(ResumeBody.resume_id, ResumeBody.data, ResumeBody.codec)
+            .where(ResumeBody.search_vector.is_(None))
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            return updated
+        _set_search_vectors(
+            db,
+            [
+                {"rid": rid, "body_text": decompress_text(data, codec)}
+                for rid, data, codec in batch
+            ],
+        )
+        updated += len(batch)
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Maintain resume search vectors.")
+    parser.add_argument("command", choices=["reindex"])
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        updated = reindex_search_vectors(session)
+        session.commit()
+    print(f"[SEARCH] Reindexed {updated} resumes")
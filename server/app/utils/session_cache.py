@@ -0,0 +1,183 @@
+# app/utils/session_cache.py
+"""
+In-process cache of verified Firebase session-cookie claims.
+
+`firebase_auth.verify_session_cookie(..., check_revoked=True)` makes a network
+round-trip to Firebase on every call. Cookies are immutable, so once a cookie
+has been verified we keep its decoded claims (keyed by a hash of the cookie)
+until whichever comes first:
+  - the cookie's own `exp`
+  - the revocation re-check interval (then Firebase is asked again)
+  - a local logout for that uid (the uid's revocation epoch is bumped)
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.metrics import Gauge
+
+SESSION_CACHE_ENABLED = os.getenv("SESSION_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# how long a cached verification is trusted before revocation is re-checked remotely
+SESSION_CACHE_RECHECK_SECONDS = int(os.getenv("SESSION_CACHE_RECHECK_SECONDS", "300"))
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000"))
+
+
+def _cookie_key(session_cookie: str) -> str:
+    # never keep raw cookies in memory as dict keys
+    return hashlib.sha256(session_cookie.encode("utf-8")).hexdigest()
+
+
+class SessionClaimsCache:
+    """Thread-safe LRU of decoded session-cookie claims."""
+
+    def __init__(self, max_entries: int, recheck_seconds: int):
+        self.max_entries = max_entries
+        self.recheck_seconds = recheck_seconds
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._epochs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rechecks = 0
+        self.evictions = 0
+
+    def get(self, session_cookie: str, check_revoked: bool = True):
+        """
+        Return cached claims for the cookie, or None when the caller must verify
+        remotely (unknown cookie, expired, locally revoked, or re-check due).
+        """
+        key = _cookie_key(session_cookie)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            uid = entry["claims"].get("uid")
+            expired = entry["exp"] is not None and now >= entry["exp"]
+            revoked = self._epochs.get(uid, 0) != entry["epoch"]
+            if expired or revoked:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            if check_revoked and now - entry["checked_at"] >= self.recheck_seconds:
+                self.rechecks += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["claims"]
+
+    def put(
+        self,
+        session_cookie: str,
+        claims: Dict[str, Any],
+        checked_revoked: bool = True,
+    ) -> None:
+        """
+        Store claims for a cookie that Firebase just verified.
+        Only revocation-checked verifications start a new re-check window.
+        """
+        key = _cookie_key(session_cookie)
+        now = time.time()
+        exp = claims.get("exp")
+        with self._lock:
+            previous = self._entries.get(key)
+            if checked_revoked:
+                checked_at = now
+            elif previous is not None:
+                checked_at = previous["checked_at"]
+            else:
+                # force a remote revocation check before the first strict use
+                checked_at = float("-inf")
+
+            self._entries[key] = {
+                "claims": claims,
+                "exp": float(exp) if exp is not None else None,
+                "checked_at": checked_at,
+                "epoch": self._epochs.get(claims.get("uid"), 0),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, session_cookie: str) -> None:
+        with self._lock:
+            if self._entries.pop(_cookie_key(session_cookie), None) is not None:
+                self.evictions += 1
+
+    def bump_revocation_epoch(self, uid: str) -> int:
+        """
+        Locally revoke every cached cookie of `uid` (used on logout).
+        Entries are dropped lazily on their next lookup.
+        """
+        with self._lock:
+            epoch = self._epochs.get(uid, 0) + 1
+            self._epochs[uid] = epoch
+            return epoch
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._epochs.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": SESSION_CACHE_ENABLED,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "recheck_seconds": self.recheck_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "rechecks": self.rechecks,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+session_cache = SessionClaimsCache(
+    max_entries=SESSION_CACHE_MAX_ENTRIES,
+    recheck_seconds=SESSION_CACHE_RECHECK_SECONDS,
+)
+
+
+def get_cached_claims(
+    session_cookie: str, check_revoked: bool = True
+) -> Optional[Dict[str, Any]]:
+    if not SESSION_CACHE_ENABLED:
+        return None
+    return session_cache.get(session_cookie, check_revoked=check_revoked)
+
+
+def store_claims(
+    session_cookie: str, claims: Dict[str, Any], checked_revoked: bool = True
+) -> None:
+    if SESSION_CACHE_ENABLED:
+        session_cache.put(session_cookie, claims, checked_revoked=checked_revoked)
+
+
+def _cache_stats():
+    stats = session_cache.stats()
+    return {(key,): stats[key] for key in ("hits", "misses", "rechecks", "evictions", "size")}
+
+
+Gauge(
+    "session_cache_events",
+    "Session-cookie claims cache counters (cumulative) and current size.",
+    ["event"],
+    callback=_cache_stats,
+)
@@ -0,0 +1,390 @@
+# app/utils/vectors.py
+"""
+Embeddings of jobs and resumes (app/core/embeddings.py) and the per-company
+approximate-nearest-neighbour index of jobs (app/core/vector_index.py) behind
+GET /recruiter/resumes/{id}/job-recommendations and /recruiter/jobs/{id}/similar.
+
+Write path: like app/utils/matching.py, the index_* helpers take a sync Session
+and add the embedding rows to the caller's transaction. New job vectors are
+also staged in `session.info` and added to the in-process index once the
+session commits (dropped on rollback).
+
+Read path: only jobs are indexed. A resume is a query, so its vector is read
+by primary key and search cost depends on the number of jobs in the company,
+not on how many resumes exist. A company's index is loaded on first use from
+the snapshot in VECTOR_INDEX_DIR (memory-mapped) or built from job_embeddings;
+`load_company_index` does that in the threadpool with its own session (k-means
+on 10^5 jobs takes seconds and must not stall the event loop), one loader per
+company. Every search first picks up job vectors committed since the previous
+one, so jobs written by other worker processes are found too. Ids don't arrive
+in commit order (a job can commit after one with a higher id), so this goes by
+job_embeddings.created_at and re-reads a VECTOR_INDEX_CATCH_UP_OVERLAP_SECONDS
+window for transactions still open at the last look; it must exceed the longest
+job-writing transaction. The first catch-up of a process reads every id of the
+company, which also fills in jobs missing from a stale snapshot. When the unclustered
+delta passes VECTOR_INDEX_MAX_DELTA it is compacted in a background thread
+(and snapshotted, if VECTOR_INDEX_DIR is set). The compaction runs without the
+registry lock; additions made meanwhile are logged and replayed onto the
+compacted index before it is swapped in.
+
+Read paths never write: a job or resume without a stored vector is embedded in
+memory for the request (and such a job is not in the index). Back-fill rows
+written before this existed, or re-embed everything after changing
+EMBEDDING_DIM, then write fresh snapshots:
+    python -m app.utils.vectors backfill [--recompute]
+    python -m app.utils.vectors rebuild
+"""
+import argparse
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.config.db import SessionLocal
+from app.core.embeddings import EMBEDDING_DIM, embed, pack_embedding, unpack_embedding
+from app.core.logger import get_logger
+from app.core.vector_index import IVFIndex
+from app.models import Job, JobEmbedding, Resume, ResumeEmbedding
+
+log = get_logger("vectors")
+
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "")
+VECTOR_INDEX_MAX_DELTA = int(os.getenv("VECTOR_INDEX_MAX_DELTA", "2000"))
+VECTOR_INDEX_CATCH_UP_OVERLAP = timedelta(
+    seconds=int(os.getenv("VECTOR_INDEX_CATCH_UP_OVERLAP_SECONDS", "300"))
+)
+
+_company_indexes: Dict[int, IVFIndex] = {}
+# guards registration and replacement of indexes, additions to them and the
+# compaction logs; held only for dict/delta updates, never for a compaction
+_company_indexes_lock = threading.RLock()
+_compacting: set = set()
+# company_id -> (job_id, vector) added while its index is being compacted
+_compaction_logs: Dict[int, List[Tuple[int, np.ndarray]]] = {}
+# company_id -> lock held while its index is being loaded or built
+_loading_locks: Dict[int, threading.Lock] = {}
+# company_id -> newest job_embeddings.created_at seen by a catch-up
+_catch_up_marks: Dict[int, datetime] = {}
+
+
+# --- write path -------------------------------------------------------------------
+
+
+def index_job_embedding(db: Session, job: Job) -> None:
+    """Embed a (flushed) job as part of the caller's transaction."""
+    index_jobs_embeddings(db, [(job.id, job.company_id, job.description)])
+
+
+def index_jobs_embeddings(db: Session, jobs: List[Tuple[int, int, str]]) -> None:
+    """Bulk variant of index_job_embedding for (job_id, company_id, description)."""
+    if not jobs:
+        return
+    staged = [(job_id, company_id, embed(description)) for job_id, company_id, description in jobs]
+    db.execute(
+        insert(JobEmbedding),
+        [
+            {"job_id": job_id, "company_id": company_id, "vector": pack_embedding(vector)}
+            for job_id, company_id, vector in staged
+        ],
+    )
+    db.info.setdefault("vectors_pending", []).extend(
+        (company_id, job_id, vector) for job_id, company_id, vector in staged
+    )
+
+
+def index_resumes_embeddings(db: Session, resumes: List[Resume]) -> None:
+    """Embed freshly inserted resumes (one INSERT)."""
+    rows = [
+        {"resume_id": r.id, "vector": pack_embedding(embed(r.extracted_text))}
+        for r in resumes
+    ]
+    if rows:
+        db.execute(insert(ResumeEmbedding), rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_vector_updates(session: Session) -> None:
+    pending = session.info.pop("vectors_pending", None)
+    if not pending:
+        return
+    grown = set()
+    with _company_indexes_lock:
+        for company_id, job_id, vector in pending:
+            index = _add_to_index(company_id, job_id, vector)
+            # not loaded yet (None): it will read the row from the DB
+            if index is not None and index.delta_size > VECTOR_INDEX_MAX_DELTA:
+                grown.add(company_id)
+    for company_id in grown:
+        _schedule_compaction(company_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_vector_updates(session: Session) -> None:
+    session.info.pop("vectors_pending", None)
+
+
+# --- per-company index ------------------------------------------------------------
+
+
+def _add_to_index(company_id: int, job_id: int, vector: np.ndarray) -> Optional[IVFIndex]:
+    """Add a job to the registered index (and the compaction log); caller holds the lock."""
+    index = _company_indexes.get(company_id)
+    if index is not None:
+        index.add(job_id, vector)
+        added = _compaction_logs.get(company_id)
+        if added is not None:
+            added.append((job_id, vector))
+    return index
+
+
+def _snapshot_dir(company_id: int) -> Optional[str]:
+    return os.path.join(VECTOR_INDEX_DIR, str(company_id)) if VECTOR_INDEX_DIR else None
+
+
+def _company_job_vectors(db: Session, company_id: int):
+    rows = db.execute(
+        select(JobEmbedding.job_id, JobEmbedding.vector)
+        .where(JobEmbedding.company_id == company_id)
+        .order_by(JobEmbedding.job_id)
+    ).all()
+    return [job_id for job_id, _ in rows], [unpack_embedding(blob) for _, blob in rows]
+
+
+def _job_vectors(db: Session, job_ids: List[int]):
+    rows = db.execute(
+        select(JobEmbedding.job_id, JobEmbedding.vector)
+        .where(JobEmbedding.job_id.in_(job_ids))
+        .order_by(JobEmbedding.job_id)
+    ).all()
+    return [job_id for job_id, _ in rows], [unpack_embedding(blob) for _, blob in rows]
+
+
+def build_company_index(db: Session, company_id: int) -> IVFIndex:
+    ids, vectors = _company_job_vectors(db, company_id)
+    if not ids:
+        return IVFIndex(EMBEDDING_DIM)
+    return IVFIndex.build(EMBEDDING_DIM, ids, np.stack(vectors))
+
+
+def _catch_up(db: Session, company_id: int, index: IVFIndex) -> None:
+    """Add job vectors committed since the last catch-up (e.g. by another process)."""
+    query = select(JobEmbedding.job_id, JobEmbedding.created_at).where(
+        JobEmbedding.company_id == company_id
+    )
+    mark = _catch_up_marks.get(company_id)
+    if mark is not None:
+        query = query.where(JobEmbedding.created_at >= mark - VECTOR_INDEX_CATCH_UP_OVERLAP)
+    rows = db.execute(query).all()
+    newest = max((created for _, created in rows if created is not None), default=None)
+    if newest is not None and (mark is None or newest > mark):
+        _catch_up_marks[company_id] = newest
+    missing = [job_id for job_id, _ in rows if job_id not in index]
+    if not missing:
+        return
+    ids, vectors = _job_vectors(db, missing)
+    with _company_indexes_lock:
+        registered = _company_indexes.get(company_id) is index
+        for job_id, vector in zip(ids, vectors):
+            if registered:
+                _add_to_index(company_id, job_id, vector)
+            else:
+                index.add(job_id, vector)
+
+
+def _load_company_index(company_id: int) -> IVFIndex:
+    """
+    Load or build a company's index with a session of its own (blocking; not on
+    the event loop). Concurrent callers for the same company wait for one load;
+    other companies are not blocked.
+    """
+    with _company_indexes_lock:
+        index = _company_indexes.get(company_id)
+        if index is not None:
+            return index
+        loading = _loading_locks.setdefault(company_id, threading.Lock())
+    with loading:
+        index = _company_indexes.get(company_id)
+        if index is not None:
+            return index
+        path = _snapshot_dir(company_id)
+        index = IVFIndex.load(path, EMBEDDING_DIM) if path else None
+        if index is None:
+            with SessionLocal() as db:
+                index = build_company_index(db, company_id)
+        with _company_indexes_lock:
+            _company_indexes[company_id] = index
+            _loading_locks.pop(company_id, None)
+    return index
+
+
+async def load_company_index(company_id: int) -> IVFIndex:
+    """The company's job index; the first use loads or builds it in the threadpool."""
+    index = _company_indexes.get(company_id)
+    if index is None:
+        index = await run_in_threadpool(_load_company_index, company_id)
+    return index
+
+
+def _current_index(db: Session, company_id: int, index: IVFIndex) -> IVFIndex:
+    """
+    The registered index (`index` may have been swapped out by a compaction),
+    caught up with the DB; schedules a compaction when its delta grew too big.
+    """
+    index = _company_indexes.get(company_id, index)
+    _catch_up(db, company_id, index)
+    if index.delta_size > VECTOR_INDEX_MAX_DELTA:
+        _schedule_compaction(company_id)
+    return index
+
+
+def _schedule_compaction(company_id: int) -> None:
+    with _company_indexes_lock:
+        if company_id in _compacting:
+            return
+        _compacting.add(company_id)
+    threading.Thread(
+        target=_compact, args=(company_id,), name=f"vector-compact-{company_id}", daemon=True
+    ).start()
+
+
+def _compact(company_id: int) -> None:
+    try:
+        with _company_indexes_lock:
+            index = _company_indexes.get(company_id)
+            if index is None:
+                return
+            _compaction_logs[company_id] = []
+        # seconds at 10^5+ jobs: searches and commits keep using `index` meanwhile
+        compacted = index.compact()
+        with _company_indexes_lock:
+            # additions that raced with compact()'s snapshot may be replayed; add is idempotent
+            for job_id, vector in _compaction_logs.pop(company_id):
+                compacted.add(job_id, vector)
+            _company_indexes[company_id] = compacted
+        path = _snapshot_dir(company_id)
+        if path:
+            compacted.save(path)
+    except Exception as e:
+        log.warning("vector index compaction failed", extra={"company_id": company_id, "error": str(e)})
+    finally:
+        with _company_indexes_lock:
+            _compaction_logs.pop(company_id, None)
+            _compacting.discard(company_id)
+
+
+# --- queries ----------------------------------------------------------------------
+
+
+def load_resume_embedding(db: Session, resume: Resume) -> np.ndarray:
+    """
+    Stored resume vector; computed (not persisted: read paths never write) for
+    resumes written before vectors existed, until `backfill` stores it.
+    """
+    blob = db.scalar(
+        select(ResumeEmbedding.vector).where(ResumeEmbedding.resume_id == resume.id)
+    )
+    if blob is not None:
+        return unpack_embedding(blob)
+    return embed(resume.extracted_text)
+
+
+def load_job_embedding(db: Session, job: Job) -> np.ndarray:
+    """Stored job vector; computed (not persisted) for jobs created before vectors existed."""
+    blob = db.scalar(select(JobEmbedding.vector).where(JobEmbedding.job_id == job.id))
+    if blob is not None:
+        return unpack_embedding(blob)
+    return embed(job.description)
+
+
+def recommend_jobs(
+    db: Session, resume: Resume, index: IVFIndex, k: int
+) -> List[Tuple[int, float]]:
+    """
+    (job_id, score) of the company's jobs closest to a resume, excluding its own
+    job; `index` comes from load_company_index(resume.company_id).
+    """
+    query = load_resume_embedding(db, resume)
+    index = _current_index(db, resume.company_id, index)
+    return index.search(query, k, exclude=(resume.job_id,))
+
+
+def similar_jobs(db: Session, job: Job, index: IVFIndex, k: int) -> List[Tuple[int, float]]:
+    """(job_id, score) of the company's other jobs closest to `job`."""
+    query = load_job_embedding(db, job)
+    index = _current_index(db, job.company_id, index)
+    return index.search(query, k, exclude=(job.id,))
+
+
+# --- maintenance ------------------------------------------------------------------
+
+
+def backfill_embeddings(db: Session, recompute: bool = False, batch_size: int = 1000) -> Tuple[int, int]:
+    """Embed jobs and resumes that have no vector (all of them with recompute); returns counts."""
+    if recompute:
+        db.execute(delete(JobEmbedding))
+        db.execute(delete(ResumeEmbedding))
+        db.commit()
+
+    jobs = 0
+    while True:
+        batch = db.execute(
+            select(Job.id, Job.company_id, Job.description)
+            .outerjoin(JobEmbedding, JobEmbedding.job_id == Job.id)
+            .where(JobEmbedding.job_id.is_(None))
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        index_jobs_embeddings(db, [tuple(row) for row in batch])
+        db.commit()
+        jobs += len(batch)
+
+    resumes = 0
+    while True:
+        batch = db.scalars(
+            select(Resume)
+            .options(selectinload(Resume.body))
+            .outerjoin(ResumeEmbedding, ResumeEmbedding.resume_id == Resume.id)
+            .where(ResumeEmbedding.resume_id.is_(None))
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        index_resumes_embeddings(db, batch)
+        db.commit()
+        db.expunge_all()
+        resumes += len(batch)
+    return jobs, resumes
+
+
+def rebuild_snapshots(db: Session) -> int:
+    """Retrain and save every company's index to VECTOR_INDEX_DIR; returns the company count."""
+    if not VECTOR_INDEX_DIR:
+        raise RuntimeError("VECTOR_INDEX_DIR is not set")
+    company_ids = db.scalars(select(JobEmbedding.company_id).distinct()).all()
+    for company_id in company_ids:
+        build_company_index(db, company_id).save(_snapshot_dir(company_id))
+    return len(company_ids)
+
+
+if __name__ == "__main__":
+    from app.config.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Job/resume embedding maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    backfill = sub.add_parser("backfill", help="embed jobs/resumes without a vector")
+    backfill.add_argument("--recompute", action="store_true", help="re-embed everything")
+    sub.add_parser("rebuild", help="write fresh index snapshots to VECTOR_INDEX_DIR")
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        if args.command == "backfill":
+            jobs, resumes = backfill_embeddings(session, recompute=args.recompute)
+            print(f"embedded {jobs} job(s) and {resumes} resume(s)")
+        else:
+            print(f"wrote {rebuild_snapshots(session)} company index snapshot(s)")
@@ -0,0 +1,388 @@
+# server/benchmarks/http_bench.py
+"""
+HTTP endpoint benchmark for the FastAPI app, run in-process.
+
+Boots `app.main:app` against SQLite (default, a fresh temp file) or any
+DATABASE_URL (e.g. a local Postgres), swaps Firebase for a deterministic local
+fake, seeds realistic data and drives the hot endpoints with concurrent
+clients over an ASGI transport (no sockets, so numbers are app + DB cost):
+
+    cd server
+    python -m benchmarks.http_bench --concurrency 16 --requests 2000 --output bench.json
+    python -m benchmarks.http_bench --compare bench.json --max-regression 10
+
+Reports throughput, p50/p95/p99 latency and DB queries per request for each
+endpoint. `--compare` prints the delta against a previous JSON report and
+exits non-zero when p95 or throughput regresses by more than --max-regression %.
+
+The clients hammer a handful of users from one address, so the per-uid/IP rate
+limits and admission control (app/core/admission.py) are switched off unless
+RATE_LIMIT_* / ADMISSION_ENABLED are set in the environment. Any non-2xx
+response counts as an error, and a run with errors exits non-zero: its
+latencies would be those of rejections.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+WORDS = (
+    "python java typescript react fastapi django flask spring kubernetes docker "
+    "aws gcp azure postgres mysql redis kafka spark airflow terraform linux "
+    "microservices graphql rest api testing ci cd agile scrum leadership mentoring "
+    "machine learning data engineering analytics backend frontend fullstack mobile "
+    "security networking devops sre observability performance scalability design"
+).split()
+
+
+class FakeFirebaseAuth:
+    """
+    Deterministic stand-in for firebase_admin.auth.
+    ID tokens and session cookies are "<uid>" / "session:<uid>"; an optional
+    artificial latency models the network round-trip of the real SDK.
+    """
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000.0
+        self.calls: Dict[str, int] = {}
+
+    def _call(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def verify_id_token(self, token, clock_skew_seconds=0, **kwargs):
+        self._call("verify_id_token")
+        return {"uid": token, "email": f"{token}@bench.local", "name": token}
+
+    def create_session_cookie(self, id_token, expires_in=None):
+        self._call("create_session_cookie")
+        return f"session:{id_token}"
+
+    def verify_session_cookie(self, session_cookie, check_revoked=False):
+        self._call("verify_session_cookie")
+        if not session_cookie.startswith("session:"):
+            raise ValueError("Invalid session cookie")
+        return {"uid": session_cookie[len("session:") :], "exp": time.time() + 3600}
+
+    def set_custom_user_claims(self, uid, claims):
+        self._call("set_custom_user_claims")
+
+    def revoke_refresh_tokens(self, uid):
+        self._call("revoke_refresh_tokens")
+
+
+def install_fake_firebase(fake: FakeFirebaseAuth) -> None:
+    """Replace app.core.firebase.firebase_auth everywhere it was imported."""
+    import app.core.firebase as firebase_core
+
+    original = firebase_core.firebase_auth
+    if hasattr(original, "target"):
+        # instrumented proxy: swap what it wraps so calls stay timed
+        original.target = fake
+        firebase_core.init_firebase = lambda: None
+        return
+    for module in list(sys.modules.values()):
+        if getattr(module, "firebase_auth", None) is original:
+            module.firebase_auth = fake
+    firebase_core.init_firebase = lambda: None
+
+
+def seed(args) -> List[str]:
+    """Create companies, recruiters, jobs and resumes. Returns recruiter uids."""
+    from app.config.db import SessionLocal
+    from app.models import Company, Job, User
+    from app.utils.counters import record_job_created
+    from app.utils.matching import index_job_terms
+    from app.utils.resumes import add_resumes
+
+    rng = random.Random(args.seed)
+    text = lambda n: " ".join(rng.choice(WORDS) for _ in range(n))
+    recruiter_uids = []
+
+    with SessionLocal() as db:
+        for c in range(args.companies):
+            hr = User(
+                firebase_uid=f"hr-{c}",
+                name=f"HR {c}",
+                email=f"hr-{c}@bench.local",
+                role="HR",
+            )
+            db.add(hr)
+            db.flush()
+            company = Company(name=f"Bench Company {c}", hr_user_id=hr.id)
+            db.add(company)
+            db.flush()
+            hr.company_id = company.id
+
+            for r in range(args.recruiters):
+                uid = f"rec-{c}-{r}"
+                recruiter = User(
+                    firebase_uid=uid,
+                    name=f"Recruiter {c}-{r}",
+                    email=f"{uid}@bench.local",
+                    role="Recruiter",
+                    company_id=company.id,
+                )
+                db.add(recruiter)
+                db.flush()
+                recruiter_uids.append(uid)
+
+                for j in range(args.jobs):
+                    job = Job(
+                        title=f"Job {j} {text(2)}",
+                        description=text(120),
+                        company_id=company.id,
+                        recruiter_id=recruiter.id,
+                    )
+                    db.add(job)
+                    db.flush()
+                    record_job_created(db, recruiter.id, job.id)
+                    index_job_terms(db, job)
+                    add_resumes(
+                        db,
+                        job,
+                        recruiter.id,
+                        [
+                            (f"local://bench/{job.id}/{i}.txt", text(400))
+                            for i in range(args.resumes)
+                        ],
+                    )
+                db.commit()
+    return recruiter_uids
+
+
+class QueryCounter:
+    """Counts cursor executions on the sync and async engines."""
+
+    def __init__(self):
+        self.count = 0
+
+    def install(self) -> None:
+        from sqlalchemy import event
+        from app.config.db import async_engine, engine
+
+        for target in (engine, async_engine.sync_engine):
+            event.listen(target, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+async def run_scenario(
+    client, name: str, make_request: Callable, total: int, concurrency: int, queries
+) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in remaining:
+            start = time.perf_counter()
+            response = await make_request(client, i)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            if not 200 <= response.status_code < 300:
+                errors += 1
+
+    queries_before = queries.count
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "db_queries_per_request": round((queries.count - queries_before) / total, 2),
+    }
+
+
+async def run_benchmarks(args, recruiter_uids: List[str], queries: QueryCounter) -> dict:
+    import httpx
+    from app.main import app
+
+    rng = random.Random(args.seed)
+    cookie = lambda uid: {"Cookie": f"session=session:{uid}"}
+
+    async def check_user(client, i):
+        uid = recruiter_uids[i % len(recruiter_uids)]
+        return await client.post("/check-user", headers={"Authorization": f"Bearer {uid}"})
+
+    async def create_job(client, i):
+        uid = recruiter_uids[i % len(recruiter_uids)]
+        body = {
+            "title": f"Bench job {i}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(80)),
+        }
+        return await client.post("/recruiter/jobs", headers=cookie(uid), json=body)
+
+    async def list_jobs(client, i):
+        uid = recruiter_uids[i % len(recruiter_uids)]
+        return await client.get("/recruiter/jobs", headers=cookie(uid))
+
+    async def summary(client, i):
+        uid = recruiter_uids[i % len(recruiter_uids)]
+        return await client.get("/recruiter/summary", headers=cookie(uid))
+
+    scenarios = {
+        "POST /check-user": check_user,
+        "POST /recruiter/jobs": create_job,
+        "GET /recruiter/jobs": list_jobs,
+        "GET /recruiter/summary": summary,
+    }
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, make_request in scenarios.items():
+            # warm-up (connection pools, caches) is excluded from the numbers
+            for i in range(min(args.warmup, args.requests)):
+                await make_request(client, i)
+            results[name] = await run_scenario(
+                client, name, make_request, args.requests, args.concurrency, queries
+            )
+            print(f"[BENCH] {name}: {results[name]}")
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def _pct_change(before: float, now: float) -> float:
+    return (now - before) / before * 100.0 if before else 0.0
+
+
+def compare(current: dict, baseline: dict, max_regression: float) -> bool:
+    """Print per-endpoint deltas; return False if any endpoint regressed too much."""
+    ok = True
+    for name, now in current["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(name)
+        if not before:
+            continue
+        p95_delta = _pct_change(before["p95_ms"], now["p95_ms"])
+        rps_delta = _pct_change(before["throughput_rps"], now["throughput_rps"])
+        regressed = p95_delta > max_regression or -rps_delta > max_regression
+        ok = ok and not regressed
+        print(
+            f"[COMPARE] {name}: p95 {before['p95_ms']} -> {now['p95_ms']} ms ({p95_delta:+.1f}%), "
+            f"rps {before['throughput_rps']} -> {now['throughput_rps']} ({rps_delta:+.1f}%), "
+            f"queries/req {before['db_queries_per_request']} -> {now['db_queries_per_request']}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HireHub HTTP endpoints.")
+    parser.add_argument("--database-url", help="default: fresh SQLite file in a temp dir")
+    parser.add_argument("--companies", type=int, default=2)
+    parser.add_argument("--recruiters", type=int, default=5, help="per company")
+    parser.add_argument("--jobs", type=int, default=40, help="per recruiter")
+    parser.add_argument("--resumes", type=int, default=5, help="per job")
+    parser.add_argument("--requests", type=int, default=500, help="per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--firebase-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--compare", help="baseline JSON report to diff against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="percent")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="hirehub-bench-")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{workdir}/bench.db"
+    os.environ.setdefault("RESUME_STORAGE_DIR", os.path.join(workdir, "storage"))
+    # read at import time: must be set before app.main is imported
+    for name in (
+        "RATE_LIMIT_CHECK_USER_UID",
+        "RATE_LIMIT_CHECK_USER_IP",
+        "RATE_LIMIT_UPLOADS_UID",
+        "RATE_LIMIT_UPLOADS_IP",
+    ):
+        os.environ.setdefault(name, "0")
+    os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+    # importing the app creates the schema on DATABASE_URL
+    import app.main  # noqa: F401
+
+    fake = FakeFirebaseAuth(latency_ms=args.firebase_latency_ms)
+    install_fake_firebase(fake)
+
+    started = time.perf_counter()
+    recruiter_uids = seed(args)
+    elapsed = time.perf_counter() - started
+    print(f"[BENCH] Seeded {len(recruiter_uids)} recruiters in {elapsed:.1f}s")
+
+    queries = QueryCounter()
+    queries.install()
+    endpoints = asyncio.run(run_benchmarks(args, recruiter_uids, queries))
+
+    from app.config.db import engine
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "concurrency": args.concurrency,
+            "requests_per_endpoint": args.requests,
+            "dataset": {
+                "companies": args.companies,
+                "recruiters_per_company": args.recruiters,
+                "jobs_per_recruiter": args.jobs,
+                "resumes_per_job": args.resumes,
+            },
+            "firebase_latency_ms": args.firebase_latency_ms,
+            "firebase_calls": fake.calls,
+        },
+        "endpoints": endpoints,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Report written to {args.output}")
+
+    failed = {name: r["errors"] for name, r in endpoints.items() if r["errors"]}
+    if failed:
+        print(f"[BENCH] Non-2xx responses, numbers are not comparable: {failed}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(report, baseline, args.max_regression):
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
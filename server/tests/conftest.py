@@ -0,0 +1,55 @@
+# tests/conftest.py
+import asyncio
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="hirehub-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp}/test.db")
+os.environ.setdefault("RESUME_STORAGE_DIR", f"{_tmp}/storage")
+os.environ.setdefault("VECTOR_INDEX_DIR", f"{_tmp}/vectors")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import pytest
+
+from app.config.db import Base, SessionLocal, async_engine, engine
+from app.models import Company, Job, User
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+        # pooled connections would keep reading the removed file
+        asyncio.run(async_engine.dispose())
+        os.remove(engine.url.database)
+
+
+@pytest.fixture
+def job(db):
+    """A job of a recruiter in a fresh company."""
+    company = Company(name="Acme", name_key="acme")
+    db.add(company)
+    db.flush()
+    recruiter = User(
+        firebase_uid="rec1",
+        name="Rec",
+        email="rec@acme.test",
+        role="recruiter",
+        company_id=company.id,
+    )
+    db.add(recruiter)
+    db.flush()
+    job = Job(
+        title="Backend",
+        description="Senior Python developer",
+        company_id=company.id,
+        recruiter_id=recruiter.id,
+    )
+    db.add(job)
+    db.commit()
+    return job
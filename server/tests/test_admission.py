@@ -0,0 +1,50 @@
+# tests/test_admission.py
+import asyncio
+
+from app.core.admission import AdmissionController, AdmissionMiddleware
+
+
+def test_file_downloads_do_not_hold_admission_slots():
+    controller = AdmissionController()
+    controller.global_limiter.limit = 1
+    controller.global_limiter.max_queue = 0
+    release = asyncio.Event()
+
+    async def app(scope, receive, send):
+        if scope["path"].endswith("/file"):
+            await release.wait()  # a slow download
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = AdmissionMiddleware(app, controller)
+
+    async def request(path):
+        statuses = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        scope = {"type": "http", "method": "GET", "path": path}
+        await middleware(scope, None, send)
+        return statuses[0]
+
+    async def run():
+        downloads = [
+            asyncio.ensure_future(request(f"/recruiter/resumes/{i}/file")) for i in range(5)
+        ]
+        await asyncio.sleep(0)
+        assert controller.global_limiter.in_flight == 0
+        assert await request("/recruiter/jobs") == 200
+        release.set()
+        assert await asyncio.gather(*downloads) == [200] * 5
+
+    asyncio.run(run())
+
+
+def test_exempt_paths_accept_templates():
+    controller = AdmissionController()
+    assert controller.is_exempt("/metrics")
+    assert controller.is_exempt("/hr/resumes/12/file")
+    assert not controller.is_exempt("/hr/resumes/12/preview")
+    assert not controller.is_exempt("/hr/resumes/12/file/extra")
@@ -0,0 +1,170 @@
+# tests/test_bulk_upload.py
+import asyncio
+import io
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+from app.routers.recruiter import resumes as resumes_router
+from app.utils.auth import require_recruiter_async
+from app.utils.identity_cache import CurrentUser
+from app.utils.rate_limit import upload_rate_limit
+
+
+class FakePool(Executor):
+    """Runs inline; with broken=True every submit fails like a pool whose worker died."""
+
+    def __init__(self, broken=False):
+        self.broken = broken
+
+    def submit(self, fn, *args):
+        if self.broken:
+            raise BrokenProcessPool("worker died")
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _upload(name, body=b"python developer"):
+    return UploadFile(file=io.BytesIO(body), filename=name)
+
+
+def _run(*uploads, concurrency=4):
+    slots = asyncio.Semaphore(concurrency)
+
+    async def go():
+        return await asyncio.gather(*(resumes_router._process_upload(u, slots) for u in uploads))
+
+    return asyncio.run(go())
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    """The first pool handed out is broken; resetting it makes the next one healthy."""
+    pools = [FakePool(broken=True)]
+
+    def reset(pool):
+        if pools[-1] is pool:
+            pools.append(FakePool())
+
+    monkeypatch.setattr(resumes_router, "get_extraction_pool", lambda: pools[-1])
+    monkeypatch.setattr(resumes_router, "reset_extraction_pool", reset)
+    return pools
+
+
+def test_broken_pool_is_replaced_and_the_file_retried(pools):
+    (result,) = _run(_upload("a.txt"))
+
+    assert result["text"] == "python developer"
+    assert result["resume_url"]
+    assert len(pools) == 2
+
+
+def test_storage_error_fails_only_that_file(monkeypatch, pools):
+    storage = resumes_router.get_storage()
+    put_file = storage.put_file
+
+    def flaky_put(src, key):
+        if "bad" in open(src).read():
+            raise OSError("disk full")
+        return put_file(src, key)
+
+    monkeypatch.setattr(storage, "put_file", flaky_put)
+    good, bad = _run(_upload("good.txt"), _upload("bad.txt", b"bad file"))
+
+    assert "resume_url" in good
+    assert bad == {"filename": "bad.txt", "error": "Could not store file."}
+
+
+def test_uploads_in_flight_are_bounded(monkeypatch, pools):
+    in_flight = peak = 0
+
+    async def slow_threadpool(fn, *args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return fn(*args)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(resumes_router, "run_in_threadpool", slow_threadpool)
+    uploads = [_upload(f"{i}.txt", f"resume {i}".encode()) for i in range(12)]
+    results = _run(*uploads, concurrency=3)
+
+    assert all("resume_url" in r for r in results)
+    assert peak == 3
+
+
+@pytest.fixture
+def client(job):
+    app = FastAPI()
+    app.include_router(resumes_router.router)
+    app.dependency_overrides[require_recruiter_async] = lambda: CurrentUser(
+        job.recruiter_id, "rec1", "Rec", "rec@acme.test", "recruiter", job.company_id, "Acme"
+    )
+    app.dependency_overrides[upload_rate_limit] = lambda: None
+    return TestClient(app)
+
+
+def test_body_over_the_cap_is_rejected_before_parsing(client, job, monkeypatch):
+    monkeypatch.setattr(resumes_router, "MAX_UPLOAD_BODY_BYTES", 1000)
+    url = f"/recruiter/jobs/{job.id}/resumes/bulk"
+
+    response = client.post(url, files=[("files", ("a.txt", b"x" * 2000))])
+    assert response.status_code == 413
+
+    # no Content-Length (chunked): stopped while receiving
+    def chunks():
+        for _ in range(10):
+            yield b"x" * 500
+
+    response = client.post(
+        url,
+        content=chunks(),
+        headers={"Content-Type": "multipart/form-data; boundary=b"},
+    )
+    assert response.status_code == 413
+
+
+def test_failed_batch_reports_a_generic_error(client, job, monkeypatch, pools):
+    def failing(*args):
+        raise RuntimeError("secret connection string")
+
+    monkeypatch.setattr(resumes_router, "_save_batch", failing)
+    response = client.post(
+        f"/recruiter/jobs/{job.id}/resumes/bulk",
+        files=[("files", ("a.txt", b"python developer"))],
+    )
+
+    assert response.status_code == 201
+    assert response.json()["errors"] == [
+        {"filename": "a.txt", "error": "Could not save resume."}
+    ]
+
+
+def test_batches_are_saved_off_the_event_loop(client, job, monkeypatch, pools):
+    add_resumes = resumes_router.add_resumes
+    on_loop = []
+
+    def recording(*args):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return add_resumes(*args)
+
+    monkeypatch.setattr(resumes_router, "add_resumes", recording)
+    response = client.post(
+        f"/recruiter/jobs/{job.id}/resumes/bulk",
+        files=[("files", (f"{i}.txt", f"resume {i}".encode())) for i in range(3)],
+    )
+
+    assert response.status_code == 201
+    assert response.json()["created"] == 3
+    assert on_loop == [False]
@@ -0,0 +1,61 @@
+# tests/test_companies.py
+import threading
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.db import SessionLocal
+from app.routers import users as users_router
+from app.utils.companies import insert_or_fetch_company
+from app.utils.rate_limit import check_user_ip_limit
+
+
+def test_equivalent_name_fetches_the_existing_company(db, job):
+    company, created = insert_or_fetch_company(db, "ACME")
+
+    assert not created
+    assert company.id == job.company_id
+    assert company.name == "Acme"
+
+
+def test_concurrent_inserts_create_one_company(db):
+    start = threading.Barrier(2)
+    results = []
+
+    def sign_up(name):
+        with SessionLocal() as session:
+            start.wait()
+            company, created = insert_or_fetch_company(session, name)
+            session.commit()
+            results.append((company.id, created))
+
+    threads = [threading.Thread(target=sign_up, args=(n,)) for n in ("Globex", "globex ")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(created for _, created in results) == [False, True]
+    assert len({company_id for company_id, _ in results}) == 1
+
+
+def test_unique_violation_during_registration_is_a_409(db, job, monkeypatch):
+    # a new uid with the email of an existing user: the insert hits users.email
+    fake_auth = SimpleNamespace(
+        verify_id_token=lambda token, **kw: {"uid": "new1", "email": "rec@acme.test"}
+    )
+    monkeypatch.setattr(users_router, "firebase_auth", fake_auth)
+    monkeypatch.setattr(users_router, "enforce_rate_limit", lambda *args: None)
+    app = FastAPI()
+    app.include_router(users_router.router)
+    app.dependency_overrides[check_user_ip_limit] = lambda: None
+
+    response = TestClient(app).post(
+        "/check-user",
+        json={"role": "Recruiter", "company_name": "acme"},
+        headers={"Authorization": "Bearer token"},
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Email is already registered to another account."
@@ -0,0 +1,59 @@
+# tests/test_counters.py
+from datetime import datetime
+
+from sqlalchemy import delete, update
+
+from app.models import JobCounters, RecruiterCounters
+from app.utils.counters import count_recruiter, record_job_created
+from app.utils.pipeline import change_resume_status
+from app.utils.resumes import add_resumes
+
+
+def _legacy_resumes(db, job, n):
+    """Resumes written before counters existed: no counters rows."""
+    resumes, _ = add_resumes(
+        db, job, job.recruiter_id, [(f"local://{i}.txt", f"resume {i}") for i in range(n)]
+    )
+    db.execute(delete(JobCounters))
+    db.execute(delete(RecruiterCounters))
+    db.commit()
+    return resumes
+
+
+def test_missing_counters_are_counted_on_read_and_seeded_on_first_write(db, job):
+    resumes = _legacy_resumes(db, job, 2)
+    recruiter_id, job_id = job.recruiter_id, job.id
+
+    counted = count_recruiter(db, recruiter_id)
+    assert (counted["total_jobs"], counted["total_resumes"], counted["pending"]) == (1, 2, 2)
+    assert db.get(RecruiterCounters, recruiter_id) is None
+
+    change_resume_status(db, resumes[0], "shortlisted", recruiter_id)
+    db.commit()
+
+    row = db.get(RecruiterCounters, recruiter_id)
+    assert (row.total_jobs, row.total_resumes, row.pending, row.shortlisted) == (1, 2, 1, 1)
+    job_row = db.get(JobCounters, job_id)
+    assert (job_row.total_resumes, job_row.pending, job_row.shortlisted) == (2, 1, 1)
+
+    # seeded: later writes are plain increments
+    add_resumes(db, job, recruiter_id, [("local://new.txt", "new resume")])
+    db.commit()
+    db.refresh(row)
+    assert (row.total_resumes, row.pending) == (3, 2)
+    assert count_recruiter(db, recruiter_id)["total_resumes"] == 3
+
+
+def test_bump_sets_updated_at(db, job):
+    record_job_created(db, job.recruiter_id, job.id)
+    db.commit()
+    long_ago = datetime(2020, 1, 1)
+    db.execute(update(RecruiterCounters).values(updated_at=long_ago))
+    db.commit()
+
+    add_resumes(db, job, job.recruiter_id, [("local://a.txt", "resume")])
+    db.commit()
+
+    row = db.get(RecruiterCounters, job.recruiter_id)
+    assert row.total_resumes == 1
+    assert row.updated_at.replace(tzinfo=None) > long_ago
@@ -0,0 +1,99 @@
+# tests/test_db_routing.py
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, literal, select
+
+from app.config import db as db_config
+from app.config.db import ReadReplicaMiddleware, ReplicaSet, RoutingSession, engine
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    engines = [create_engine(f"sqlite:///{tmp_path}/replica{i}.db") for i in range(2)]
+    yield engines
+    for e in engines:
+        e.dispose()
+
+
+@pytest.fixture
+def read_only_request():
+    token = db_config._read_only_request.set(True)
+    yield
+    db_config._read_only_request.reset(token)
+
+
+def _session(replica_set):
+    class Session(RoutingSession):
+        pass
+
+    Session.replica_set = replica_set
+    return Session(bind=engine)
+
+
+def _count_statements(engines):
+    counts = {id(e): 0 for e in engines}
+    for e in engines:
+        def on_execute(*args, _key=id(e), **kwargs):
+            counts[_key] += 1
+        event.listen(e, "before_cursor_execute", on_execute)
+    return counts
+
+
+def test_session_reads_from_one_replica(replicas, read_only_request):
+    replica_set = ReplicaSet(replicas)
+    counts = _count_statements(replicas)
+
+    for _ in range(2):
+        with _session(replica_set) as session:
+            for _ in range(4):
+                session.execute(select(literal(1)))
+
+    # round-robin across sessions, sticky within one
+    assert sorted(counts.values()) == [4, 4]
+
+
+def test_session_falls_back_to_primary_when_its_replica_goes_down(replicas, read_only_request):
+    replica_set = ReplicaSet(replicas[:1])
+    with _session(replica_set) as session:
+        session.execute(select(literal(1)))
+        assert session.info["read_bind"] is replicas[0]
+
+        replica_set.mark_down(replicas[0])
+        session.execute(select(literal(1)))
+        assert session.info["read_bind"] is engine
+
+
+def test_pick_does_no_io_and_check_marks_unreachable_replicas_down(tmp_path):
+    unreachable = create_engine(f"sqlite:///{tmp_path}/missing/dir/replica.db")
+    replica_set = ReplicaSet([unreachable])
+
+    assert replica_set.pick() is unreachable
+    replica_set.check()
+    assert replica_set.pick() is None
+    assert replica_set.status() == [{"replica": 0, "up": False}]
+
+
+def test_a_clients_reads_go_to_the_primary_for_a_while_after_its_write(monkeypatch):
+    app = FastAPI()
+    app.add_middleware(ReadReplicaMiddleware, read_your_writes_seconds=5)
+
+    @app.get("/thing")
+    async def read():
+        return {"replica": db_config._read_only_request.get()}
+
+    @app.post("/thing")
+    async def write():
+        return {}
+
+    now = 1_000_000.0
+    monkeypatch.setattr(db_config.time, "time", lambda: now)
+    client, other_client = TestClient(app), TestClient(app)
+
+    assert client.get("/thing").json() == {"replica": True}
+    client.post("/thing")
+    assert client.get("/thing").json() == {"replica": False}
+    assert other_client.get("/thing").json() == {"replica": True}
+
+    now += 5
+    assert client.get("/thing").json() == {"replica": True}
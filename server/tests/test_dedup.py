@@ -0,0 +1,39 @@
+# tests/test_dedup.py
+from app.core.dedup import minhash
+from app.models import ResumeLshBucket, ResumeSignature
+from app.utils.dedup import list_duplicate_clusters
+from app.utils.resumes import add_resumes
+
+TEXT = "senior python developer with ten years of django and postgres experience " * 5
+
+
+def test_minhash_of_empty_text_is_none():
+    assert minhash("") is None
+    assert minhash("  \n ") is None
+    assert minhash(TEXT) is not None
+
+
+def test_empty_text_resumes_are_not_duplicates(db, job):
+    resumes, duplicates = add_resumes(
+        db, job, job.recruiter_id, [("local://a.pdf", ""), ("local://b.pdf", "")]
+    )
+    db.commit()
+
+    assert duplicates == {}
+    assert db.query(ResumeSignature).count() == 0
+    assert db.query(ResumeLshBucket).count() == 0
+    assert list_duplicate_clusters(db, job.company_id) == []
+
+
+def test_identical_text_is_still_a_duplicate(db, job):
+    resumes, duplicates = add_resumes(
+        db,
+        job,
+        job.recruiter_id,
+        [("local://a.txt", TEXT), ("local://empty.pdf", ""), ("local://b.txt", TEXT)],
+    )
+    db.commit()
+
+    first, empty, second = sorted(resumes, key=lambda r: r.id)
+    assert duplicates == {second.id: first.id}
+    assert empty.id not in duplicates
@@ -0,0 +1,109 @@
+# tests/test_events.py
+import asyncio
+
+import pytest
+
+from app.utils import events
+from app.utils.events import RESYNC, MemoryBackend, publish_event
+
+TOPIC = "recruiter:1"
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = MemoryBackend()
+    monkeypatch.setattr(events, "_backend", backend)
+    return backend
+
+
+def _publish(backend, n, topics=(TOPIC,)):
+    for i in range(n):
+        backend.publish(list(topics), "job_created", {"job_id": i})
+
+
+async def _drain(subscriber):
+    await asyncio.sleep(0)  # pushes are scheduled with call_soon_threadsafe
+    items = []
+    while not subscriber.queue.empty():
+        items.append(subscriber.queue.get_nowait())
+    return items
+
+
+def test_reconnect_replays_events_after_last_event_id(backend):
+    async def main():
+        watcher, _, _ = backend.broker.subscribe([TOPIC])
+        _publish(backend, 3)
+        first, second, third = await _drain(watcher)
+
+        _, backlog, cursor = backend.broker.subscribe([TOPIC], last_event_id=first[0])
+        return [second, third], backlog, cursor
+
+    missed, backlog, cursor = asyncio.run(main())
+    assert backlog == missed
+    assert cursor == missed[-1][0]
+
+
+def test_event_to_two_topics_of_a_stream_is_replayed_once(backend):
+    async def main():
+        _, _, start = backend.broker.subscribe([TOPIC])
+        _publish(backend, 1, topics=(TOPIC, "company:1"))
+        return backend.broker.subscribe([TOPIC, "company:1"], last_event_id=start)
+
+    _, backlog, _ = asyncio.run(main())
+    assert [data for _, _, data in backlog] == [{"job_id": 0}]
+
+
+def test_overrun_replay_buffer_sends_resync(backend, monkeypatch):
+    monkeypatch.setattr(events, "EVENTS_REPLAY_SIZE", 2)
+
+    async def main():
+        _, _, start = backend.broker.subscribe([TOPIC])
+        _publish(backend, 4)
+        return backend.broker.subscribe([TOPIC], last_event_id=start)
+
+    _, backlog, cursor = asyncio.run(main())
+    assert backlog == [(cursor, RESYNC, {})]
+
+
+def test_stalled_stream_gets_one_resync_instead_of_its_backlog(backend, monkeypatch):
+    monkeypatch.setattr(events, "EVENTS_SUBSCRIBER_QUEUE", 2)
+
+    async def main():
+        subscriber, _, _ = backend.broker.subscribe([TOPIC])
+        _publish(backend, 3)
+        return await _drain(subscriber)
+
+    (item,) = asyncio.run(main())
+    assert item[1] == RESYNC
+
+
+def test_memory_backend_fans_out_to_the_streams_of_a_topic(backend):
+    async def main():
+        broker = backend.broker
+        first, _, _ = broker.subscribe([TOPIC])
+        second, _, _ = broker.subscribe([TOPIC, "company:1"])
+        other, _, _ = broker.subscribe(["recruiter:2"])
+        _publish(backend, 1)
+        received = [await _drain(s) for s in (first, second, other)]
+        broker.unsubscribe(first)
+        _publish(backend, 1)
+        received.append(await _drain(first))
+        return received
+
+    first, second, other, after_unsubscribe = asyncio.run(main())
+    assert [t for _, t, _ in first] == ["job_created"]
+    assert second == first
+    assert other == [] and after_unsubscribe == []
+
+
+def test_events_are_published_on_commit_only(db, job, backend):
+    async def main():
+        subscriber, _, _ = backend.broker.subscribe([f"recruiter:{job.recruiter_id}"])
+        publish_event(db, "job_created", {"job_id": 1}, recruiter_id=job.recruiter_id)
+        db.rollback()
+        publish_event(db, "job_created", {"job_id": 2}, recruiter_id=job.recruiter_id)
+        db.commit()
+        return await _drain(subscriber)
+
+    (item,) = asyncio.run(main())
+    assert item[2] == {"job_id": 2}
@@ -0,0 +1,132 @@
+# tests/test_firebase_tasks.py
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import FirebaseTask
+from app.utils import firebase_tasks
+from app.utils.firebase_tasks import (
+    FIREBASE_TASK_LEASE_SECONDS,
+    FIREBASE_TASK_MAX_ATTEMPTS,
+    FIREBASE_TASK_MAX_BACKOFF_SECONDS,
+    REVOKE_TOKENS,
+    FirebaseTaskRunner,
+)
+
+
+class RecordingRunner(FirebaseTaskRunner):
+    """Keeps what it would hand to its workers instead of running them."""
+
+    def __init__(self, queue_size=100):
+        super().__init__(workers=1, queue_size=queue_size)
+        self.submitted = []
+
+    def submit(self, task_id, kind):
+        self.submitted.append(task_id)
+        return True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = {"now": datetime(2026, 1, 1, 12, 0, 0)}
+    monkeypatch.setattr(firebase_tasks, "_utcnow", lambda: clock["now"])
+    return clock
+
+
+def _due_tasks(db, n, clock, attempts=0):
+    tasks = [
+        FirebaseTask(
+            kind=REVOKE_TOKENS,
+            uid=f"uid{i}",
+            attempts=attempts,
+            next_attempt_at=clock["now"] - timedelta(seconds=1),
+        )
+        for i in range(n)
+    ]
+    db.add_all(tasks)
+    db.commit()
+    return [t.id for t in tasks]
+
+
+def test_expired_lease_is_claimed_again(db, clock):
+    (task_id,) = _due_tasks(db, 1, clock)
+    runner = RecordingRunner()
+
+    assert runner.claim_due() == 1
+    assert runner.claim_due() == 0  # leased
+
+    clock["now"] += timedelta(seconds=FIREBASE_TASK_LEASE_SECONDS + 1)
+    assert runner.claim_due() == 1
+    assert runner.submitted == [task_id, task_id]
+
+
+def test_failed_task_is_retried_after_backoff(db, clock, monkeypatch):
+    (task_id,) = _due_tasks(db, 1, clock)
+    runner = RecordingRunner()
+    calls = []
+
+    def flaky(kind, uid, payload):
+        calls.append(uid)
+        if len(calls) == 1:
+            raise RuntimeError("firebase unavailable")
+
+    monkeypatch.setattr(firebase_tasks, "_call", flaky)
+    runner.claim_due()
+    runner.run_task(task_id)
+
+    db.expire_all()
+    task = db.get(FirebaseTask, task_id)
+    assert task.attempts == 1
+    assert task.last_error == "firebase unavailable"
+    assert task.next_attempt_at > clock["now"]
+    assert runner.claim_due() == 0  # backing off
+
+    clock["now"] = task.next_attempt_at
+    assert runner.claim_due() == 1
+    runner.run_task(task_id)
+    db.expire_all()
+    assert db.get(FirebaseTask, task_id) is None
+    assert calls == ["uid0", "uid0"]
+
+
+def test_task_is_parked_after_the_last_attempt(db, clock, monkeypatch):
+    (task_id,) = _due_tasks(db, 1, clock, attempts=FIREBASE_TASK_MAX_ATTEMPTS - 1)
+    runner = RecordingRunner()
+
+    def failing(kind, uid, payload):
+        raise RuntimeError("user not found")
+
+    monkeypatch.setattr(firebase_tasks, "_call", failing)
+    runner.claim_due()
+    runner.run_task(task_id)
+
+    db.expire_all()
+    task = db.get(FirebaseTask, task_id)
+    assert task.attempts == FIREBASE_TASK_MAX_ATTEMPTS
+    assert task.next_attempt_at is None
+
+    clock["now"] += timedelta(seconds=10 * FIREBASE_TASK_MAX_BACKOFF_SECONDS)
+    assert runner.claim_due() == 0
+
+
+def test_two_pollers_never_claim_the_same_task(db, clock):
+    task_ids = _due_tasks(db, 50, clock)
+    # a few rows per claim, so the two pollers interleave
+    runners = [RecordingRunner(queue_size=5) for _ in range(2)]
+    start = threading.Barrier(len(runners))
+
+    def poll(runner):
+        start.wait()
+        while runner.claim_due():
+            pass
+
+    threads = [threading.Thread(target=poll, args=(r,)) for r in runners]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    first, second = (set(r.submitted) for r in runners)
+    assert not first & second
+    assert first | second == set(task_ids)
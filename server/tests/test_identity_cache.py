@@ -0,0 +1,66 @@
+# tests/test_identity_cache.py
+import pytest
+
+from app.models import Company, User
+from app.utils.identity_cache import (
+    CurrentUser,
+    fetch_identity,
+    get_cached_identity,
+    identity_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    identity_cache.clear()
+    yield
+    identity_cache.clear()
+
+
+def _recruiter(db, job):
+    return db.get(User, job.recruiter_id)
+
+
+def test_committed_role_change_evicts_the_identity(db, job):
+    assert fetch_identity(db, "rec1").role == "recruiter"
+    assert get_cached_identity("rec1") is not None
+
+    _recruiter(db, job).role = "hr"
+    db.commit()
+
+    assert get_cached_identity("rec1") is None
+    assert fetch_identity(db, "rec1").role == "hr"
+
+
+def test_committed_company_change_evicts_its_users(db, job):
+    fetch_identity(db, "rec1")
+    other = Company(name="Globex", name_key="globex")
+    db.add(other)
+    db.commit()
+    assert get_cached_identity("rec1") is not None  # unrelated company
+
+    db.get(Company, job.company_id).name = "Acme Corp"
+    db.commit()
+
+    assert get_cached_identity("rec1") is None
+    assert fetch_identity(db, "rec1").company_name == "Acme Corp"
+
+
+def test_rolled_back_change_keeps_the_identity(db, job):
+    cached = fetch_identity(db, "rec1")
+
+    _recruiter(db, job).role = "hr"
+    db.flush()
+    db.rollback()
+
+    assert get_cached_identity("rec1") is cached
+
+
+def test_snapshot_read_before_an_invalidation_is_not_stored():
+    generation = identity_cache.generation
+    snapshot = CurrentUser(1, "rec1", "Rec", "rec@acme.test", "recruiter", 1, "Acme")
+
+    identity_cache.invalidate(uids=["rec1"])  # a commit lands while it was being read
+    identity_cache.put(snapshot, generation)
+
+    assert get_cached_identity("rec1") is None
@@ -0,0 +1,106 @@
+# tests/test_job_import.py
+import io
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from app.models import Job
+from app.utils import job_import
+from app.utils.job_import import ImportFormatError, import_jobs, open_records
+
+DESCRIPTION = "Senior Python developer, Django and Postgres"
+
+
+def _import(db, job, body: bytes, fmt: str):
+    records = open_records(io.BytesIO(body), fmt)
+    return import_jobs(db, records, job.company_id, job.recruiter_id)
+
+
+def _titles(db, job):
+    return set(
+        db.scalars(select(Job.title).where(Job.recruiter_id == job.recruiter_id, Job.id != job.id))
+    )
+
+
+def test_csv_import(db, job):
+    body = (
+        "Title,Description,Location\n"
+        f"Backend,{DESCRIPTION},Remote\n"
+        f'"Data, ML","{DESCRIPTION}\nwith a second line",Berlin\n'
+    ).encode()
+
+    report = _import(db, job, body, "csv")
+
+    assert report == {"created": 2, "failed": 0, "errors": [], "errors_truncated": False}
+    assert _titles(db, job) == {"Backend", "Data, ML"}
+
+
+def test_bad_rows_are_reported_and_good_rows_imported(db, job):
+    lines = [
+        json.dumps({"title": "Backend", "description": DESCRIPTION}),
+        "{not json",
+        json.dumps({"title": "Short", "description": "too short"}),
+        "",
+        json.dumps(["title", "description"]),
+        json.dumps({"title": "Frontend", "description": DESCRIPTION}),
+    ]
+
+    report = _import(db, job, "\n".join(lines).encode(), "jsonl")
+
+    assert report["created"] == 2
+    assert report["failed"] == 3
+    assert [e["line"] for e in report["errors"]] == [2, 3, 5]
+    assert report["errors"][0]["errors"][0].startswith("Invalid JSON")
+    assert report["errors"][1]["errors"][0].startswith("description:")
+    assert _titles(db, job) == {"Backend", "Frontend"}
+
+
+def test_file_larger_than_a_batch_is_inserted_batch_by_batch(db, job, monkeypatch):
+    monkeypatch.setattr(job_import, "JOB_IMPORT_BATCH", 3)
+    insert_batch = job_import._insert_batch
+    batch_sizes = []
+
+    def recording(db_, batch, *args):
+        batch_sizes.append(len(batch))
+        return insert_batch(db_, batch, *args)
+
+    monkeypatch.setattr(job_import, "_insert_batch", recording)
+    body = "title,description\n" + "".join(f"Job {i},{DESCRIPTION}\n" for i in range(7))
+
+    report = _import(db, job, body.encode(), "csv")
+
+    assert report["created"] == 7
+    assert batch_sizes == [3, 3, 1]
+    assert db.scalar(select(func.count()).select_from(Job)) == 8
+
+
+def test_failed_batch_loses_only_its_own_rows(db, job, monkeypatch):
+    monkeypatch.setattr(job_import, "JOB_IMPORT_BATCH", 2)
+    index_jobs_terms = job_import.index_jobs_terms
+    calls = []
+
+    def failing_second_batch(db_, jobs):
+        calls.append(jobs)
+        if len(calls) == 2:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        return index_jobs_terms(db_, jobs)
+
+    monkeypatch.setattr(job_import, "index_jobs_terms", failing_second_batch)
+    body = "title,description\n" + "".join(f"Job {i},{DESCRIPTION}\n" for i in range(5))
+
+    report = _import(db, job, body.encode(), "csv")
+
+    assert report["created"] == 3
+    assert report["failed"] == 2
+    assert report["errors"] == [
+        {"line": 4, "errors": ["Could not save: OperationalError"]},
+        {"line": 5, "errors": ["Could not save: OperationalError"]},
+    ]
+    assert _titles(db, job) == {"Job 0", "Job 1", "Job 4"}
+
+
+def test_csv_without_required_columns_is_rejected_up_front():
+    with pytest.raises(ImportFormatError, match="description"):
+        open_records(io.BytesIO(b"title,location\nBackend,Remote\n"), "csv")
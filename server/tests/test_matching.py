@@ -0,0 +1,28 @@
+# tests/test_matching.py
+from sqlalchemy import delete
+
+from app.models import JobTermVector, ResumeTermVector
+from app.utils.matching import backfill_term_vectors, load_job_vector, load_resume_vectors
+from app.utils.resumes import add_resumes
+
+
+def test_read_path_vectorizes_missing_rows_without_writing(db, job):
+    resumes, _ = add_resumes(
+        db, job, job.recruiter_id, [("local://a.txt", "python"), ("local://b.txt", "java")]
+    )
+    db.commit()
+    job_id = job.id
+    stored = load_resume_vectors(db, job_id)
+    # as if written before term vectors existed
+    db.execute(delete(ResumeTermVector).where(ResumeTermVector.resume_id == resumes[0].id))
+    db.commit()
+
+    assert load_resume_vectors(db, job_id) == stored
+    assert load_job_vector(db, job).terms
+    assert not db.new and not db.dirty
+    assert db.query(ResumeTermVector).count() == 1
+    assert db.query(JobTermVector).count() == 0
+
+    assert backfill_term_vectors(db) == (1, 1)
+    assert db.query(ResumeTermVector).count() == 2
+    assert load_resume_vectors(db, job_id) == stored
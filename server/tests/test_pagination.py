@@ -0,0 +1,85 @@
+# tests/test_pagination.py
+from datetime import datetime
+
+from sqlalchemy import select, text
+
+from app.models import Job
+from app.utils.pagination import apply_keyset, split_page
+
+
+def _add_jobs(db, job, created):
+    """Jobs of `job`'s recruiter; created_at None -> server default, "null" -> NULL."""
+    ids = []
+    for value in created:
+        other = Job(
+            title="Other",
+            description="Other",
+            company_id=job.company_id,
+            recruiter_id=job.recruiter_id,
+        )
+        if isinstance(value, datetime):
+            other.created_at = value
+        db.add(other)
+        db.flush()
+        if value == "null":
+            db.execute(text("UPDATE jobs SET created_at = NULL WHERE id = :id"), {"id": other.id})
+        ids.append(other.id)
+    db.commit()
+    return ids
+
+
+def _page_through(db, recruiter_id, limit):
+    seen, cursor = [], None
+    while True:
+        stmt = select(Job.id, Job.created_at).where(Job.recruiter_id == recruiter_id)
+        rows = db.execute(apply_keyset(stmt, Job.created_at, Job.id, cursor, limit)).all()
+        page, cursor = split_page(rows, limit)
+        seen.extend(r.id for r in page)
+        if cursor is None:
+            return seen
+
+
+def test_pages_cover_every_row_once_across_storage_shapes_and_nulls(db, job):
+    # server-default and Python-written rows, whole-second ties and NULLs
+    ids = _add_jobs(
+        db,
+        job,
+        [
+            None,
+            datetime(2020, 1, 1, 12, 0, 0),
+            datetime(2020, 1, 1, 12, 0, 0, 500000),
+            datetime(2020, 1, 1, 12, 0, 0),
+            "null",
+            "null",
+            datetime(2019, 6, 1),
+        ],
+    )
+    all_ids = [job.id] + ids
+
+    for limit in (1, 2, 3):
+        seen = _page_through(db, job.recruiter_id, limit)
+        assert sorted(seen) == sorted(all_ids)
+        assert len(seen) == len(set(seen))
+
+    by_id = {r.id: r.created_at for r in db.execute(select(Job.id, Job.created_at))}
+    seen = _page_through(db, job.recruiter_id, 2)
+    dated = [i for i in seen if by_id[i] is not None]
+    assert [by_id[i] for i in dated] == sorted((by_id[i] for i in dated), reverse=True)
+    # SQLite: NULLs last
+    assert seen[-2:] == [ids[5], ids[4]]
+
+
+def test_keyset_page_uses_the_created_at_index(db, job):
+    _add_jobs(db, job, [datetime(2020, 1, 1)])
+    stmt = select(Job.id, Job.created_at).where(Job.recruiter_id == job.recruiter_id)
+    page, cursor = split_page(
+        db.execute(apply_keyset(stmt, Job.created_at, Job.id, None, 1)).all(), 1
+    )
+    compiled = apply_keyset(stmt, Job.created_at, Job.id, cursor, 1).compile(
+        db.get_bind(), compile_kwargs={"literal_binds": True}
+    )
+    plan = " ".join(
+        str(r[-1]) for r in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    )
+    assert "ix_jobs_recruiter_created_id" in plan
+    assert "julianday" not in str(compiled)
@@ -0,0 +1,75 @@
+# tests/test_pipeline_routes.py
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models import Job
+from app.routers.pipeline import pipeline_router
+from app.utils import response_cache
+from app.utils.identity_cache import CurrentUser
+from app.utils.pipeline import parse_stage, parse_stages
+from app.utils.response_cache import MemoryBackend
+
+
+def _user():
+    return CurrentUser(1, "rec1", "Rec", "rec@acme.test", "recruiter", 1, "Acme")
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(
+        pipeline_router(
+            "/recruiter",
+            ["recruiter-shortlisted"],
+            require_user=_user,
+            can_access=lambda job, user: job.recruiter_id == user.id,
+            cache_scope=lambda user: f"recruiter:{user.id}",
+        )
+    )
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("stage", ["pending,shortlisted", ",", "%20", "nope"])
+def test_board_column_rejects_anything_but_one_stage(client, stage):
+    response = client.get(f"/recruiter/jobs/1/board/{stage}")
+    assert response.status_code == 400
+    assert "Allowed: pending" in response.json()["detail"]
+
+
+def test_stage_parsing():
+    assert parse_stage(" Shortlisted ") == "shortlisted"
+    assert parse_stages(",") == parse_stages(None)
+    assert parse_stages("hired, pending,hired") == ["hired", "pending"]
+
+
+def test_boards_of_two_jobs_are_cached_apart(db, job, monkeypatch):
+    monkeypatch.setattr(response_cache, "_backend", MemoryBackend(10))
+    other = Job(
+        title="Frontend",
+        description="React developer",
+        company_id=job.company_id,
+        recruiter_id=job.recruiter_id,
+    )
+    db.add(other)
+    db.commit()
+    app = FastAPI()
+    app.include_router(
+        pipeline_router(
+            "/recruiter",
+            ["recruiter-shortlisted"],
+            require_user=lambda: CurrentUser(
+                job.recruiter_id, "rec1", "Rec", "rec@acme.test", "recruiter",
+                job.company_id, "Acme",
+            ),
+            can_access=lambda j, user: j.recruiter_id == user.id,
+            cache_scope=lambda user: f"recruiter:{user.id}",
+        )
+    )
+    client = TestClient(app)
+
+    first = client.get(f"/recruiter/jobs/{job.id}/board")
+    second = client.get(f"/recruiter/jobs/{other.id}/board")
+    assert first.json()["job_id"] == job.id
+    assert second.json()["job_id"] == other.id
+    assert first.headers["etag"] != second.headers["etag"]
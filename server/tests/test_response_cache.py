@@ -0,0 +1,65 @@
+# tests/test_response_cache.py
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.config import db as db_config
+from app.config.db import ReadReplicaMiddleware
+from app.utils import response_cache
+from app.utils.response_cache import MemoryBackend, cached_json
+
+
+def _client(monkeypatch, backend):
+    monkeypatch.setattr(response_cache, "_backend", backend)
+    app = FastAPI()
+
+    @app.get("/thing")
+    async def thing(request: Request):
+        async def build():
+            return {"n": 1}
+
+        return await cached_json(request, 1, ["recruiter:1"], build, dict)
+
+    return TestClient(app)
+
+
+def test_etag_from_before_a_restart_does_not_match(monkeypatch):
+    etag = _client(monkeypatch, MemoryBackend(10)).get("/thing").headers["etag"]
+
+    # same versions (all 0), new process
+    response = _client(monkeypatch, MemoryBackend(10)).get(
+        "/thing", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_etag_expires_with_the_ttl_window(monkeypatch):
+    client = _client(monkeypatch, MemoryBackend(10))
+    now = 1_000_000.0
+    monkeypatch.setattr(response_cache.time, "time", lambda: now)
+    etag = client.get("/thing").headers["etag"]
+    assert client.get("/thing", headers={"If-None-Match": etag}).status_code == 304
+
+    now += response_cache.RESPONSE_CACHE_TTL_SECONDS
+    assert client.get("/thing", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_cache_miss_builds_read_from_the_primary(monkeypatch):
+    monkeypatch.setattr(response_cache, "_backend", MemoryBackend(10))
+    app = FastAPI()
+    app.add_middleware(ReadReplicaMiddleware)
+    replica_eligible = []
+
+    @app.get("/thing")
+    async def thing(request: Request):
+        replica_eligible.append(db_config._read_only_request.get())
+
+        async def build():
+            # a lagging replica could miss a write the versions already count
+            replica_eligible.append(db_config._read_only_request.get())
+            return {"n": 1}
+
+        return await cached_json(request, 1, ["recruiter:1"], build, dict)
+
+    TestClient(app).get("/thing")
+    assert replica_eligible == [True, False]
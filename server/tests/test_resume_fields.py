@@ -0,0 +1,61 @@
+# tests/test_resume_fields.py
+import pytest
+from sqlalchemy import event
+
+from app.config.db import SessionLocal, engine
+from app.core.fields import SKILLS
+from app.models import Skill
+from app.utils import resume_fields
+from app.utils.resume_fields import facet_counts, profile_filters, seed_skills, skill_ids
+from app.utils.resumes import add_resumes
+
+
+@pytest.fixture(autouse=True)
+def fresh_skill_cache():
+    resume_fields._skill_ids.clear()
+    yield
+    resume_fields._skill_ids.clear()
+
+
+@pytest.fixture
+def writes(db):
+    """INSERT/UPDATE/DELETE statements sent to the engine during the test."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_filters_and_facets_do_not_write(db, job, writes):
+    with SessionLocal() as reader:
+        clauses = profile_filters(reader, job.company_id, skills=["python"])
+        facets = facet_counts(reader, clauses)
+
+        assert writes == []
+        assert facets["total"] == 0
+        assert "pinned_to_primary" not in reader.info
+    assert db.query(Skill).count() == 0
+
+
+def test_seeded_skills_are_cached_after_commit(db, job):
+    seed_skills(db)
+    assert resume_fields._skill_ids == {}
+    db.commit()
+
+    assert len(skill_ids(db)) == len(SKILLS)
+    assert resume_fields._skill_ids["python"] == db.query(Skill.id).filter_by(slug="python").scalar()
+
+
+def test_ingest_seeds_skills_when_the_table_is_empty(db, job):
+    add_resumes(db, job, job.recruiter_id, [("local://a.txt", "Python and Django developer")])
+    db.commit()
+
+    ids = skill_ids(db)
+    clauses = profile_filters(db, job.company_id, skills=["python"])
+    assert facet_counts(db, clauses)["total"] == 1
+    assert len(ids) == len(SKILLS)
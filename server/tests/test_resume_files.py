@@ -0,0 +1,52 @@
+# tests/test_resume_files.py
+import os
+import time
+
+from app.core.storage import LocalStorage, content_key
+from app.models import Resume
+from app.utils.resume_files import collect_garbage
+
+
+def _put(storage, tmp_path, name, data=b"resume"):
+    src = tmp_path / name
+    src.write_bytes(data)
+    key = content_key(name * 32, ".txt")
+    storage.put_file(str(src), key)
+    return key
+
+
+def _age(storage, key, seconds):
+    path = storage.local_path(key)
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_gc_removes_only_old_unreferenced_files(db, job, tmp_path):
+    storage = LocalStorage(str(tmp_path / "storage"))
+    referenced, orphan, fresh = (_put(storage, tmp_path, n) for n in ("aa", "bb", "cc"))
+    for key in (referenced, orphan):
+        _age(storage, key, 7200)
+    db.add(
+        Resume(
+            resume_url=storage.url_for(referenced),
+            job_id=job.id,
+            recruiter_id=job.recruiter_id,
+            company_id=job.company_id,
+        )
+    )
+    db.commit()
+
+    assert collect_garbage(db, storage, 3600) == 1
+    assert storage.last_modified(orphan) is None
+    assert storage.last_modified(referenced) is not None
+    assert storage.last_modified(fresh) is not None
+
+
+def test_reupload_restarts_the_grace_period(db, tmp_path):
+    storage = LocalStorage(str(tmp_path / "storage"))
+    key = _put(storage, tmp_path, "dd")
+    _age(storage, key, 7200)
+
+    _put(storage, tmp_path, "dd")  # same content uploaded again, row not committed yet
+    assert collect_garbage(db, storage, 3600) == 0
+    assert storage.last_modified(key) is not None
@@ -0,0 +1,84 @@
+# tests/test_search.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.db import AsyncSessionLocal
+from app.core.search import parse_query
+from app.utils import search
+from app.utils.resumes import add_resumes
+from app.utils.search import load_company_index, search_resumes
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    yield
+    search._company_indexes.clear()
+
+
+def _ids(index, q):
+    return {doc_id for doc_id, _ in index.search(parse_query(q))}
+
+
+def test_index_is_published_complete_with_commits_made_during_the_load(db, job, monkeypatch):
+    resumes, _ = add_resumes(
+        db,
+        job,
+        job.recruiter_id,
+        [("local://a.txt", "python django postgres"), ("local://b.txt", "python react")],
+    )
+    db.commit()
+    first, second = sorted(r.id for r in resumes)
+    company_id = job.company_id
+    seen_during_load = []
+
+    decompress_text = search.decompress_text
+
+    def loading(data, codec):
+        if not seen_during_load:
+            seen_during_load.append(search._company_indexes.get(company_id))
+            # another request commits while the rows are being read
+            session = SimpleNamespace(info={"search_pending": [
+                ("add", company_id, 999, "python kotlin"),
+                ("remove", company_id, second, None),
+            ]})
+            search._apply_pending_search_updates(session)
+        return decompress_text(data, codec)
+
+    monkeypatch.setattr(search, "decompress_text", loading)
+    index = search._load_company_index(company_id)
+
+    assert seen_during_load == [None]  # nothing half-loaded was visible
+    assert search._company_indexes[company_id] is index
+    assert _ids(index, "python") == {first, 999}
+    assert company_id not in search._loading_updates
+
+
+def test_concurrent_first_searches_of_a_company_all_finish(db, job, monkeypatch):
+    add_resumes(db, job, job.recruiter_id, [("local://a.txt", "python django")])
+    db.commit()
+    company_id = job.company_id
+
+    decompress_text = search.decompress_text
+
+    def slow(data, codec):
+        time.sleep(0.1)  # keep the first load in progress while the others arrive
+        return decompress_text(data, codec)
+
+    monkeypatch.setattr(search, "decompress_text", slow)
+
+    async def one_search():
+        # as GET /recruiter/resumes/search does it
+        async with AsyncSessionLocal() as session:
+            index = await load_company_index(company_id)
+            return await session.run_sync(
+                search_resumes, company_id, "python", None, None, 20, 0, index
+            )
+
+    async def main():
+        return await asyncio.wait_for(asyncio.gather(*(one_search() for _ in range(3))), 10)
+
+    results = asyncio.run(main())
+    assert [len(rows) for rows in results] == [1, 1, 1]
@@ -0,0 +1,88 @@
+# tests/test_session_cache.py
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.routers import users as users_router
+from app.utils import auth
+from app.utils.session_cache import SessionClaimsCache, session_cache
+
+CLAIMS = {"uid": "rec1", "exp": time.time() + 3600}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    session_cache.clear()
+    yield
+    session_cache.clear()
+
+
+@pytest.fixture
+def firebase(monkeypatch):
+    """Fake Firebase: every cookie is valid for rec1 until its tokens are revoked."""
+    state = SimpleNamespace(calls=[], revoked=False)
+
+    def verify_session_cookie(cookie, check_revoked=False):
+        state.calls.append(cookie)
+        if check_revoked and state.revoked:
+            raise ValueError("session cookie revoked")
+        return dict(CLAIMS)
+
+    monkeypatch.setattr(
+        auth, "firebase_auth", SimpleNamespace(verify_session_cookie=verify_session_cookie)
+    )
+    return state
+
+
+def test_revocation_epoch_drops_every_cookie_of_the_uid():
+    cache = SessionClaimsCache(max_entries=10, recheck_seconds=300)
+    cache.put("laptop", CLAIMS)
+    cache.put("phone", CLAIMS)
+    cache.put("other-user", {**CLAIMS, "uid": "rec2"})
+
+    cache.bump_revocation_epoch("rec1")
+
+    assert cache.get("laptop") is None
+    assert cache.get("phone") is None
+    assert cache.get("other-user") is not None
+
+
+def test_revocation_is_rechecked_remotely_after_the_interval(monkeypatch):
+    cache = SessionClaimsCache(max_entries=10, recheck_seconds=300)
+    now = time.time()
+    monkeypatch.setattr("app.utils.session_cache.time.time", lambda: now)
+    cache.put("laptop", CLAIMS)
+    assert cache.get("laptop") is not None
+
+    now += 300
+    assert cache.get("laptop") is None  # strict use: ask Firebase again
+    assert cache.get("laptop", check_revoked=False) is not None
+
+
+def test_logout_invalidates_cached_cookies_in_this_process(db, firebase):
+    app = FastAPI()
+    app.include_router(users_router.router)
+
+    @app.get("/me")
+    def me(request: Request):
+        return auth.verify_session_cookie(request)
+
+    client = TestClient(app)
+
+    def get_me(cookie):
+        return client.get("/me", headers={"Cookie": f"session={cookie}"})
+
+    assert get_me("laptop").status_code == 200
+    assert get_me("phone").status_code == 200
+    assert get_me("phone").status_code == 200
+    assert firebase.calls == ["laptop", "phone"]  # the repeat was served from the cache
+
+    client.post("/session-logout", headers={"Cookie": "session=laptop"})
+    firebase.revoked = True  # the queued revocation reached Firebase
+
+    assert get_me("laptop").status_code == 401
+    assert get_me("phone").status_code == 401
+    assert firebase.calls[-2:] == ["laptop", "phone"]
@@ -0,0 +1,133 @@
+# tests/test_vectors.py
+import shutil
+import threading
+
+import numpy as np
+import pytest
+from sqlalchemy import insert
+
+from app.core.embeddings import embed, pack_embedding
+from app.core.vector_index import IVFIndex
+from app.models import Job, JobEmbedding
+from app.utils import vectors
+from app.utils.vectors import index_job_embedding
+
+DIM = 32
+
+
+def _clustered_vectors(n, clusters=40, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, DIM))
+    points = centers[rng.integers(clusters, size=n)] + 0.3 * rng.standard_normal((n, DIM))
+    return (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _exact_top(data, query, k):
+    return set(np.argsort(-(data @ query))[:k].tolist())
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    yield
+    vectors._company_indexes.clear()
+    vectors._catch_up_marks.clear()
+    if vectors.VECTOR_INDEX_DIR:
+        shutil.rmtree(vectors.VECTOR_INDEX_DIR, ignore_errors=True)
+
+
+def test_ivf_search_recall_against_brute_force():
+    data = _clustered_vectors(5000)
+    index = IVFIndex.build(DIM, np.arange(len(data)), data)
+    queries = _clustered_vectors(20, seed=1)
+
+    hits = sum(
+        len({i for i, _ in index.search(q, 10)} & _exact_top(data, q, 10)) for q in queries
+    )
+    assert hits / (10 * len(queries)) >= 0.9
+
+
+def test_compaction_keeps_search_results():
+    data = _clustered_vectors(3000)
+    index = IVFIndex.build(DIM, np.arange(2000), data[:2000])
+    for i in range(2000, 3000):
+        index.add(i, data[i])
+    index.add(5, data[2999])  # replaces a base vector
+
+    compacted = index.compact()
+    assert compacted.delta_size == 0
+    assert len(compacted) == len(index) == 3000
+    for q in _clustered_vectors(5, seed=2):
+        # probe every cluster: both searches are exact
+        before = index.search(q, 10, nprobe=10_000)
+        after = compacted.search(q, 10, nprobe=10_000)
+        assert [i for i, _ in after] == [i for i, _ in before]
+        assert [s for _, s in after] == pytest.approx([s for _, s in before])
+
+
+def _add_job(db, job, description):
+    other = Job(
+        title="Other",
+        description=description,
+        company_id=job.company_id,
+        recruiter_id=job.recruiter_id,
+    )
+    db.add(other)
+    db.flush()
+    return other
+
+
+def test_catch_up_finds_a_lower_id_job_committed_later(db, job):
+    index_job_embedding(db, job)
+    late = _add_job(db, job, "Data engineer, Spark and Airflow")
+    newer = _add_job(db, job, "Frontend developer, React")
+    index_job_embedding(db, newer)
+    db.commit()
+
+    index = vectors._load_company_index(job.company_id)
+    vectors._current_index(db, job.company_id, index)
+    assert late.id < newer.id and late.id not in index
+
+    # written by another process: no after_commit hook on this side
+    db.execute(
+        insert(JobEmbedding),
+        [{"job_id": late.id, "company_id": job.company_id,
+          "vector": pack_embedding(embed(late.description))}],
+    )
+    db.commit()
+
+    index = vectors._current_index(db, job.company_id, index)
+    assert late.id in index
+    assert index.search(embed(late.description), 1)[0][0] == late.id
+
+
+def test_additions_during_compaction_are_replayed(db, job, monkeypatch):
+    index_job_embedding(db, job)
+    db.commit()
+    company_id = job.company_id
+    index = vectors._load_company_index(company_id)
+    added = embed("Site reliability engineer, Kubernetes")
+    lock_was_free = []
+
+    compact = index.compact
+
+    def racing_compact():
+        compacted = compact()
+        # a job commit on another thread while compact() runs
+        def commit():
+            lock_was_free.append(vectors._company_indexes_lock.acquire(timeout=1))
+            vectors._add_to_index(company_id, 999, added)
+            vectors._company_indexes_lock.release()
+        thread = threading.Thread(target=commit)
+        thread.start()
+        thread.join()
+        return compacted
+
+    monkeypatch.setattr(index, "compact", racing_compact)
+    vectors._compacting.add(company_id)
+    vectors._compact(company_id)
+
+    assert lock_was_free == [True]
+    current = vectors._company_indexes[company_id]
+    assert current is not index
+    assert 999 in current and job.id in current
+    assert company_id not in vectors._compaction_logs